@@ -0,0 +1,2 @@
+"""Benchmarks for the graph algorithm modules, run from the repository
+root, e.g. ``python -m benchmarks.bench_recursion``."""
@@ -0,0 +1,60 @@
+"""bench_bidirectional.py
+
+Compares shortest_path.breadth_first_count against
+shortest_path.bidirectional_breadth_first_count on a random graph with
+a high branching factor, counting node expansions and latency."""
+import random
+import sys
+from time import perf_counter
+from typing import Dict, List, Tuple
+
+from graph_algos.shortest_path import (bidirectional_breadth_first_count,
+                                       breadth_first_count)
+
+
+class CountingGraph(Dict[str, List[str]]):
+    """Adjacency list counting how many nodes get expanded."""
+
+    expansions: int = 0
+
+    def __getitem__(self, node: str) -> List[str]:
+        self.expansions += 1
+        return super().__getitem__(node)
+
+
+def _random_graph(nodes: int, degree: int, seed: int) -> CountingGraph:
+    """Builds an undirected random graph with about degree neighbors
+    per node."""
+    rng: random.Random = random.Random(seed)
+    graph: CountingGraph = CountingGraph(
+        (str(node), list()) for node in range(nodes))
+    for _ in range(nodes * degree // 2):
+        node_a: str = str(rng.randrange(nodes))
+        node_b: str = str(rng.randrange(nodes))
+        dict.__getitem__(graph, node_a).append(node_b)
+        dict.__getitem__(graph, node_b).append(node_a)
+    return graph
+
+
+def main(nodes: int = 200000, degree: int = 20, queries: int = 50) -> None:
+    """Runs queries random point queries with both searches."""
+    graph: CountingGraph = _random_graph(nodes, degree, 0)
+    rng: random.Random = random.Random(1)
+    pairs: List[Tuple[str, str]] = [(str(rng.randrange(nodes)),
+                                     str(rng.randrange(nodes)))
+                                    for _ in range(queries)]
+    for name in ("breadth_first_count", "bidirectional_breadth_first_count"):
+        graph.expansions = 0
+        start: float = perf_counter()
+        for src, dst in pairs:
+            if name == "breadth_first_count":
+                breadth_first_count(graph, src, dst, {src})
+            else:
+                bidirectional_breadth_first_count(graph, src, dst)
+        elapsed: float = perf_counter() - start
+        print("{:<36} expansions/query={:<10.0f} latency={:.2f}ms".format(
+            name, graph.expansions / queries, 1000 * elapsed / queries))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:4]))
@@ -0,0 +1,77 @@
+"""bench_components.py
+
+Compares the previous breadth_first_components_count, which copied and
+compared the whole visited set after every node, against the linear
+breadth_first_component_labels pass. The quadratic version is timed on
+small graphs only and its 1M node time is extrapolated."""
+import random
+import sys
+from time import perf_counter
+from typing import Dict, List, Set
+
+from graph_algos.connected_components_count import (
+    breadth_first_component_labels, breadth_first_has_path,
+    csr_component_labels)
+from graph_algos.csr_graph import CSRGraph
+
+
+def _quadratic_components_count(graph: Dict[str, List[str]]) -> int:
+    """The previous breadth_first_components_count, kept as a
+    baseline."""
+    count: int = 0
+    visited: Set[str] = set()
+    previous_visited: Set[str] = visited.copy()
+    for node in graph:
+        breadth_first_has_path(graph, node, visited)
+        if previous_visited != visited:
+            count += 1
+        previous_visited = visited.copy()
+    return count
+
+
+def _random_graph(nodes: int, degree: int,
+                  rng: random.Random) -> Dict[str, List[str]]:
+    """Builds an undirected graph of nodes nodes and about
+    nodes * degree / 2 random edges."""
+    graph: Dict[str, List[str]] = {str(i): list() for i in range(nodes)}
+    for _ in range(nodes * degree // 2):
+        a: str = str(rng.randrange(nodes))
+        b: str = str(rng.randrange(nodes))
+        graph[a].append(b)
+        graph[b].append(a)
+    return graph
+
+
+def main(nodes: int = 1000000, degree: int = 1) -> None:
+    """Times both versions on growing graphs, the sparse default
+    leaves many small components."""
+    rng: random.Random = random.Random(0)
+    quadratic_per_node_squared: float = 0.0
+    for size in (1000, 2000, 4000, 8000):
+        graph: Dict[str, List[str]] = _random_graph(size, degree, rng)
+        start: float = perf_counter()
+        expected: int = _quadratic_components_count(graph)
+        quadratic: float = perf_counter() - start
+        start = perf_counter()
+        assert breadth_first_component_labels(graph).total == expected
+        linear: float = perf_counter() - start
+        quadratic_per_node_squared = quadratic / size**2
+        print("n={:<8} quadratic={:.4f}s  labels={:.4f}s".format(
+            size, quadratic, linear))
+
+    graph = _random_graph(nodes, degree, rng)
+    start = perf_counter()
+    count: int = breadth_first_component_labels(graph).total
+    linear = perf_counter() - start
+    csr_graph: CSRGraph = CSRGraph.from_adjacency(graph)
+    start = perf_counter()
+    assert csr_component_labels(csr_graph).total == count
+    csr: float = perf_counter() - start
+    print("n={:<8} quadratic={:.0f}s (estimated)  labels={:.2f}s  "
+          "csr labels={:.2f}s  components={}".format(
+              nodes, quadratic_per_node_squared * nodes**2, linear, csr,
+              count))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
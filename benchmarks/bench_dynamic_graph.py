@@ -0,0 +1,78 @@
+"""bench_dynamic_graph.py
+
+Replays a stream of edge inserts with occasional deletes on a sparse
+random graph, reading the component count and largest component size
+after every update. dynamic_graph.DynamicGraph keeps both up to date,
+the baseline builds a CSR graph and recounts it with
+csr_component_labels after every update and is timed on the first
+updates only."""
+import random
+import sys
+from time import perf_counter
+from typing import Dict, List, Set, Tuple
+
+from graph_algos.connected_components_count import (CSRComponentLabels,
+                                                    csr_component_labels)
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.dynamic_graph import DynamicGraph
+
+from benchmarks.generators import random_edges
+
+
+def main(nodes: int = 100000,
+         updates: int = 20000,
+         recounts: int = 20) -> None:
+    """Builds the graph, then times every update followed by both
+    reads, one update in ten being the delete of a random edge."""
+    rng: random.Random = random.Random(0)
+    edges: List[List[str]] = random_edges(nodes, degree=2)
+    dynamic: DynamicGraph = DynamicGraph.from_edges(edges)
+    stream: List[Tuple[bool, str, str]] = list()
+    for _ in range(updates):
+        if rng.random() < 0.1:
+            node_a, node_b = edges[rng.randrange(len(edges))][:2]
+            stream.append((False, node_a, node_b))
+        else:
+            stream.append((True, str(rng.randrange(nodes)),
+                           str(rng.randrange(nodes))))
+
+    # Full recount after each update, edits applied to a plain copy
+    adjacency: Dict[str, Set[str]] = {
+        node: set(neighbors)
+        for node, neighbors in dynamic.adjacency.items()
+    }
+    start: float = perf_counter()
+    expected: List[Tuple[int, int]] = list()
+    for insert, node_a, node_b in stream[:recounts]:
+        if insert:
+            adjacency.setdefault(node_a, set()).add(node_b)
+            adjacency.setdefault(node_b, set()).add(node_a)
+        else:
+            adjacency[node_a].discard(node_b)
+            adjacency[node_b].discard(node_a)
+        labels: CSRComponentLabels = csr_component_labels(
+            CSRGraph.from_adjacency({
+                node: list(neighbors)
+                for node, neighbors in adjacency.items()
+            }))
+        expected.append((labels.total, max(labels.sizes)))
+    recount: float = (perf_counter() - start) / recounts
+
+    start = perf_counter()
+    found: List[Tuple[int, int]] = list()
+    for insert, node_a, node_b in stream:
+        if insert:
+            dynamic.add_edge(node_a, node_b)
+        elif node_b in dynamic.adjacency[node_a]:
+            dynamic.remove_edge(node_a, node_b)
+        found.append(
+            (dynamic.component_count(), dynamic.largest_component_size()))
+    incremental: float = (perf_counter() - start) / updates
+    print("full recount  {:10.3f}ms per update".format(recount * 1000))
+    print("DynamicGraph  {:10.3f}ms per update, {:.0f}x".format(
+        incremental * 1000, recount / incremental))
+    assert found[:recounts] == expected
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:4]))
@@ -0,0 +1,63 @@
+"""bench_edge_reader.py
+
+Compares loading an edge file into a list of string pairs and running
+_build_graph on it against the blocked readers of edge_reader, serial
+and with worker processes. Peak memory is measured with tracemalloc,
+which only sees this process, so worker runs report time only."""
+import os
+import sys
+import tempfile
+import tracemalloc
+from time import perf_counter
+from typing import Any, Callable, List
+
+from graph_algos.edge_reader import iter_edges, read_adjacency, read_graph
+from graph_algos.shortest_path import _build_graph
+
+from benchmarks.generators import random_edges
+
+
+def _read_lines(path: str) -> List[List[str]]:
+    """Reads the whole file into the List[List[str]] edge format."""
+    with open(path) as handle:
+        return [line.split() for line in handle]
+
+
+def _measure(name: str, load: Callable[[], Any], memory: bool) -> None:
+    """Prints the time and optionally the tracemalloc peak of load."""
+    start: float = perf_counter()
+    load()
+    elapsed: float = perf_counter() - start
+    peak: str = ""
+    if memory:
+        tracemalloc.start()
+        try:
+            load()
+            peak = "peak={:.0f}MB".format(
+                tracemalloc.get_traced_memory()[1] / 2**20)
+        finally:
+            tracemalloc.stop()
+    print("{:<34} {:.2f}s {}".format(name, elapsed, peak))
+
+
+def main(nodes: int = 1000000, degree: int = 8, workers: int = 4) -> None:
+    """Writes a random edge file and loads it every way."""
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "edges.txt")
+        with open(path, "w") as handle:
+            for node_a, node_b in random_edges(nodes, degree):
+                handle.write(node_a + " " + node_b + "\n")
+        print("edge file {:.1f}MB".format(os.path.getsize(path) / 2**20))
+
+        _measure("_build_graph(list of lines)",
+                 lambda: _build_graph(_read_lines(path)), True)
+        _measure("_build_graph(iter_edges)",
+                 lambda: _build_graph(iter_edges(path)), True)
+        _measure("read_adjacency", lambda: read_adjacency(path), True)
+        _measure("read_graph", lambda: read_graph(path), True)
+        _measure("read_graph workers={}".format(workers),
+                 lambda: read_graph(path, workers=workers), False)
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:4]))
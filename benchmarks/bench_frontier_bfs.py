@@ -0,0 +1,48 @@
+"""bench_frontier_bfs.py
+
+Compares the deque based largest_component.breadth_first_count and
+the CSR deque search over every component against
+frontier_bfs.frontier_breadth_first on a large random graph."""
+import random
+import sys
+from time import perf_counter
+from typing import Dict, List
+
+from graph_algos.connected_components_count import (
+    csr_breadth_first_components_count)
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.frontier_bfs import frontier_breadth_first
+from graph_algos.largest_component import breadth_first_count
+
+
+def main(nodes: int = 1000000, degree: int = 8) -> None:
+    """Runs a full search from node "0" with every implementation."""
+    rng: random.Random = random.Random(0)
+    edges: List[List[str]] = [[
+        str(rng.randrange(nodes)), str(rng.randrange(nodes))
+    ] for _ in range(nodes * degree // 2)]
+    graph: CSRGraph = CSRGraph.from_edges(edges)
+    adjacency: Dict[str, List[str]] = graph.to_adjacency()
+    source: str = graph.labels[0]
+
+    timings: Dict[str, float] = dict()
+    start: float = perf_counter()
+    breadth_first_count(adjacency, source, set())
+    timings["largest_component.breadth_first_count"] = perf_counter() - start
+    start = perf_counter()
+    csr_breadth_first_components_count(graph)
+    timings["csr_breadth_first_components_count"] = perf_counter() - start
+    for direction_optimizing in (False, True):
+        start = perf_counter()
+        frontier_breadth_first(graph, source, direction_optimizing)
+        timings["frontier_breadth_first direction_optimizing={}".format(
+            direction_optimizing)] = perf_counter() - start
+
+    baseline: float = timings["largest_component.breadth_first_count"]
+    for name, elapsed in timings.items():
+        print("{:<56} {:.3f}s {:.1f}x".format(name, elapsed,
+                                              baseline / elapsed))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,59 @@
+"""bench_graph_file.py
+
+Compares rebuilding a graph from its edge list, which every process
+used to do on start, against memory-mapping it from a graph_file
+written once. Loading is timed in a fresh interpreter so the mapped
+pages come from the page cache like they would for a new worker."""
+import os
+import subprocess
+import sys
+import tempfile
+from time import perf_counter
+from typing import List
+
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.graph_file import write_graph
+from graph_algos.shortest_path import _build_graph
+
+from benchmarks.generators import random_edges
+
+# Runs in a fresh interpreter, argv[1] is the graph file path
+_PROBE: str = """
+import sys
+from time import perf_counter
+start = perf_counter()
+from graph_algos.graph_file import load_graph
+graph = load_graph(sys.argv[1])
+loaded = perf_counter()
+graph.index[graph.labels[graph.node_count() - 1]]
+print(loaded - start, perf_counter() - loaded)
+"""
+
+
+def main(nodes: int = 1000000, degree: int = 8) -> None:
+    """Builds a random graph both ways and prints the timings."""
+    edges: List[List[str]] = random_edges(nodes, degree)
+    start: float = perf_counter()
+    _build_graph(edges)
+    print("_build_graph            {:.2f}s".format(perf_counter() - start))
+    start = perf_counter()
+    graph: CSRGraph = CSRGraph.from_edges(edges)
+    print("CSRGraph.from_edges     {:.2f}s".format(perf_counter() - start))
+
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "graph.csr")
+        start = perf_counter()
+        write_graph(path, graph)
+        print("write_graph             {:.2f}s {:.1f}MB".format(
+            perf_counter() - start,
+            os.path.getsize(path) / 2**20))
+        load, lookup = subprocess.run(
+            [sys.executable, "-c", _PROBE, path],
+            check=True,
+            stdout=subprocess.PIPE).stdout.split()
+        print("load_graph              {:.2f}ms, first label lookup "
+              "{:.3f}ms".format(float(load) * 1000, float(lookup) * 1000))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,65 @@
+"""bench_import.py
+
+Measures the cost of importing each module in a fresh interpreter,
+against running its tests as well, which is what every import used
+to do before the tests moved under __main__ guards. Also lists how
+many package modules an import loads and whether it pulls in NumPy."""
+import json
+import subprocess
+import sys
+from typing import Dict, List
+
+import graph_algos
+
+# Runs in a fresh interpreter, argv[1] is the module and argv[2] is
+# "run" to execute its tests the way an import used to
+_PROBE: str = """
+import io, json, runpy, sys
+from contextlib import redirect_stdout
+from time import perf_counter
+start = perf_counter()
+if sys.argv[2] == "run":
+    with redirect_stdout(io.StringIO()):
+        runpy.run_module(sys.argv[1], run_name="__main__", alter_sys=True)
+else:
+    __import__(sys.argv[1])
+elapsed = perf_counter() - start
+print(json.dumps({
+    "seconds": elapsed,
+    "modules": sum(name.startswith("graph_algos.") for name in sys.modules),
+    "numpy": "numpy" in sys.modules,
+}))
+"""
+
+
+def _probe(module: str, mode: str, repeat: int) -> Dict[str, float]:
+    """Returns the fastest of repeat fresh interpreter runs."""
+    runs: List[Dict[str, float]] = [
+        json.loads(
+            subprocess.run([sys.executable, "-c", _PROBE, module, mode],
+                           check=True,
+                           stdout=subprocess.PIPE).stdout)
+        for _ in range(repeat)
+    ]
+    return min(runs, key=lambda run: run["seconds"])
+
+
+def main(repeat: int = 5) -> None:
+    """Prints the import time of the package and of every module."""
+    package: Dict[str, float] = _probe("graph_algos", "import", repeat)
+    print("{:<54} import={:.2f}ms modules={}".format(
+        "graph_algos", package["seconds"] * 1000, int(package["modules"])))
+    for module in graph_algos._MODULES:
+        name: str = "graph_algos." + module
+        imported: Dict[str, float] = _probe(name, "import", repeat)
+        tested: Dict[str, float] = _probe(name, "run", repeat)
+        print("{:<54} import={:.2f}ms modules={} numpy={:<5} "
+              "import+tests={:.2f}ms".format(name,
+                                             imported["seconds"] * 1000,
+                                             int(imported["modules"]),
+                                             str(bool(imported["numpy"])),
+                                             tested["seconds"] * 1000))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:2]))
@@ -0,0 +1,37 @@
+"""bench_island_parallel.py
+
+Times island_labeling.island_summary against
+island_parallel.parallel_island_summary on a random grid for a
+growing number of worker processes."""
+import os
+import random
+import sys
+from time import perf_counter
+
+from graph_algos.island_labeling import LandGrid, island_summary
+from graph_algos.island_parallel import parallel_island_summary
+
+
+def main(size: int = 2000, land: float = 0.55) -> None:
+    """Runs the benchmark on a size x size grid where each cell is
+    land with probability land."""
+    rng: random.Random = random.Random(0)
+    grid: LandGrid = LandGrid(
+        size, size, bytes(rng.random() < land for _ in range(size * size)))
+    start: float = perf_counter()
+    expected = island_summary(grid)
+    serial: float = perf_counter() - start
+    print("serial      {:.3f}s islands={}".format(serial, expected.islands))
+    workers: int = 1
+    while workers <= (os.cpu_count() or 1):
+        start = perf_counter()
+        result = parallel_island_summary(grid, workers)
+        elapsed: float = perf_counter() - start
+        assert result == expected
+        print("workers={:<3} {:.3f}s speedup={:.2f}x".format(
+            workers, elapsed, serial / elapsed))
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:2]))
@@ -0,0 +1,50 @@
+"""bench_multi_source.py
+
+Compares answering many (source, target) distance queries one at a
+time with shortest_path.breadth_first_shortest_path against a single
+multi_source_bfs.multi_source_distances call."""
+import random
+import sys
+from time import perf_counter
+from typing import List
+
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.multi_source_bfs import multi_source_distances
+from graph_algos.shortest_path import breadth_first_shortest_path
+
+
+def main(nodes: int = 20000,
+         degree: int = 4,
+         sources: int = 256,
+         targets: int = 16) -> None:
+    """Times every source against every target, the one by one loop
+    is timed on the first source only and scaled up."""
+    rng: random.Random = random.Random(0)
+    edges: List[List[str]] = [[
+        str(rng.randrange(nodes)), str(rng.randrange(nodes))
+    ] for _ in range(nodes * degree // 2)]
+    graph: CSRGraph = CSRGraph.from_edges(edges)
+    source_nodes: List[str] = rng.sample(graph.labels, sources)
+    target_nodes: List[str] = rng.sample(graph.labels, targets)
+
+    start: float = perf_counter()
+    expected: List[int] = [
+        breadth_first_shortest_path(edges, source_nodes[0], target)
+        for target in target_nodes
+    ]
+    one_by_one: float = (perf_counter() - start) * sources
+    print("breadth_first_shortest_path loop  {:.2f}s (estimated)".format(
+        one_by_one))
+
+    for batch_size in (64, 256, 1024):
+        start = perf_counter()
+        distances: List[List[int]] = multi_source_distances(
+            graph, source_nodes, target_nodes, batch_size)
+        elapsed: float = perf_counter() - start
+        assert distances[0] == expected
+        print("multi_source_distances batch={:<5} {:.2f}s {:.0f}x".format(
+            batch_size, elapsed, one_by_one / elapsed))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:5]))
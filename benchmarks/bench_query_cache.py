@@ -0,0 +1,48 @@
+"""bench_query_cache.py
+
+Replays a skewed stream of shortest path queries, where a few hot
+sources are asked about most of the time, against a GraphIndex alone
+and through a QueryCache, and prints the cache hit rate. Sources are
+drawn with Zipf-like weights 1 / rank."""
+import random
+import sys
+from time import perf_counter
+from typing import List, Tuple
+
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.graph_index import GraphIndex
+from graph_algos.query_cache import QueryCache
+
+from benchmarks.generators import random_edges
+
+
+def main(nodes: int = 20000, degree: int = 4, queries: int = 2000) -> None:
+    """Times every query through both and checks they agree."""
+    rng: random.Random = random.Random(0)
+    graph: CSRGraph = CSRGraph.from_edges(random_edges(nodes, degree))
+    labels: List[str] = list(graph.labels)
+    hot: List[str] = rng.sample(labels, 64)
+    weights: List[float] = [1 / rank for rank in range(1, len(hot) + 1)]
+    stream: List[Tuple[str, str]] = [
+        (source, rng.choice(labels))
+        for source in rng.choices(hot, weights, k=queries)
+    ]
+
+    index: GraphIndex = GraphIndex(graph)
+    start: float = perf_counter()
+    expected: List[int] = [index.shortest_path(a, b) for a, b in stream]
+    uncached: float = perf_counter() - start
+    print("GraphIndex.shortest_path  {:.2f}s".format(uncached))
+
+    cache: QueryCache = QueryCache(graph, max_sources=len(hot))
+    start = perf_counter()
+    distances: List[int] = [cache.shortest_path(a, b) for a, b in stream]
+    cached: float = perf_counter() - start
+    assert distances == expected
+    stats = cache.stats()
+    print("QueryCache.shortest_path  {:.2f}s {:.1f}x, {:.0%} hits".format(
+        cached, uncached / cached, stats.hits / queries))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:4]))
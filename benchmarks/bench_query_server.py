@@ -0,0 +1,124 @@
+"""bench_query_server.py
+
+Load generator for query_server.QueryServer over a Unix socket.
+Several clients keep a number of shortest path queries in flight,
+their sources drawn from a small hot set so concurrent queries share
+traversals, and the p50 and p99 latency and the queries per second
+are printed. The same load is run against a handler answering every
+query with GraphIndex.shortest_path on the event loop, the way a
+blocking service would."""
+import asyncio
+import json
+import os
+import random
+import sys
+import tempfile
+from time import perf_counter
+from typing import Awaitable, Callable, List, Tuple
+
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.graph_index import GraphIndex
+from graph_algos.query_server import QueryClient, QueryServer
+
+from benchmarks.generators import random_edges
+
+Handler = Callable[[asyncio.StreamReader, asyncio.StreamWriter],
+                   Awaitable[None]]
+
+
+def _blocking_handler(graph: CSRGraph) -> Handler:
+    """Returns a handler answering each request before reading the
+    next one, blocking the event loop for every traversal."""
+    index: GraphIndex = GraphIndex(graph)
+
+    async def handle(reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        while True:
+            line: bytes = await reader.readline()
+            if not line:
+                break
+            request = json.loads(line)
+            result: int = index.shortest_path(request["a"], request["b"])
+            writer.write(
+                json.dumps({
+                    "id": request["id"],
+                    "result": result
+                }).encode() + b"\n")
+            await writer.drain()
+        writer.close()
+
+    return handle
+
+
+async def _load(path: str, queries: List[Tuple[str, str]], clients: int,
+                in_flight: int) -> Tuple[List[float], float]:
+    """Sends queries from clients connections, each keeping in_flight
+    queries outstanding. Returns every latency and the total time."""
+    latencies: List[float] = list()
+
+    async def worker(client: QueryClient, share: List[Tuple[str,
+                                                            str]]) -> None:
+        for node_a, node_b in share:
+            start: float = perf_counter()
+            await client.query("shortest_path", node_a, node_b)
+            latencies.append(perf_counter() - start)
+
+    connections: List[QueryClient] = [
+        await QueryClient.open_unix(path) for _ in range(clients)
+    ]
+    lanes: int = clients * in_flight
+    start: float = perf_counter()
+    await asyncio.gather(*(worker(connections[lane % clients],
+                                  queries[lane::lanes])
+                           for lane in range(lanes)))
+    elapsed: float = perf_counter() - start
+    for client in connections:
+        await client.close()
+    return latencies, elapsed
+
+
+def _report(name: str, latencies: List[float], elapsed: float) -> None:
+    """Prints the latency percentiles and throughput."""
+    latencies.sort()
+    print("{:<14} p50 {:7.2f}ms  p99 {:7.2f}ms  {:8.0f} queries/s".format(
+        name, latencies[len(latencies) // 2] * 1000,
+        latencies[int(len(latencies) * 0.99)] * 1000,
+        len(latencies) / elapsed))
+
+
+async def _run(nodes: int, queries: int, clients: int, in_flight: int,
+               hot: int) -> None:
+    """Runs the same load against both servers."""
+    rng: random.Random = random.Random(0)
+    graph: CSRGraph = CSRGraph.from_edges(random_edges(nodes))
+    labels: List[str] = list(graph.labels)
+    sources: List[str] = rng.sample(labels, hot)
+    load: List[Tuple[str, str]] = [(rng.choice(sources), rng.choice(labels))
+                                   for _ in range(queries)]
+    with tempfile.TemporaryDirectory() as directory:
+        path: str = os.path.join(directory, "blocking.sock")
+        listener: asyncio.AbstractServer = await asyncio.start_unix_server(
+            _blocking_handler(graph), path)
+        _report("blocking", *await _load(path, load, clients, in_flight))
+        listener.close()
+
+        server: QueryServer = QueryServer(graph)
+        path = os.path.join(directory, "server.sock")
+        listener = await server.serve_unix(path)
+        _report("QueryServer", *await _load(path, load, clients, in_flight))
+        listener.close()
+        server.close()
+        print("{} queries answered by {} traversals".format(*server.stats()))
+
+
+def main(nodes: int = 20000,
+         queries: int = 2000,
+         clients: int = 8,
+         in_flight: int = 8,
+         hot: int = 32) -> None:
+    """Runs the benchmark."""
+    asyncio.run(_run(nodes, queries, clients, in_flight, hot))
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:6]))
@@ -0,0 +1,120 @@
+"""bench_recursion.py
+
+Compares the recursive depth first routines against their explicit
+stack versions, on chains shallow enough for the recursive versions
+and on ones deep enough to exhaust the recursion limit."""
+import io
+import sys
+from contextlib import redirect_stdout
+from time import perf_counter
+from typing import Any, Callable, Dict, List, Set, Tuple
+
+from graph_algos import (connected_components_count,
+                         depth_first_and_breadth_first_traversal, has_path,
+                         island_count, largest_component, minimum_island,
+                         undirected_path)
+
+Case = Tuple[str, Callable[[int], Any], Callable[[Any], object],
+             Callable[[Any], object]]
+
+
+def _chain_graph(size: int) -> Dict[str, List[str]]:
+    """Builds an undirected chain of size nodes."""
+    graph: Dict[str, List[str]] = {str(i): list() for i in range(size)}
+    for i in range(size - 1):
+        graph[str(i)].append(str(i + 1))
+        graph[str(i + 1)].append(str(i))
+    return graph
+
+
+def _directed_chain(size: int) -> Dict[str, List[str]]:
+    """Builds a directed chain of size nodes."""
+    graph: Dict[str, List[str]] = {
+        str(i): [str(i + 1)]
+        for i in range(size - 1)
+    }
+    graph[str(size - 1)] = list()
+    return graph
+
+
+def _snake_grid(size: int) -> List[List[str]]:
+    """Builds a single island winding through a size x size grid, so
+    the depth first search goes about size * size / 2 deep."""
+    grid: List[List[str]] = list()
+    for row in range(size):
+        if row % 2 == 0:
+            grid.append(["L"] * size)
+        elif row % 4 == 1:
+            grid.append(["W"] * (size - 1) + ["L"])
+        else:
+            grid.append(["L"] + ["W"] * (size - 1))
+    return grid
+
+
+def _explore_all(explore: Callable[[List[List[str]], int, int, Set[Tuple[
+        int, int]]], object], grid: List[List[str]]) -> None:
+    """Runs an _explore routine from every cell of a grid."""
+    visited: Set[Tuple[int, int]] = set()
+    for row in range(len(grid)):
+        for column in range(len(grid[0])):
+            explore(grid, row, column, visited)
+
+
+CASES: List[Case] = [
+    ("has_path.depth_first_has_path", _directed_chain,
+     lambda g: has_path.depth_first_has_path_recursive(g, "0", "-1"),
+     lambda g: has_path.depth_first_has_path_iterative(g, "0", "-1")),
+    ("undirected_path.depth_first_has_path", _chain_graph,
+     lambda g: undirected_path.depth_first_has_path_recursive(
+         g, "0", "-1", set()),
+     lambda g: undirected_path.depth_first_has_path_iterative(
+         g, "0", "-1", set())),
+    ("connected_components_count.depth_first_has_path", _chain_graph,
+     lambda g: connected_components_count.depth_first_has_path_recursive(
+         g, "0", set()),
+     lambda g: connected_components_count.depth_first_has_path_iterative(
+         g, "0", set())),
+    ("largest_component.depth_first_count", _chain_graph,
+     lambda g: largest_component.depth_first_count_recursive(g, "0", set()),
+     lambda g: largest_component.depth_first_count_iterative(g, "0", set())),
+    ("depth_first_and_breadth_first_traversal.depth_first_print",
+     _directed_chain,
+     lambda g: depth_first_and_breadth_first_traversal.
+     depth_first_print_recursive(g, "0", list()),
+     lambda g: depth_first_and_breadth_first_traversal.
+     depth_first_print_explicit_stack(g, "0", list())),
+    ("island_count._explore", _snake_grid,
+     lambda g: _explore_all(island_count._explore, g),
+     lambda g: _explore_all(island_count._explore_iterative, g)),
+    ("minimum_island._explore", _snake_grid,
+     lambda g: _explore_all(minimum_island._explore, g),
+     lambda g: _explore_all(minimum_island._explore_iterative, g)),
+]
+
+
+def _time(func: Callable[[Any], object], argument: Any) -> str:
+    """Times one call, reporting a RecursionError instead of a time."""
+    start: float = perf_counter()
+    try:
+        with redirect_stdout(io.StringIO()):
+            func(argument)
+    except RecursionError:
+        return "RecursionError"
+    return "{:.4f}s".format(perf_counter() - start)
+
+
+def main() -> None:
+    """Runs every case at a size the recursive routines survive and
+    at one past the recursion limit."""
+    limit: int = sys.getrecursionlimit()
+    for name, setup, recursive, iterative in CASES:
+        grid_case: bool = name.endswith("_explore")
+        for size in ((40, 200) if grid_case else (limit // 2, limit * 20)):
+            argument: Any = setup(size)
+            print("{:<60} n={:<6} recursive={:<15} iterative={}".format(
+                name, size, _time(recursive, argument),
+                _time(iterative, argument)))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""bench_weighted.py
+
+Times cheapest path queries on a road-like weighted lattice of about
+a million edges with weighted_path.dijkstra_path and
+weighted_path.a_star_path, the latter guided by the straight line
+distance, against a breadth first search on the same graph with the
+weights dropped."""
+import random
+import sys
+from time import perf_counter
+from typing import List, Tuple
+
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.shortest_path import csr_breadth_first_node_path
+from graph_algos.weighted_path import (WeightedGraph, WeightedPath,
+                                       a_star_path, dijkstra_path,
+                                       euclidean_heuristic)
+
+from benchmarks.generators import road_edges
+
+
+def main(nodes: int = 550000, queries: int = 5) -> None:
+    """Builds the lattice and times every query with each search."""
+    edges: List[List[str]] = road_edges(nodes)
+    start: float = perf_counter()
+    weighted: WeightedGraph = WeightedGraph.from_edges(edges)
+    print("WeightedGraph.from_edges {} edges {:.2f}s".format(
+        len(edges),
+        perf_counter() - start))
+    unweighted: CSRGraph = weighted.graph
+    columns: int = max(1, int(nodes**0.5))
+    coordinates: List[Tuple[float, float]] = [
+        divmod(int(label), columns) for label in unweighted.labels
+    ]
+    rng: random.Random = random.Random(0)
+    pairs: List[Tuple[str, str]] = [(rng.choice(unweighted.labels),
+                                     rng.choice(unweighted.labels))
+                                    for _ in range(queries)]
+
+    start = perf_counter()
+    for node_a, node_b in pairs:
+        csr_breadth_first_node_path(unweighted, node_a, node_b)
+    print("breadth first, unweighted {:.3f}s per query".format(
+        (perf_counter() - start) / queries))
+
+    start = perf_counter()
+    expected: List[WeightedPath] = [
+        dijkstra_path(weighted, node_a, node_b) for node_a, node_b in pairs
+    ]
+    print("dijkstra_path             {:.3f}s per query".format(
+        (perf_counter() - start) / queries))
+
+    start = perf_counter()
+    found: List[WeightedPath] = [
+        a_star_path(weighted, node_a, node_b,
+                    euclidean_heuristic(coordinates))
+        for node_a, node_b in pairs
+    ]
+    print("a_star_path               {:.3f}s per query".format(
+        (perf_counter() - start) / queries))
+    for path, reference in zip(found, expected):
+        assert abs(path.cost - reference.cost) < 1e-9
+
+
+if __name__ == "__main__":
+    main(*(int(argument) for argument in sys.argv[1:3]))
@@ -0,0 +1,127 @@
+"""generators.py
+
+Seeded synthetic graphs and grids for the benchmarks. Nodes are
+labeled "0" to str(nodes - 1) and edges use the List[List[str]] edge
+list format of the course modules, so the same seed always builds the
+same workload."""
+import random
+from typing import Callable, Dict, List
+
+Edges = List[List[str]]
+
+
+def random_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Uniform random graph of about nodes * degree / 2 edges, self
+    loops and parallel edges included."""
+    rng: random.Random = random.Random(seed)
+    return [[str(rng.randrange(nodes)),
+             str(rng.randrange(nodes))] for _ in range(nodes * degree // 2)]
+
+
+def power_law_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Preferential attachment graph, every new node links to
+    degree / 2 earlier nodes picked in proportion to their degree, so
+    a few hubs collect most of the edges."""
+    rng: random.Random = random.Random(seed)
+    links: int = max(1, degree // 2)
+    edges: Edges = list()
+    # Every edge endpoint once, picking from it is picking by degree
+    endpoints: List[int] = list(range(min(links, nodes)))
+    for node in range(links, nodes):
+        targets: List[int] = list()
+        while len(targets) < links:
+            target: int = rng.choice(endpoints)
+            if target not in targets:
+                targets.append(target)
+        for target in targets:
+            edges.append([str(node), str(target)])
+            endpoints.append(target)
+        endpoints.extend([node] * links)
+    return edges
+
+
+def grid_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Square lattice of nodes nodes, node r * columns + c linking to
+    its right and lower neighbors, the last row may be short. degree
+    and seed are ignored."""
+    columns: int = max(1, int(nodes**0.5))
+    edges: Edges = list()
+    for node in range(nodes):
+        if (node + 1) % columns and node + 1 < nodes:
+            edges.append([str(node), str(node + 1)])
+        if node + columns < nodes:
+            edges.append([str(node), str(node + columns)])
+    return edges
+
+
+def road_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Road-like weighted lattice, grid_edges with about one edge in
+    ten removed and the rest weighing 1 to 2, written as the
+    [a, b, weight] rows of weighted_path. Node r * columns + c sits at
+    (r, c), so the straight line distance never overestimates the
+    cost. degree is ignored."""
+    rng: random.Random = random.Random(seed)
+    return [[a, b, "{:.3f}".format(1 + rng.random())]
+            for a, b in grid_edges(nodes) if rng.random() >= 0.1]
+
+
+def chain_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Path of nodes nodes, the deepest graph for depth first
+    searches. degree and seed are ignored."""
+    return [[str(node), str(node + 1)] for node in range(nodes - 1)]
+
+
+def dag_edges(nodes: int, degree: int = 4, seed: int = 0) -> Edges:
+    """Directed acyclic graph, every node but the first gets up to
+    degree / 2 edges from random earlier nodes."""
+    rng: random.Random = random.Random(seed)
+    links: int = max(1, degree // 2)
+    return [[str(rng.randrange(node)), str(node)]
+            for node in range(1, nodes) for _ in range(links)]
+
+
+GENERATORS: Dict[str, Callable[[int, int, int], Edges]] = {
+    "random": random_edges,
+    "power_law": power_law_edges,
+    "grid": grid_edges,
+    "chain": chain_edges,
+    "dag": dag_edges,
+}
+
+
+def adjacency(nodes: int, edges: Edges,
+              directed: bool = False) -> Dict[str, List[str]]:
+    """Builds the Dict[str, List[str]] adjacency list of the course
+    modules, with a key for every node even when it has no edges."""
+    graph: Dict[str, List[str]] = {str(node): list() for node in range(nodes)}
+    for node_a, node_b in edges:
+        graph[node_a].append(node_b)
+        if not directed:
+            graph[node_b].append(node_a)
+    return graph
+
+
+def land_grid(rows: int, columns: int, land: float = 0.4,
+              seed: int = 0) -> List[List[str]]:
+    """Random "W"/"L" grid, every cell being land with probability
+    land."""
+    rng: random.Random = random.Random(seed)
+    return [["L" if rng.random() < land else "W" for _ in range(columns)]
+            for _ in range(rows)]
+
+
+# TESTS, run with python -m benchmarks.generators
+if __name__ == "__main__":
+    assert random_edges(10, 4, 1) == random_edges(10, 4, 1)
+    assert len(random_edges(10, 4)) == 20
+    assert len(power_law_edges(50, 4)) == 96
+    assert len(grid_edges(9)) == 12
+    assert chain_edges(3) == [["0", "1"], ["1", "2"]]
+    assert all(1 <= float(weight) <= 2 for _, _, weight in road_edges(100))
+    assert all(int(a) < int(b) for a, b in dag_edges(20))
+    assert adjacency(3, chain_edges(3), directed=True) == {
+        "0": ["1"],
+        "1": ["2"],
+        "2": [],
+    }
+    assert sum(row.count("L") for row in land_grid(10, 10, 1.0)) == 100
@@ -0,0 +1,313 @@
+"""suite.py
+
+Times every public function of the eight course modules on a seeded
+synthetic workload and reports the results as JSON, one record per
+function with its best and mean latency, throughput in nodes plus
+edges (or grid cells) per second and tracemalloc peak memory.
+
+    python -m benchmarks.suite --graph power_law --nodes 100000 \\
+        --output results.json
+"""
+import argparse
+import json
+import os
+import platform
+import sys
+import tracemalloc
+from contextlib import redirect_stdout
+from time import perf_counter
+from typing import (Any, Callable, Dict, Iterator, List, NamedTuple,
+                    Optional, Sequence, TextIO, Tuple)
+
+from graph_algos import (connected_components_count, has_path, island_count,
+                         largest_component, minimum_island, shortest_path,
+                         undirected_path)
+from graph_algos import depth_first_and_breadth_first_traversal as traversal
+from graph_algos.csr_graph import CSRGraph
+
+from benchmarks.generators import GENERATORS, Edges, adjacency, land_grid
+
+# Iterative deepening walks every simple path up to its depth limit,
+# which grows exponentially with it, so its searches stop here
+DEEPENING_DEPTH: int = 8
+
+
+class Workload(NamedTuple):
+    """Every input shape the course functions take, built once from
+    the same edge list."""
+    nodes: int
+    edges: Edges
+    graph: Dict[str, List[str]]
+    directed: Dict[str, List[str]]
+    csr: CSRGraph
+    csr_directed: CSRGraph
+    grid: List[List[str]]
+    source: str
+    target: str
+
+
+class Case(NamedTuple):
+    """A function and a factory for fresh arguments, so functions
+    filling in a visited set start from an empty one every run."""
+    module: str
+    function: Callable[..., Any]
+    arguments: Callable[[Workload], Tuple[Any, ...]]
+    grid: bool = False
+
+
+def _module_name(function: Callable[..., Any]) -> str:
+    """Module of a function without the package, like the names the
+    --module option takes."""
+    return function.__module__.rpartition(".")[2]
+
+
+def _cases(sink: TextIO) -> List[Case]:
+    """Every public function of the course modules."""
+    cases: List[Case] = list()
+    function: Callable[..., Any]
+    for function in (has_path.depth_first_has_path_recursive,
+                     has_path.depth_first_has_path_iterative,
+                     has_path.breadth_first_has_path):
+        cases.append(
+            Case("has_path", function, lambda w:
+                 (w.directed, w.source, w.target)))
+    for function in (has_path.csr_depth_first_has_path,
+                     has_path.csr_breadth_first_has_path):
+        cases.append(
+            Case("has_path", function, lambda w:
+                 (w.csr_directed, w.source, w.target)))
+
+    for function in (undirected_path.depth_first_has_path_recursive,
+                     undirected_path.depth_first_has_path_iterative,
+                     undirected_path.breadth_first_has_path):
+        cases.append(
+            Case("undirected_path", function, lambda w:
+                 (w.graph, w.source, w.target, set())))
+    for function in (undirected_path.undirected_path_depth_first,
+                     undirected_path.undirected_path_breadth_first):
+        cases.append(
+            Case("undirected_path", function, lambda w:
+                 (w.edges, w.source, w.target)))
+    for function in (undirected_path.csr_undirected_path_depth_first,
+                     undirected_path.csr_undirected_path_breadth_first):
+        cases.append(
+            Case("undirected_path", function, lambda w:
+                 (w.csr, w.source, w.target)))
+
+    for function in (shortest_path.breadth_first_count,
+                     shortest_path.depth_first_count_iterative):
+        cases.append(
+            Case("shortest_path", function, lambda w:
+                 (w.graph, w.source, w.target, {w.source})))
+    for function in (shortest_path.bidirectional_breadth_first_path,
+                     shortest_path.bidirectional_breadth_first_count):
+        cases.append(
+            Case("shortest_path", function, lambda w:
+                 (w.graph, w.source, w.target)))
+    for function in (shortest_path.breadth_first_shortest_path,
+                     shortest_path.depth_first_shortest_path,
+                     shortest_path.bidirectional_shortest_path,
+                     shortest_path.bidirectional_shortest_node_path,
+                     shortest_path.breadth_first_shortest_node_path):
+        cases.append(
+            Case("shortest_path", function, lambda w:
+                 (w.edges, w.source, w.target)))
+    for function in (shortest_path.csr_breadth_first_shortest_path,
+                     shortest_path.csr_depth_first_shortest_path,
+                     shortest_path.csr_breadth_first_node_path):
+        cases.append(
+            Case("shortest_path", function, lambda w:
+                 (w.csr, w.source, w.target)))
+    cases.append(
+        Case("shortest_path", shortest_path.iterative_deepening_path,
+             lambda w: (w.graph, w.source, w.target, DEEPENING_DEPTH)))
+    cases.append(
+        Case("shortest_path",
+             shortest_path.iterative_deepening_shortest_node_path, lambda w:
+             (w.edges, w.source, w.target, DEEPENING_DEPTH)))
+    cases.append(
+        Case("shortest_path", shortest_path.csr_iterative_deepening_node_path,
+             lambda w: (w.csr, w.source, w.target, DEEPENING_DEPTH)))
+
+    for function in (
+            connected_components_count.depth_first_has_path_recursive,
+            connected_components_count.depth_first_has_path_iterative,
+            connected_components_count.breadth_first_has_path,
+            largest_component.depth_first_count_recursive,
+            largest_component.depth_first_count_iterative,
+            largest_component.breadth_first_count):
+        cases.append(
+            Case(_module_name(function), function, lambda w:
+                 (w.graph, w.source, set())))
+    for function in (
+            connected_components_count.connected_components_count,
+            connected_components_count.breadth_first_components_count,
+            connected_components_count.breadth_first_component_labels,
+            largest_component.depth_first_largest_component,
+            largest_component.breadth_first_largest_component):
+        cases.append(Case(_module_name(function), function, lambda w:
+                          (w.graph, )))
+    for function in (
+            connected_components_count.csr_connected_components_count,
+            connected_components_count.csr_breadth_first_components_count,
+            connected_components_count.csr_component_labels,
+            largest_component.csr_depth_first_largest_component,
+            largest_component.csr_breadth_first_largest_component):
+        cases.append(Case(_module_name(function), function, lambda w:
+                          (w.csr, )))
+
+    module: str = traversal.__name__.rpartition(".")[2]
+    for function in (traversal.depth_first_visits,
+                     traversal.depth_first_preorder_visits,
+                     traversal.breadth_first_visits,
+                     traversal.depth_first_print_iterative,
+                     traversal.breadth_first_print_iterative):
+        cases.append(Case(module, function, lambda w:
+                          (w.directed, w.source)))
+    for function in (traversal.depth_first_print_recursive,
+                     traversal.depth_first_print_explicit_stack):
+        cases.append(
+            Case(module, function, lambda w: (w.directed, w.source, list())))
+    cases.append(
+        Case(module, traversal.visited_nodes, lambda w:
+             (traversal.breadth_first_visits(w.directed, w.source), )))
+    cases.append(
+        Case(module, traversal.write_nodes, lambda w:
+             (traversal.visited_nodes(
+                 traversal.breadth_first_visits(w.directed, w.source)), sink)))
+    for function in (traversal.csr_depth_first_traversal,
+                     traversal.csr_breadth_first_traversal):
+        cases.append(
+            Case(module, function, lambda w: (w.csr_directed, w.source)))
+
+    cases.append(
+        Case("island_count", island_count.island_count, lambda w:
+             (w.grid, ), True))
+    cases.append(
+        Case("minimum_island", minimum_island.minimum_island_count, lambda w:
+             (w.grid, ), True))
+    return cases
+
+
+def build_workload(graph: str, nodes: int, degree: int,
+                   seed: int) -> Workload:
+    """Generates the edge list and every structure built from it. The
+    searches run from the first edge to the last one, so both ends
+    exist in graphs built from the edge list, and the grid has about
+    as many cells as the graph has nodes."""
+    edges: Edges = GENERATORS[graph](nodes, degree, seed)
+    side: int = max(1, int(nodes**0.5))
+    return Workload(nodes, edges, adjacency(nodes, edges),
+                    adjacency(nodes, edges, directed=True),
+                    CSRGraph.from_adjacency(adjacency(nodes, edges)),
+                    CSRGraph.from_adjacency(
+                        adjacency(nodes, edges, directed=True)),
+                    land_grid(side, side, seed=seed), edges[0][0],
+                    edges[-1][1])
+
+
+def _call(case: Case, workload: Workload) -> float:
+    """Runs a case once on fresh arguments, draining generators, and
+    returns the elapsed seconds."""
+    arguments: Tuple[Any, ...] = case.arguments(workload)
+    start: float = perf_counter()
+    result: Any = case.function(*arguments)
+    if isinstance(result, Iterator):
+        for _ in result:
+            pass
+    return perf_counter() - start
+
+
+def measure(case: Case, workload: Workload, repeat: int) -> Dict[str, Any]:
+    """Times a case repeat times, then runs it once more under
+    tracemalloc for its peak memory, which is kept out of the timed
+    runs because tracing slows allocation down."""
+    name: str = case.function.__name__
+    items: int = (len(workload.grid) * len(workload.grid[0])
+                  if case.grid else workload.nodes + len(workload.edges))
+    record: Dict[str, Any] = {
+        "module": case.module,
+        "function": name,
+        "items": items,
+    }
+    try:
+        timings: List[float] = [
+            _call(case, workload) for _ in range(repeat)
+        ]
+        tracemalloc.start()
+        try:
+            _call(case, workload)
+            peak: int = tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+    except RecursionError:
+        record["error"] = "RecursionError"
+        return record
+    best: float = min(timings)
+    record.update({
+        "best_seconds": best,
+        "mean_seconds": sum(timings) / len(timings),
+        "items_per_second": items / best if best else None,
+        "peak_bytes": peak,
+    })
+    return record
+
+
+def run(graph: str = "random",
+        nodes: int = 10000,
+        degree: int = 4,
+        seed: int = 0,
+        repeat: int = 5,
+        modules: Optional[Sequence[str]] = None) -> Dict[str, Any]:
+    """Runs the suite and returns the JSON report as a dict."""
+    workload: Workload = build_workload(graph, nodes, degree, seed)
+    results: List[Dict[str, Any]] = list()
+    with open(os.devnull, "w") as sink, redirect_stdout(sink):
+        for case in _cases(sink):
+            if modules and case.module not in modules:
+                continue
+            results.append(measure(case, workload, repeat))
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "machine": platform.machine(),
+        "graph": graph,
+        "nodes": nodes,
+        "edges": len(workload.edges),
+        "grid": [len(workload.grid), len(workload.grid[0])],
+        "degree": degree,
+        "seed": seed,
+        "repeat": repeat,
+        "results": results,
+    }
+
+
+def main(argv: Optional[Sequence[str]] = None) -> None:
+    """Command line entry point."""
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="python -m benchmarks.suite", description=__doc__.split("\n")[2])
+    parser.add_argument("--graph", choices=sorted(GENERATORS),
+                        default="random")
+    parser.add_argument("--nodes", type=int, default=10000)
+    parser.add_argument("--degree", type=int, default=4)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--module", action="append", dest="modules",
+                        choices=sorted({case.module
+                                        for case in _cases(sys.stdout)}),
+                        help="only run this module, may be repeated")
+    parser.add_argument("--output", help="write JSON here, not to stdout")
+    arguments: argparse.Namespace = parser.parse_args(argv)
+    report: Dict[str, Any] = run(arguments.graph, arguments.nodes,
+                                 arguments.degree, arguments.seed,
+                                 arguments.repeat, arguments.modules)
+    if arguments.output:
+        with open(arguments.output, "w") as handle:
+            json.dump(report, handle, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,120 @@
+"""graph_algos
+
+Solutions to the course problems, one module per problem. Importing
+the package runs nothing and loads none of the modules, each module
+is imported the first time it or one of the names below is accessed,
+so using one algorithm does not load the rest:
+
+    import graph_algos
+
+    graph_algos.shortest_path.bidirectional_shortest_path(edges, "w", "z")
+    graph_algos.CSRGraph.from_edges(edges)
+
+Functions named after their module, like island_count, are reached
+through the module. Every module runs its tests when executed with
+python -m graph_algos.<module>.
+"""
+import importlib
+from typing import Any, Dict, List
+
+# Every module of the package
+_MODULES: List[str] = [
+    "connected_components_count",
+    "connectivity_index",
+    "csr_graph",
+    "dynamic_graph",
+    "depth_first_and_breadth_first_traversal",
+    "edge_reader",
+    "frontier_bfs",
+    "graph_file",
+    "graph_index",
+    "has_path",
+    "island_count",
+    "island_labeling",
+    "island_parallel",
+    "island_streaming",
+    "largest_component",
+    "minimum_island",
+    "multi_source_bfs",
+    "query_cache",
+    "query_server",
+    "shortest_path",
+    "traversal_stats",
+    "undirected_path",
+    "union_find",
+    "weighted_path",
+]
+
+# Names exported at the top level and the module defining them
+_EXPORTS: Dict[str, str] = {
+    "CSRGraph": "csr_graph",
+    "GraphIndex": "graph_index",
+    "QueryCache": "query_cache",
+    "CacheStats": "query_cache",
+    "graph_fingerprint": "query_cache",
+    "QueryServer": "query_server",
+    "QueryClient": "query_server",
+    "ConnectivityIndex": "connectivity_index",
+    "UnionFind": "union_find",
+    "DynamicGraph": "dynamic_graph",
+    "TraversalStats": "traversal_stats",
+    "write_graph": "graph_file",
+    "load_graph": "graph_file",
+    "read_graph": "edge_reader",
+    "read_adjacency": "edge_reader",
+    "iter_edges": "edge_reader",
+    "ComponentLabels": "connected_components_count",
+    "CSRComponentLabels": "connected_components_count",
+    "breadth_first_component_labels": "connected_components_count",
+    "csr_component_labels": "connected_components_count",
+    "depth_first_largest_component": "largest_component",
+    "breadth_first_largest_component": "largest_component",
+    "undirected_path_depth_first": "undirected_path",
+    "undirected_path_breadth_first": "undirected_path",
+    "breadth_first_shortest_path": "shortest_path",
+    "bidirectional_shortest_path": "shortest_path",
+    "bidirectional_shortest_node_path": "shortest_path",
+    "breadth_first_shortest_node_path": "shortest_path",
+    "iterative_deepening_shortest_node_path": "shortest_path",
+    "WeightedGraph": "weighted_path",
+    "WeightedPath": "weighted_path",
+    "dijkstra_path": "weighted_path",
+    "a_star_path": "weighted_path",
+    "euclidean_heuristic": "weighted_path",
+    "weighted_shortest_path": "weighted_path",
+    "weighted_shortest_node_path": "weighted_path",
+    "Visit": "depth_first_and_breadth_first_traversal",
+    "depth_first_visits": "depth_first_and_breadth_first_traversal",
+    "breadth_first_visits": "depth_first_and_breadth_first_traversal",
+    "minimum_island_count": "minimum_island",
+    "LandGrid": "island_labeling",
+    "IslandSummary": "island_labeling",
+    "island_summary": "island_labeling",
+    "IslandHistogram": "island_streaming",
+    "streaming_island_histogram": "island_streaming",
+    "parallel_island_summary": "island_parallel",
+    "multi_source_distances": "multi_source_bfs",
+    "FrontierSearch": "frontier_bfs",
+    "frontier_breadth_first": "frontier_bfs",
+}
+
+__all__ = sorted(_MODULES + list(_EXPORTS))
+
+
+def __getattr__(name: str) -> Any:
+    """Imports a module, or the module defining an exported name, on
+    first access (PEP 562)."""
+    if name in _MODULES:
+        return importlib.import_module("." + name, __name__)
+    if name in _EXPORTS:
+        value: Any = getattr(
+            importlib.import_module("." + _EXPORTS[name], __name__), name)
+        globals()[name] = value
+        return value
+    raise AttributeError("module {!r} has no attribute {!r}".format(
+        __name__, name))
+
+
+def __dir__() -> List[str]:
+    """Lists the modules and exported names without importing them."""
+    return __all__
@@ -0,0 +1,252 @@
+"""connected_components_count.py"""
+from array import array
+from collections import deque
+from typing import Deque, Set, Dict, List, NamedTuple
+from graph_algos.csr_graph import CSRGraph
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ 1 ├─────┤ 0 ├─────┤ 5 │
+│   │     │   │     │   │
+└───┘     └─┬─┘     └─┬─┘
+            │         │
+            │         │
+            │         │
+            │         │
+            │         │
+          ┌─┴─┐       │
+          │   │       │
+          │ 8 ├───────┘
+          │   │
+          └───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ 2 ├─────┤ 3 │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  │         │
+  │       ┌─┴─┐
+  │       │   │
+  └───────┤ 4 │
+          │   │
+          └───┘
+"""
+
+GRAPH: Dict[str, List[str]] = {
+    "0": ["8", "1", "5"],
+    "1": ["0"],
+    "5": ["0", "8"],
+    "8": ["0", "5"],
+    "2": ["3", "4"],
+    "3": ["2", "4"],
+    "4": ["3", "2"],
+}
+
+
+class ComponentLabels(NamedTuple):
+    """Component id of every node, numbered from 0 in the order the
+    components are found, the size of every component and their
+    total."""
+    components: Dict[str, int]
+    sizes: List[int]
+    total: int
+
+
+class CSRComponentLabels(NamedTuple):
+    """Component id of every node indexed by node id, the size of
+    every component and their total."""
+    components: "array[int]"
+    sizes: List[int]
+    total: int
+
+
+# Depth first has-path
+def depth_first_has_path_recursive(graph: Dict[str, List[str]], src: str,
+                                   visited: Set[str]) -> bool:
+    """Depth first has-path recursive algo with cyclical checks."""
+    if src in visited:
+        return False
+    visited.add(src)
+    for neighbor in graph[src]:
+        depth_first_has_path_recursive(graph, neighbor, visited)
+    return True
+
+
+def depth_first_has_path_iterative(graph: Dict[str, List[str]], src: str,
+                                   visited: Set[str]) -> bool:
+    """Depth first has-path iterative algo with cyclical checks,
+    visits nodes in the same order as depth_first_has_path_recursive
+    without recursing."""
+    if src in visited:
+        return False
+    stack: Deque[str] = deque([src])
+    while stack:
+        current: str = stack.pop()
+        if current in visited:
+            continue
+        visited.add(current)
+        stack.extend(reversed(graph[current]))
+    return True
+
+
+# Breadth first has-path
+def breadth_first_has_path(graph: Dict[str, List[str]], src: str,
+                           visited: Set[str]) -> bool:
+    """Breadth first has-path iterative algo with cyclical checks."""
+    queue: Deque[str] = deque([src])
+    while queue:
+        current: str = queue.popleft()
+        if current in visited:
+            continue
+        visited.add(current)
+        for neighbor in graph[current]:
+            queue.append(neighbor)
+    return True
+
+
+# Components count algos
+def connected_components_count(graph: Dict[str, List[str]]) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    depth-first and returns the number of connected components."""
+    count: int = 0
+    visited: Set[str] = set()
+    for node in graph:
+        if depth_first_has_path_iterative(graph, node, visited):
+            count += 1
+    return count
+
+
+def breadth_first_components_count(graph: Dict[str, List[str]]) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    breadth first and returns the number of connected components."""
+    return breadth_first_component_labels(graph).total
+
+
+# Component labeling, every node and edge is visited once
+def breadth_first_component_labels(
+        graph: Dict[str, List[str]]) -> ComponentLabels:
+    """Takes in a graph adjacency list, labels every node with the id
+    of its connected component breadth first and returns the labels,
+    the component sizes and the component count."""
+    components: Dict[str, int] = dict()
+    sizes: List[int] = list()
+    queue: Deque[str] = deque()
+    for node in graph:
+        if node in components:
+            continue
+        label: int = len(sizes)
+        components[node] = label
+        queue.append(node)
+        size: int = 0
+        while queue:
+            current: str = queue.popleft()
+            size += 1
+            for neighbor in graph[current]:
+                if neighbor not in components:
+                    components[neighbor] = label
+                    queue.append(neighbor)
+        sizes.append(size)
+    return ComponentLabels(components, sizes, len(sizes))
+
+
+# CSR graph variants
+def csr_connected_components_count(graph: CSRGraph) -> int:
+    """Takes in a CSR graph, traverses the graph depth-first
+    and returns the number of connected components."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    count: int = 0
+    visited: bytearray = bytearray(graph.node_count())
+    stack: Deque[int] = deque()
+    for node in range(graph.node_count()):
+        if visited[node]:
+            continue
+        stack.append(node)
+        while stack:
+            current: int = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            stack.extend(
+                reversed(neighbors[offsets[current]:offsets[current + 1]]))
+        count += 1
+    return count
+
+
+def csr_breadth_first_components_count(graph: CSRGraph) -> int:
+    """Takes in a CSR graph, traverses the graph breadth-first
+    and returns the number of connected components."""
+    return csr_component_labels(graph).total
+
+
+def csr_component_labels(graph: CSRGraph) -> CSRComponentLabels:
+    """Takes in a CSR graph, labels every node id with the id of its
+    connected component breadth-first and returns the labels, the
+    component sizes and the component count."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    components: "array[int]" = array("i", [-1]) * graph.node_count()
+    sizes: List[int] = list()
+    queue: Deque[int] = deque()
+    for node in range(graph.node_count()):
+        if components[node] != -1:
+            continue
+        label: int = len(sizes)
+        components[node] = label
+        queue.append(node)
+        size: int = 0
+        while queue:
+            current: int = queue.popleft()
+            size += 1
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if components[neighbor] == -1:
+                    components[neighbor] = label
+                    queue.append(neighbor)
+        sizes.append(size)
+    return CSRComponentLabels(components, sizes, len(sizes))
+
+
+# TESTS, run with python -m graph_algos.connected_components_count
+if __name__ == "__main__":
+    assert connected_components_count(GRAPH) == 2
+    TEST_VISITED: Set[str] = set()
+    assert depth_first_has_path_iterative(GRAPH, "0", TEST_VISITED)
+    assert TEST_VISITED == {"0", "1", "5", "8"}
+    assert depth_first_has_path_iterative(GRAPH, "5", TEST_VISITED) is False
+    assert breadth_first_components_count(GRAPH) == 2
+
+    CHAIN_GRAPH: Dict[str, List[str]] = {
+        str(i): [str(i - 1), str(i + 1)]
+        for i in range(1, 5000)
+    }
+    CHAIN_GRAPH["0"] = ["1"]
+    CHAIN_GRAPH["5000"] = ["4999"]
+    assert connected_components_count(CHAIN_GRAPH) == 1
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_adjacency(GRAPH)
+    assert csr_connected_components_count(CSR_GRAPH) == 2
+    assert csr_breadth_first_components_count(CSR_GRAPH) == 2
+
+    TEST_LABELS: ComponentLabels = breadth_first_component_labels(GRAPH)
+    assert TEST_LABELS.total == 2
+    assert TEST_LABELS.sizes == [4, 3]
+    assert {TEST_LABELS.components[node]
+            for node in ("0", "1", "5", "8")} == {0}
+    assert {TEST_LABELS.components[node] for node in ("2", "3", "4")} == {1}
+    assert breadth_first_component_labels(CHAIN_GRAPH).sizes == [5001]
+    assert breadth_first_component_labels(dict()) == ComponentLabels({}, [], 0)
+    TEST_CSR_LABELS: CSRComponentLabels = csr_component_labels(CSR_GRAPH)
+    assert TEST_CSR_LABELS.sizes == TEST_LABELS.sizes
+    assert all(TEST_CSR_LABELS.components[CSR_GRAPH.index[node]] == label
+               for node, label in TEST_LABELS.components.items())
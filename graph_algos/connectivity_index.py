@@ -0,0 +1,145 @@
+"""connectivity_index.py"""
+from array import array
+from typing import Dict, Iterable, List, Sequence
+from graph_algos.union_find import find_root
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐
+│   │     │   │
+│ i ├─────┤ j │
+│   │     │   │
+└─┬─┘     └───┘
+  │
+  │
+  │
+  │
+  │
+┌─┴─┐     ┌───┐
+│   │     │   │
+│ k ├─────┤ l │
+│   │     │   │
+└─┬─┘     └───┘
+  │
+  │
+  │
+  │
+  │
+┌─┴─┐
+│   │
+│ m │
+│   │
+└───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ o ├─────┤ n │
+│   │     │   │
+└───┘     └───┘
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["i", "j"],
+    ["k", "i"],
+    ["m", "k"],
+    ["k", "l"],
+    ["o", "n"],
+]
+
+
+class ConnectivityIndex:
+    """Labels every node of an undirected graph with the id of its
+    connected component, so has-path queries become a comparison of
+    two ids. Built straight from the edge stream with union-find,
+    without building an adjacency list."""
+
+    def __init__(self, index: Dict[str, int], components: "array[int]",
+                 count: int) -> None:
+        self.index: Dict[str, int] = index
+        self.components: "array[int]" = components
+        self.count: int = count
+
+    @classmethod
+    def from_edges(cls,
+                   edges: Iterable[Sequence[str]]) -> "ConnectivityIndex":
+        """Builds the index from an undirected edge list."""
+        index: Dict[str, int] = dict()
+        parents: "array[int]" = array("i")
+        ranks: bytearray = bytearray()
+        _a: str
+        _b: str
+        for edge in edges:
+            _a, _b = edge[0], edge[1]
+            if _a not in index:
+                index[_a] = len(parents)
+                parents.append(len(parents))
+                ranks.append(0)
+            if _b not in index:
+                index[_b] = len(parents)
+                parents.append(len(parents))
+                ranks.append(0)
+            _union(parents, ranks, index[_a], index[_b])
+        del ranks
+
+        # Point every node straight at its root, then replace each
+        # root with a dense component id in place
+        for node_id in range(len(parents)):
+            parents[node_id] = find_root(parents, node_id)
+        root_ids: Dict[int, int] = dict()
+        for node_id, root in enumerate(parents):
+            if root not in root_ids:
+                root_ids[root] = len(root_ids)
+            parents[node_id] = root_ids[root]
+        return cls(index, parents, len(root_ids))
+
+    def component_count(self) -> int:
+        """Returns the number of connected components."""
+        return self.count
+
+    def component_of(self, node: str) -> int:
+        """Returns the component id of a node."""
+        return self.components[self.index[node]]
+
+    def has_path(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_a and node_b are connected."""
+        if node_a == node_b:
+            return True
+        index: Dict[str, int] = self.index
+        if node_a not in index or node_b not in index:
+            return False
+        components: "array[int]" = self.components
+        return components[index[node_a]] == components[index[node_b]]
+
+
+# Helper function
+def _union(parents: "array[int]", ranks: bytearray, node_a: int,
+           node_b: int) -> None:
+    """Helper function merging the sets of two node ids by rank."""
+    root_a: int = find_root(parents, node_a)
+    root_b: int = find_root(parents, node_b)
+    if root_a == root_b:
+        return
+    if ranks[root_a] < ranks[root_b]:
+        root_a, root_b = root_b, root_a
+    parents[root_b] = root_a
+    if ranks[root_a] == ranks[root_b]:
+        ranks[root_a] += 1
+
+
+# TESTS, run with python -m graph_algos.connectivity_index
+if __name__ == "__main__":
+    TEST_INDEX: ConnectivityIndex = ConnectivityIndex.from_edges(EDGES)
+    assert TEST_INDEX.component_count() == 2
+    assert TEST_INDEX.has_path("j", "m")
+    assert TEST_INDEX.has_path("j", "n") is False
+    TEST_INDEX = ConnectivityIndex.from_edges(
+        [edge + ["1.5"] for edge in EDGES])
+    assert TEST_INDEX.component_count() == 2
+    assert TEST_INDEX.has_path("o", "n")
+    assert TEST_INDEX.has_path("j", "missing") is False
+    assert TEST_INDEX.component_of("l") == TEST_INDEX.component_of("i")
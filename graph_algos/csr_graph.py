@@ -0,0 +1,291 @@
+"""csr_graph.py"""
+import sys
+from array import array
+from typing import (Any, Dict, Iterable, List, Mapping, Optional, Sequence,
+                    Set, Tuple, Union)
+
+# Compressed sparse row (CSR) layout of an adjacency list
+"""
+labels:     ["w", "x", "y", "z", "v"]
+             0    1    2    3    4
+
+offsets:    [0,   2,   4,   6,   8,   10]
+             │    │    │    │    │    │
+neighbors:  [1,4, 0,2, 1,3, 2,4, 3,0]
+             └w┘  └x┘  └y┘  └z┘  └v┘
+
+The neighbors of node id i are neighbors[offsets[i]:offsets[i + 1]].
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+]
+
+# Convert to adjacency list, used to test against
+GRAPH: Dict[str, List[str]] = {
+    "w": ["x", "v"],
+    "x": ["w", "y"],
+    "y": ["x", "z"],
+    "z": ["y", "v"],
+    "v": ["z", "w"],
+}
+
+# An int32 buffer, an array or a memoryview cast to "i" over a file
+IntBuffer = Union["array[int]", memoryview]
+
+
+class CSRGraph:
+    """Compact graph representation. Node labels are interned to
+    dense integer ids and the adjacency is stored in two flat int32
+    buffers, so traversals work on integers instead of hashing
+    strings on every step. labels and index are built from each
+    other unless index is given, which lets graph_file.load_graph
+    look labels up in the file instead of decoding all of them."""
+
+    __slots__ = ("labels", "index", "offsets", "neighbors")
+
+    def __init__(self,
+                 labels: Sequence[str],
+                 offsets: IntBuffer,
+                 neighbors: IntBuffer,
+                 index: Optional[Mapping[str, int]] = None) -> None:
+        self.labels: Sequence[str] = labels
+        self.index: Mapping[str, int] = index if index is not None else {
+            label: node_id
+            for node_id, label in enumerate(labels)
+        }
+        self.offsets: IntBuffer = offsets
+        self.neighbors: IntBuffer = neighbors
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[str, List[str]]) -> "CSRGraph":
+        """Builds a CSR graph from a Dict[str, List[str]] adjacency
+        list, keeping the node and neighbor order of the input."""
+        labels: List[str] = list(graph)
+        index: Dict[str, int] = {
+            label: node_id
+            for node_id, label in enumerate(labels)
+        }
+        offsets: "array[int]" = array("i", [0])
+        neighbors: "array[int]" = array("i")
+        for node in graph:
+            for neighbor in graph[node]:
+                if neighbor not in index:
+                    index[neighbor] = len(labels)
+                    labels.append(neighbor)
+                neighbors.append(index[neighbor])
+            offsets.append(len(neighbors))
+        # Nodes only ever seen as a neighbor have no outgoing edges
+        for _ in range(len(offsets) - 1, len(labels)):
+            offsets.append(len(neighbors))
+        return cls(labels, offsets, neighbors)
+
+    @classmethod
+    def from_edges(cls,
+                   edges: Iterable[Sequence[str]],
+                   dedupe: bool = False,
+                   drop_self_loops: bool = False) -> "CSRGraph":
+        """Builds an undirected CSR graph from an edge list, a weight
+        column, see weighted_path, being ignored. Produces the same
+        neighbor order as the _build_graph helpers. A NumPy array of
+        shape (edges, 2) or (edges, 3) is built in vectorized passes
+        when NumPy is installed. Optionally drops repeated edges and
+        self-loops."""
+        # Only look for NumPy arrays once the caller has imported NumPy,
+        # importing it here would slow down every import of this module
+        numpy: Any = sys.modules.get("numpy")
+        if numpy is not None and isinstance(edges, numpy.ndarray):
+            return cls._from_edge_array(edges, dedupe, drop_self_loops)
+        labels: List[str] = list()
+        index: Dict[str, int] = dict()
+        sources: "array[int]" = array("i")
+        targets: "array[int]" = array("i")
+        _a: str
+        _b: str
+        for edge in edges:
+            _a, _b = edge[0], edge[1]
+            if _a not in index:
+                index[_a] = len(labels)
+                labels.append(_a)
+            if _b not in index:
+                index[_b] = len(labels)
+                labels.append(_b)
+            sources.append(index[_a])
+            targets.append(index[_b])
+        return cls.from_id_pairs(labels, sources, targets, dedupe,
+                                 drop_self_loops, index)
+
+    @classmethod
+    def from_id_pairs(cls,
+                      labels: List[str],
+                      sources: "array[int]",
+                      targets: "array[int]",
+                      dedupe: bool = False,
+                      drop_self_loops: bool = False,
+                      index: Optional[Mapping[str, int]] = None
+                      ) -> "CSRGraph":
+        """Builds an undirected CSR graph from edges whose endpoints
+        are already interned, sources[i] -- targets[i] being edge i
+        and labels[node_id] the label of each id. index, the label to
+        id mapping used while interning, is reused when given."""
+        if dedupe or drop_self_loops:
+            sources, targets = _filter_edges(sources, targets, dedupe,
+                                             drop_self_loops)
+
+        # Count degrees, prefix sum them into offsets, then scatter
+        # each edge in both directions in edge list order
+        node_count: int = len(labels)
+        offsets: "array[int]" = array("i", bytes(4 * (node_count + 1)))
+        for _a_id, _b_id in zip(sources, targets):
+            offsets[_a_id + 1] += 1
+            if _a_id != _b_id or not dedupe:
+                offsets[_b_id + 1] += 1
+        for node_id in range(node_count):
+            offsets[node_id + 1] += offsets[node_id]
+        neighbors: "array[int]" = array("i", bytes(4 * offsets[-1]))
+        cursor: "array[int]" = offsets[:-1]
+        for _a_id, _b_id in zip(sources, targets):
+            neighbors[cursor[_a_id]] = _b_id
+            cursor[_a_id] += 1
+            if _a_id != _b_id or not dedupe:
+                neighbors[cursor[_b_id]] = _a_id
+                cursor[_b_id] += 1
+        return cls(labels, offsets, neighbors, index)
+
+    @classmethod
+    def _from_edge_array(cls, edges: Any, dedupe: bool,
+                         drop_self_loops: bool) -> "CSRGraph":
+        """Vectorized builder for a NumPy edge array."""
+        import numpy as np
+        # Factorize the labels, numbering them in order of first
+        # appearance like the pure Python builder does
+        uniques, first_seen, inverse = np.unique(edges[:, :2].ravel(),
+                                                 return_index=True,
+                                                 return_inverse=True)
+        node_count: int = len(uniques)
+        label_order = np.argsort(first_seen, kind="stable")
+        rank = np.empty(node_count, dtype=np.int64)
+        rank[label_order] = np.arange(node_count)
+        ids = rank[inverse.ravel()].reshape(-1, 2)
+        if drop_self_loops:
+            ids = ids[ids[:, 0] != ids[:, 1]]
+
+        # Both directions of edge i sit at positions 2i and 2i + 1
+        sources = ids.ravel()
+        targets = ids[:, ::-1].ravel()
+        if dedupe:
+            _, keep = np.unique(sources * node_count + targets,
+                                return_index=True)
+            keep.sort()
+            sources = sources[keep]
+            targets = targets[keep]
+
+        # A stable sort by source keeps each neighbor list in edge order
+        neighbors = targets[np.argsort(sources, kind="stable")]
+        offsets = np.zeros(node_count + 1, dtype=np.int32)
+        np.cumsum(np.bincount(sources, minlength=node_count),
+                  out=offsets[1:])
+        labels: List[str] = uniques[label_order].astype(str).tolist()
+        return cls(labels, array("i", offsets.tobytes()),
+                   array("i", neighbors.astype(np.int32).tobytes()))
+
+    def to_adjacency(self) -> Dict[str, List[str]]:
+        """Converts back to a Dict[str, List[str]] adjacency list."""
+        labels: Sequence[str] = self.labels
+        return {
+            labels[node_id]:
+            [labels[neighbor] for neighbor in self.neighbors_of(node_id)]
+            for node_id in range(len(labels))
+        }
+
+    def node_count(self) -> int:
+        """Returns the number of nodes in the graph."""
+        return len(self.labels)
+
+    def edge_count(self) -> int:
+        """Returns the number of directed edges stored, an undirected
+        edge is stored once in each direction."""
+        return len(self.neighbors)
+
+    def id_of(self, label: str) -> int:
+        """Returns the interned integer id of a node label."""
+        return self.index[label]
+
+    def neighbors_of(self, node_id: int) -> IntBuffer:
+        """Returns the neighbor ids of a node id."""
+        start: int = self.offsets[node_id]
+        return self.neighbors[start:self.offsets[node_id + 1]]
+
+
+# Helper function
+def _filter_edges(sources: "array[int]", targets: "array[int]", dedupe: bool,
+                  drop_self_loops: bool) -> Tuple["array[int]", "array[int]"]:
+    """Helper function to drop self-loops and repeated undirected
+    edges from a pair of edge endpoint buffers."""
+    kept_sources: "array[int]" = array("i")
+    kept_targets: "array[int]" = array("i")
+    seen: Set[int] = set()
+    key: int
+    for _a_id, _b_id in zip(sources, targets):
+        if drop_self_loops and _a_id == _b_id:
+            continue
+        if dedupe:
+            if _a_id < _b_id:
+                key = _a_id << 32 | _b_id
+            else:
+                key = _b_id << 32 | _a_id
+            if key in seen:
+                continue
+            seen.add(key)
+        kept_sources.append(_a_id)
+        kept_targets.append(_b_id)
+    return kept_sources, kept_targets
+
+
+# TESTS, run with python -m graph_algos.csr_graph
+if __name__ == "__main__":
+    TEST_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES)
+    assert TEST_GRAPH.labels == ["w", "x", "y", "z", "v"]
+    assert list(TEST_GRAPH.offsets) == [0, 2, 4, 6, 8, 10]
+    assert list(TEST_GRAPH.neighbors) == [1, 4, 0, 2, 1, 3, 2, 4, 3, 0]
+    assert TEST_GRAPH.to_adjacency() == GRAPH
+    assert TEST_GRAPH.edge_count() == 2 * len(EDGES)
+    assert CSRGraph.from_edges([edge + ["1.5"] for edge in EDGES
+                                ]).neighbors == TEST_GRAPH.neighbors
+
+    assert CSRGraph.from_adjacency(GRAPH).to_adjacency() == GRAPH
+    assert CSRGraph.from_adjacency({"a": ["b"]}).to_adjacency() == {
+        "a": ["b"],
+        "b": [],
+    }
+
+    NOISY_EDGES: List[List[str]] = EDGES + [["x", "w"], ["y", "y"], ["w", "x"]]
+    assert CSRGraph.from_edges(NOISY_EDGES).to_adjacency()["y"] == [
+        "x", "z", "y", "y"
+    ]
+    assert CSRGraph.from_edges(NOISY_EDGES, dedupe=True,
+                               drop_self_loops=True).to_adjacency() == GRAPH
+    assert CSRGraph.from_edges(
+        NOISY_EDGES, dedupe=True).to_adjacency()["y"] == ["x", "z", "y"]
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        np = None  # type: ignore[assignment]
+    if np is not None:
+        for _dedupe in (False, True):
+            for _drop_self_loops in (False, True):
+                TEST_ARRAY_GRAPH: CSRGraph = CSRGraph.from_edges(
+                    np.array(NOISY_EDGES), _dedupe, _drop_self_loops)
+                TEST_LIST_GRAPH: CSRGraph = CSRGraph.from_edges(
+                    NOISY_EDGES, _dedupe, _drop_self_loops)
+                assert TEST_ARRAY_GRAPH.labels == TEST_LIST_GRAPH.labels
+                assert TEST_ARRAY_GRAPH.offsets == TEST_LIST_GRAPH.offsets
+                assert TEST_ARRAY_GRAPH.neighbors == TEST_LIST_GRAPH.neighbors
+        TEST_ARRAY_GRAPH = CSRGraph.from_edges(
+            np.array([edge + ["1.5"] for edge in NOISY_EDGES]))
+        assert TEST_ARRAY_GRAPH.labels == TEST_LIST_GRAPH.labels
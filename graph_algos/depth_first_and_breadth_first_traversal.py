@@ -0,0 +1,315 @@
+"""depth_first_and_breadth_first_traversal.py"""
+import io
+import sys
+from collections import deque
+from contextlib import redirect_stdout
+from itertools import islice
+from typing import (Deque, Dict, Iterable, Iterator, List, NamedTuple,
+                    Optional, Sequence, Set, TextIO)
+from graph_algos.csr_graph import CSRGraph
+
+# Our simple graph structure to play with
+"""
+┌───┐     ┌───┐
+│   │     │   │
+│ a ├────►│ b │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  ▼         ▼
+┌───┐     ┌───┐
+│   │     │   │
+│ c │     │ d │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  ▼         ▼
+┌───┐     ┌───┐
+│   │     │   │
+│ e │     │ f │
+│   │     │   │
+└───┘     └───┘
+"""
+GRAPH: Dict[str, List[str]] = {
+    "a": ["c", "b"],
+    "b": ["d"],
+    "c": ["e"],
+    "d": ["f"],
+    "e": [],
+    "f": [],
+}
+
+
+class Visit(NamedTuple):
+    """A node yielded by a traversal, with its depth from the source
+    and the node it was reached from, None for the source."""
+    node: str
+    depth: int
+    parent: Optional[str]
+
+
+# Lazy traversal generators, every node is yielded once unless
+# all_paths is set, which yields a node once per path reaching it
+def depth_first_visits(graph: Dict[str, List[str]],
+                       source: str,
+                       all_paths: bool = False) -> Iterator[Visit]:
+    """Depth first traversal generator, yields nodes in the same order
+    as depth_first_print_iterative."""
+    visited: Set[str] = set()
+    stack: Deque[Visit] = deque([Visit(source, 0, None)])
+    while stack:
+        current: Visit = stack.pop()
+        if not all_paths:
+            if current.node in visited:
+                continue
+            visited.add(current.node)
+        yield current
+        for neighbor in graph[current.node]:
+            stack.append(Visit(neighbor, current.depth + 1, current.node))
+
+
+def depth_first_preorder_visits(graph: Dict[str, List[str]],
+                                source: str,
+                                all_paths: bool = False) -> Iterator[Visit]:
+    """Depth first traversal generator, yields nodes in the same order
+    as depth_first_print_recursive."""
+    visited: Set[str] = set()
+    stack: Deque[Visit] = deque([Visit(source, 0, None)])
+    while stack:
+        current: Visit = stack.pop()
+        if not all_paths:
+            if current.node in visited:
+                continue
+            visited.add(current.node)
+        yield current
+        for neighbor in reversed(graph[current.node]):
+            stack.append(Visit(neighbor, current.depth + 1, current.node))
+
+
+def breadth_first_visits(graph: Dict[str, List[str]],
+                         source: str,
+                         all_paths: bool = False) -> Iterator[Visit]:
+    """Breadth first traversal generator, yields nodes in the same
+    order as breadth_first_print_iterative."""
+    visited: Set[str] = {source}
+    queue: Deque[Visit] = deque([Visit(source, 0, None)])
+    while queue:
+        current: Visit = queue.popleft()
+        yield current
+        for neighbor in graph[current.node]:
+            if not all_paths:
+                if neighbor in visited:
+                    continue
+                visited.add(neighbor)
+            queue.append(Visit(neighbor, current.depth + 1, current.node))
+
+
+def visited_nodes(visits: Iterable[Visit]) -> Iterator[str]:
+    """Strips the depth and parent from a stream of visits."""
+    for visit in visits:
+        yield visit.node
+
+
+def write_nodes(nodes: Iterable[str],
+                stream: Optional[TextIO] = None,
+                batch_size: int = 4096) -> int:
+    """Sink writing one node per line to stream, stdout by default,
+    batch_size lines per write. Returns the number of nodes written."""
+    output: TextIO = stream if stream is not None else sys.stdout
+    batch: List[str] = list()
+    count: int = 0
+    for node in nodes:
+        batch.append(node)
+        if len(batch) == batch_size:
+            output.write("\n".join(batch) + "\n")
+            count += len(batch)
+            batch.clear()
+    if batch:
+        output.write("\n".join(batch) + "\n")
+        count += len(batch)
+    return count
+
+
+# Depth first traversal algos
+def depth_first_print_iterative(graph: Dict[str, List[str]],
+                                source: str,
+                                all_paths: bool = False) -> List[str]:
+    """Depth first print iterative algo."""
+    r_list: List[str] = list()
+    for current in visited_nodes(
+            depth_first_visits(graph, source, all_paths)):
+        print(current)
+        r_list.append(current)
+    return r_list
+
+
+def depth_first_print_recursive(graph: Dict[str, List[str]],
+                                source: str,
+                                r_list: List[str],
+                                all_paths: bool = False,
+                                visited: Optional[Set[str]] = None
+                                ) -> List[str]:
+    """Depth first print recursive algo."""
+    if not all_paths:
+        if visited is None:
+            visited = set()
+        if source in visited:
+            return r_list
+        visited.add(source)
+    print(source)
+    r_list.append(source)
+    for neighbor in graph[source]:
+        depth_first_print_recursive(graph, neighbor, r_list, all_paths,
+                                    visited)
+    return r_list
+
+
+def depth_first_print_explicit_stack(graph: Dict[str, List[str]],
+                                     source: str,
+                                     r_list: List[str],
+                                     all_paths: bool = False) -> List[str]:
+    """Depth first print iterative algo, prints nodes in the same
+    order as depth_first_print_recursive without recursing."""
+    for current in visited_nodes(
+            depth_first_preorder_visits(graph, source, all_paths)):
+        print(current)
+        r_list.append(current)
+    return r_list
+
+
+# Breadth first traversal algo
+def breadth_first_print_iterative(graph: Dict[str, List[str]],
+                                  source: str,
+                                  all_paths: bool = False) -> List[str]:
+    """Breadth first print iterative algo."""
+    r_list: List[str] = list()
+    for current in visited_nodes(
+            breadth_first_visits(graph, source, all_paths)):
+        print(current)
+        r_list.append(current)
+    return r_list
+
+
+# CSR graph variants, these return the traversal order without printing
+# and track visited nodes in a bytearray by node id
+def csr_depth_first_traversal(graph: CSRGraph,
+                              source: str,
+                              all_paths: bool = False) -> List[str]:
+    """Depth first traversal iterative algo over a CSR graph,
+    visits nodes in the same order as depth_first_print_recursive."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    labels: Sequence[str] = graph.labels
+    visited: bytearray = bytearray(graph.node_count())
+    stack: Deque[int] = deque([graph.index[source]])
+    r_list: List[str] = list()
+    while stack:
+        current: int = stack.pop()
+        if not all_paths:
+            if visited[current]:
+                continue
+            visited[current] = 1
+        r_list.append(labels[current])
+        stack.extend(
+            reversed(neighbors[offsets[current]:offsets[current + 1]]))
+    return r_list
+
+
+def csr_breadth_first_traversal(graph: CSRGraph,
+                                source: str,
+                                all_paths: bool = False) -> List[str]:
+    """Breadth first traversal iterative algo over a CSR graph."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    labels: Sequence[str] = graph.labels
+    visited: bytearray = bytearray(graph.node_count())
+    visited[graph.index[source]] = 1
+    queue: Deque[int] = deque([graph.index[source]])
+    r_list: List[str] = list()
+    while queue:
+        current: int = queue.popleft()
+        r_list.append(labels[current])
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if not all_paths:
+                if visited[neighbor]:
+                    continue
+                visited[neighbor] = 1
+            queue.append(neighbor)
+    return r_list
+
+
+# TESTS, run with python -m graph_algos.depth_first_and_breadth_first_traversal
+if __name__ == "__main__":
+    TEST_GRAPH_1: List[str] = depth_first_print_iterative(GRAPH, "a")
+    assert TEST_GRAPH_1 == ["a", "b", "d", "f", "c", "e"]
+    print()
+
+    R_LIST: List[str] = list()
+    GRAPH_TEST_2 = depth_first_print_recursive(GRAPH, "a", R_LIST)
+    assert GRAPH_TEST_2 == ["a", "c", "e", "b", "d", "f"]
+    print()
+
+    GRAPH_TEST_4 = depth_first_print_explicit_stack(GRAPH, "a", list())
+    assert GRAPH_TEST_4 == GRAPH_TEST_2
+    print()
+
+    GRAPH_TEST_3: List[str] = breadth_first_print_iterative(GRAPH, "a")
+    assert GRAPH_TEST_3 == ["a", "c", "b", "e", "d", "f"]
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_adjacency(GRAPH)
+    assert csr_depth_first_traversal(CSR_GRAPH, "a") == GRAPH_TEST_2
+    assert csr_breadth_first_traversal(CSR_GRAPH, "a") == GRAPH_TEST_3
+
+    assert list(visited_nodes(depth_first_visits(GRAPH, "a"))) == TEST_GRAPH_1
+    assert list(visited_nodes(depth_first_preorder_visits(
+        GRAPH, "a"))) == GRAPH_TEST_2
+    assert list(visited_nodes(breadth_first_visits(
+        GRAPH, "a"))) == GRAPH_TEST_3
+    assert list(breadth_first_visits(GRAPH, "a"))[:4] == [
+        Visit("a", 0, None),
+        Visit("c", 1, "a"),
+        Visit("b", 1, "a"),
+        Visit("e", 2, "c"),
+    ]
+    TEST_WALK: Iterator[Visit] = depth_first_visits(GRAPH, "a")
+    assert next(TEST_WALK) == Visit("a", 0, None)
+    assert next(TEST_WALK) == Visit("b", 1, "a")
+
+    TEST_STREAM: io.StringIO = io.StringIO()
+    assert write_nodes(visited_nodes(breadth_first_visits(GRAPH, "a")),
+                       TEST_STREAM, 4) == 6
+    assert TEST_STREAM.getvalue() == "a\nc\nb\ne\nd\nf\n"
+
+    # A diamond reaches "z" along two paths, and "z" links back to "a"
+    DIAMOND_GRAPH: Dict[str, List[str]] = {
+        "a": ["b", "c"],
+        "b": ["z"],
+        "c": ["z"],
+        "z": ["a"],
+    }
+    CSR_DIAMOND_GRAPH: CSRGraph = CSRGraph.from_adjacency(DIAMOND_GRAPH)
+    with redirect_stdout(io.StringIO()):
+        assert depth_first_print_iterative(DIAMOND_GRAPH,
+                                           "a") == ["a", "c", "z", "b"]
+        assert depth_first_print_recursive(DIAMOND_GRAPH, "a",
+                                           list()) == ["a", "b", "z", "c"]
+        assert depth_first_print_explicit_stack(DIAMOND_GRAPH, "a",
+                                                list()) == ["a", "b", "z", "c"]
+        assert breadth_first_print_iterative(DIAMOND_GRAPH,
+                                             "a") == ["a", "b", "c", "z"]
+    assert csr_depth_first_traversal(CSR_DIAMOND_GRAPH,
+                                     "a") == ["a", "b", "z", "c"]
+    assert csr_breadth_first_traversal(CSR_DIAMOND_GRAPH,
+                                       "a") == ["a", "b", "c", "z"]
+    assert list(islice(visited_nodes(
+        breadth_first_visits(DIAMOND_GRAPH, "a", all_paths=True)), 6)) == [
+            "a", "b", "c", "z", "z", "a"
+        ]
+    assert csr_breadth_first_traversal(CSR_GRAPH, "a", all_paths=True) == (
+        GRAPH_TEST_3)
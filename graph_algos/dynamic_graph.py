@@ -0,0 +1,343 @@
+"""dynamic_graph.py"""
+from collections import deque
+from typing import Deque, Dict, Iterable, List, Optional, Sequence, Set
+from graph_algos.traversal_stats import TraversalStats
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ 1 ├─────┤ 0 ├─────┤ 5 │
+│   │     │   │     │   │
+└───┘     └─┬─┘     └─┬─┘
+            │         │
+            │         │
+            │         │
+            │         │
+            │         │
+          ┌─┴─┐       │
+          │   │       │
+          │ 8 ├───────┘
+          │   │
+          └───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ 2 ├─────┤ 3 │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  │         │
+  │       ┌─┴─┐
+  │       │   │
+  └───────┤ 4 │
+          │   │
+          └───┘
+"""
+
+GRAPH: Dict[str, List[str]] = {
+    "0": ["8", "1", "5"],
+    "1": ["0"],
+    "5": ["0", "8"],
+    "8": ["0", "5"],
+    "2": ["3", "4"],
+    "3": ["2", "4"],
+    "4": ["3", "2"],
+}
+
+# Keeping the components up to date
+"""
+add_edge("1", "2")      two components   relabel the smaller one
+                                         (2 3 4) into the larger one
+remove_edge("1", "2")   search from "1"  stops as soon as one side runs
+                        and "2" in turn  out of nodes, (2 3 4), which
+                                         becomes a new component
+remove_edge("0", "5")   search from "0"  the searches meet through "8",
+                        and "5" in turn  nothing to relabel
+
+A node is relabeled on insert only when its component at most doubles,
+so at most log2(n) times, and a delete only walks the smaller side of
+the split, or both sides up to the point where they meet.
+"""
+
+
+class DynamicGraph:
+    """Mutable undirected graph keeping its connected components, their
+    count and the largest component size up to date as nodes and
+    edges come and go, instead of recounting the whole graph after
+    every change."""
+
+    __slots__ = ("adjacency", "_components", "_members", "_size_counts",
+                 "_largest", "_next_label")
+
+    def __init__(self) -> None:
+        self.adjacency: Dict[str, Set[str]] = dict()
+        self._components: Dict[str, int] = dict()
+        self._members: Dict[int, Set[str]] = dict()
+        self._size_counts: Dict[int, int] = dict()
+        self._largest: int = 0
+        self._next_label: int = 0
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[str, List[str]]) -> "DynamicGraph":
+        """Builds the graph from a Dict[str, List[str]] adjacency list,
+        nodes without edges count as their own component."""
+        dynamic: DynamicGraph = cls()
+        for node, neighbors in graph.items():
+            dynamic.add_node(node)
+            for neighbor in neighbors:
+                dynamic.add_edge(node, neighbor)
+        return dynamic
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence[str]]) -> "DynamicGraph":
+        """Builds the graph from an edge list."""
+        dynamic: DynamicGraph = cls()
+        for edge in edges:
+            dynamic.add_edge(edge[0], edge[1])
+        return dynamic
+
+    def to_adjacency(self) -> Dict[str, List[str]]:
+        """Converts to the Dict[str, List[str]] adjacency list of the
+        course modules."""
+        return {
+            node: list(neighbors)
+            for node, neighbors in self.adjacency.items()
+        }
+
+    # Component size bookkeeping
+    def _add_size(self, size: int) -> None:
+        """Helper function counting a new component of size nodes."""
+        self._size_counts[size] = self._size_counts.get(size, 0) + 1
+        if size > self._largest:
+            self._largest = size
+
+    def _drop_size(self, size: int) -> None:
+        """Helper function forgetting a component of size nodes. When
+        it was the last of the largest size, the sizes below are tried
+        in turn, no further than the size of the components it was
+        split into or merged from."""
+        self._size_counts[size] -= 1
+        if self._size_counts[size] == 0:
+            del self._size_counts[size]
+            if size == self._largest:
+                while self._largest > 0 and (self._largest
+                                             not in self._size_counts):
+                    self._largest -= 1
+
+    def _new_component(self, nodes: Set[str]) -> None:
+        """Helper function labeling nodes as a new component."""
+        label: int = self._next_label
+        self._next_label += 1
+        self._members[label] = nodes
+        components: Dict[str, int] = self._components
+        for node in nodes:
+            components[node] = label
+        self._add_size(len(nodes))
+
+    # Updates
+    def add_node(self, node: str) -> None:
+        """Adds a node as its own component if it is not known yet."""
+        if node not in self.adjacency:
+            self.adjacency[node] = set()
+            self._new_component({node})
+
+    def add_edge(self, node_a: str, node_b: str) -> None:
+        """Adds an undirected edge, adding unknown nodes first. When it
+        joins two components the nodes of the smaller one are
+        relabeled into the larger one."""
+        self.add_node(node_a)
+        self.add_node(node_b)
+        self.adjacency[node_a].add(node_b)
+        self.adjacency[node_b].add(node_a)
+        label_a: int = self._components[node_a]
+        label_b: int = self._components[node_b]
+        if label_a == label_b:
+            return
+        members_a: Set[str] = self._members[label_a]
+        members_b: Set[str] = self._members[label_b]
+        if len(members_a) < len(members_b):
+            label_a, label_b = label_b, label_a
+            members_a, members_b = members_b, members_a
+        # Counted as merged before the larger one grows, so the
+        # largest size never has to be searched for here
+        self._add_size(len(members_a) + len(members_b))
+        self._drop_size(len(members_a))
+        self._drop_size(len(members_b))
+        components: Dict[str, int] = self._components
+        for node in members_b:
+            components[node] = label_a
+        members_a |= members_b
+        del self._members[label_b]
+
+    def remove_edge(self,
+                    node_a: str,
+                    node_b: str,
+                    stats: Optional[TraversalStats] = None) -> None:
+        """Removes an undirected edge, raising KeyError if there is
+        none. Breadth first searches from both ends take a node each in
+        turn until they meet, when the component is still connected,
+        or one of them runs out of nodes, which are then split off as
+        a new component."""
+        self.adjacency[node_a].remove(node_b)
+        if node_a == node_b:
+            return
+        self.adjacency[node_b].remove(node_a)
+        side: Optional[Set[str]] = self._split_side(node_a, node_b, stats)
+        if side is None:
+            return
+        label: int = self._components[node_a]
+        members: Set[str] = self._members[label]
+        size: int = len(members)
+        members -= side
+        # Counted as split before the old size is dropped, so the
+        # largest size is searched for no further than the larger part
+        self._add_size(len(members))
+        self._new_component(side)
+        self._drop_size(size)
+
+    def _split_side(self, node_a: str, node_b: str,
+                    stats: Optional[TraversalStats]) -> Optional[Set[str]]:
+        """Helper function searching from node_a and node_b in turn,
+        returning the nodes reached by the search that ran out first,
+        or None if the searches met."""
+        adjacency: Dict[str, Set[str]] = self.adjacency
+        visited_a: Set[str] = {node_a}
+        visited_b: Set[str] = {node_b}
+        queue_a: Deque[str] = deque([node_a])
+        queue_b: Deque[str] = deque([node_b])
+        while queue_a and queue_b:
+            for queue, visited, other in ((queue_a, visited_a, visited_b),
+                                          (queue_b, visited_b, visited_a)):
+                current: str = queue.popleft()
+                if stats is not None:
+                    stats.pop(len(queue) + 1, len(adjacency[current]))
+                for neighbor in adjacency[current]:
+                    if neighbor in other:
+                        return None
+                    if neighbor not in visited:
+                        visited.add(neighbor)
+                        queue.append(neighbor)
+        return visited_a if not queue_a else visited_b
+
+    def remove_node(self,
+                    node: str,
+                    stats: Optional[TraversalStats] = None) -> None:
+        """Removes a node and its edges, raising KeyError if there is
+        no such node. Every edge is removed in turn, so only the
+        pieces split off are searched."""
+        for neighbor in list(self.adjacency[node]):
+            self.remove_edge(node, neighbor, stats)
+        del self.adjacency[node]
+        label: int = self._components.pop(node)
+        del self._members[label]
+        self._drop_size(1)
+
+    # Queries
+    def same_component(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_a and node_b are connected."""
+        components: Dict[str, int] = self._components
+        if node_a not in components or node_b not in components:
+            return False
+        return components[node_a] == components[node_b]
+
+    def component_size(self, node: str) -> int:
+        """Returns the number of nodes in the component of a node."""
+        return len(self._members[self._components[node]])
+
+    def component_count(self) -> int:
+        """Returns the number of connected components."""
+        return len(self._members)
+
+    def largest_component_size(self) -> int:
+        """Returns the number of nodes in the largest component."""
+        return self._largest
+
+
+# TESTS, run with python -m graph_algos.dynamic_graph
+if __name__ == "__main__":
+    import random
+    from graph_algos.connected_components_count import (
+        ComponentLabels, breadth_first_component_labels)
+
+    def _check(dynamic: DynamicGraph) -> None:
+        """Compares every component against a full recount."""
+        labels: ComponentLabels = breadth_first_component_labels(
+            dynamic.to_adjacency())
+        assert dynamic.component_count() == labels.total
+        assert dynamic.largest_component_size() == max(labels.sizes,
+                                                       default=0)
+        for node, label in labels.components.items():
+            assert dynamic.component_size(node) == labels.sizes[label]
+
+    TEST_GRAPH: DynamicGraph = DynamicGraph.from_adjacency(GRAPH)
+    assert TEST_GRAPH.to_adjacency().keys() == GRAPH.keys()
+    assert TEST_GRAPH.component_count() == 2
+    assert TEST_GRAPH.largest_component_size() == 4
+    assert TEST_GRAPH.same_component("1", "8")
+    assert not TEST_GRAPH.same_component("1", "2")
+
+    TEST_GRAPH.add_edge("1", "2")
+    assert TEST_GRAPH.component_count() == 1
+    assert TEST_GRAPH.largest_component_size() == 7
+
+    # The search from "2" runs out after the 3 nodes of its side
+    TEST_STATS: TraversalStats = TraversalStats()
+    TEST_GRAPH.remove_edge("1", "2", TEST_STATS)
+    assert TEST_GRAPH.component_count() == 2
+    assert TEST_GRAPH.largest_component_size() == 4
+    assert TEST_GRAPH.component_size("3") == 3
+    assert TEST_STATS.nodes_popped <= 6
+
+    # Still connected through "8"
+    TEST_GRAPH.remove_edge("0", "5")
+    assert TEST_GRAPH.component_count() == 2
+    assert TEST_GRAPH.same_component("0", "5")
+
+    TEST_GRAPH.remove_node("0")
+    assert TEST_GRAPH.component_count() == 3
+    assert TEST_GRAPH.largest_component_size() == 3
+    assert TEST_GRAPH.component_size("1") == 1
+    assert not TEST_GRAPH.same_component("0", "1")
+    _check(TEST_GRAPH)
+    try:
+        TEST_GRAPH.remove_edge("1", "5")
+        assert False
+    except KeyError:
+        pass
+
+    TEST_GRAPH.add_edge("x", "x")
+    TEST_GRAPH.remove_edge("x", "x")
+    assert TEST_GRAPH.component_size("x") == 1
+    TEST_GRAPH.add_node("y")
+    assert TEST_GRAPH.component_count() == 5
+    _check(TEST_GRAPH)
+
+    # Random inserts and deletes against a full recount
+    TEST_RNG: random.Random = random.Random(0)
+    TEST_GRAPH = DynamicGraph()
+    for _ in range(2000):
+        TEST_NODES: List[str] = list(TEST_GRAPH.adjacency)
+        TEST_ROLL: float = TEST_RNG.random()
+        if TEST_ROLL < 0.55 or len(TEST_NODES) < 2:
+            TEST_GRAPH.add_edge(str(TEST_RNG.randrange(60)),
+                                str(TEST_RNG.randrange(60)))
+        elif TEST_ROLL < 0.95:
+            TEST_NODE: str = TEST_RNG.choice(TEST_NODES)
+            if TEST_GRAPH.adjacency[TEST_NODE]:
+                TEST_GRAPH.remove_edge(
+                    TEST_NODE,
+                    TEST_RNG.choice(sorted(TEST_GRAPH.adjacency[TEST_NODE])))
+        else:
+            TEST_GRAPH.remove_node(TEST_RNG.choice(TEST_NODES))
+        _check(TEST_GRAPH)
+    TEST_GRAPH = DynamicGraph.from_edges([])
+    assert TEST_GRAPH.component_count() == 0
+    assert TEST_GRAPH.largest_component_size() == 0
@@ -0,0 +1,242 @@
+"""edge_reader.py"""
+import os
+import tempfile
+from array import array
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Deque, Dict, Iterator, List, Optional, Tuple
+from graph_algos.csr_graph import CSRGraph
+
+# Reading an edge file in blocks that end on a line boundary
+"""
+file:    a b\\nb c\\nc d\\nd e\\ne f\\n
+blocks:  [a b\\nb c\\nc d\\n] [d e\\ne f\\n]
+             └ seek to block_size, then read to the end of the line
+
+Every block holds whole lines, so blocks can be parsed on their own,
+in this process or in a pool of worker processes. Labels are interned
+to integer ids as they are read, so only two int32 ids per edge are
+kept until the CSR graph is built.
+"""
+
+# Edge list, as written to the test file
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+]
+
+BLOCK_SIZE: int = 1 << 22
+
+# Labels of a block and its edges as pairs of ids into them
+Block = Tuple[List[str], "array[int]"]
+
+
+def _blocks(path: str, block_size: int) -> Iterator[Tuple[int, int]]:
+    """Helper function yielding the byte ranges of the blocks of a
+    file, each one ending on a line boundary."""
+    size: int = os.path.getsize(path)
+    with open(path, "rb") as handle:
+        start: int = 0
+        while start < size:
+            handle.seek(min(start + block_size, size))
+            handle.readline()
+            yield start, handle.tell()
+            start = handle.tell()
+
+
+def _is_weight(field: str) -> bool:
+    """Helper function returning True if a field reads as a number."""
+    try:
+        float(field)
+    except ValueError:
+        return False
+    return True
+
+
+def _tokens(data: bytes, delimiter: Optional[str],
+            comments: str) -> List[str]:
+    """Helper function splitting the lines of a block into labels,
+    skipping blank lines and lines starting with comments. Lines are
+    split on whitespace, or on delimiter with the labels stripped, and
+    must hold exactly two labels, optionally followed by a number, the
+    edge weight of weighted_path, which is dropped."""
+    text: str = data.decode()
+    has_comments: bool = bool(comments) and comments in text
+    tokens: List[str] = list()
+    for line in text.splitlines():
+        fields: List[str] = line.split(delimiter)
+        if len(fields) == 3 and _is_weight(fields[2]):
+            del fields[2]
+        if len(fields) == 2 and not (
+                has_comments and line.lstrip().startswith(comments)):
+            if delimiter is None:
+                tokens.extend(fields)
+            else:
+                tokens.append(fields[0].strip())
+                tokens.append(fields[1].strip())
+            continue
+        stripped: str = line.strip()
+        if not stripped or (has_comments and stripped.startswith(comments)):
+            continue
+        raise ValueError(
+            "Edge file line {!r} does not hold two labels".format(line))
+    return tokens
+
+
+def _parse_block(path: str, start: int, end: int, delimiter: Optional[str],
+                 comments: str) -> Block:
+    """Worker function reading the bytes [start, end) of path and
+    interning their labels to block local ids."""
+    with open(path, "rb") as handle:
+        handle.seek(start)
+        data: bytes = handle.read(end - start)
+    index: Dict[str, int] = dict()
+    ids: "array[int]" = array("i", [
+        index.setdefault(token, len(index))
+        for token in _tokens(data, delimiter, comments)
+    ])
+    return list(index), ids
+
+
+def iter_edges(path: str,
+               block_size: int = BLOCK_SIZE,
+               delimiter: Optional[str] = None,
+               comments: str = "#") -> Iterator[List[str]]:
+    """Yields the edges of an edge file one [a, b] pair at a time,
+    holding one block in memory, so it can feed _build_graph or
+    CSRGraph.from_edges without a list of every edge."""
+    with open(path, "rb") as handle:
+        for start, end in _blocks(path, block_size):
+            handle.seek(start)
+            tokens: List[str] = _tokens(handle.read(end - start), delimiter,
+                                        comments)
+            for position in range(0, len(tokens), 2):
+                yield tokens[position:position + 2]
+
+
+def read_graph(path: str,
+               block_size: int = BLOCK_SIZE,
+               delimiter: Optional[str] = None,
+               comments: str = "#",
+               workers: int = 0,
+               dedupe: bool = False,
+               drop_self_loops: bool = False) -> CSRGraph:
+    """Reads an undirected edge file of two labels per line,
+    separated by whitespace or by delimiter and optionally followed by
+    an ignored edge weight, into a CSR graph. The file is parsed in
+    blocks of about block_size bytes, in a pool of workers processes
+    when workers is more than 1. Node ids follow the order labels
+    first appear in the file either way, so the graph matches
+    CSRGraph.from_edges on the same edges."""
+    labels: List[str] = list()
+    index: Dict[str, int] = dict()
+    sources: "array[int]" = array("i")
+    targets: "array[int]" = array("i")
+
+    def merge(block: Block) -> None:
+        """Maps block local ids to graph ids."""
+        block_labels, block_ids = block
+        translation: List[int] = list()
+        for label in block_labels:
+            if label not in index:
+                index[label] = len(labels)
+                labels.append(label)
+            translation.append(index[label])
+        ids: "array[int]" = array("i",
+                                  map(translation.__getitem__, block_ids))
+        sources.extend(ids[0::2])
+        targets.extend(ids[1::2])
+
+    if workers > 1:
+        # Keep a couple of blocks per worker in flight, in file order
+        with ProcessPoolExecutor(workers) as executor:
+            pending: Deque["Future[Block]"] = deque()
+            for start, end in _blocks(path, block_size):
+                pending.append(
+                    executor.submit(_parse_block, path, start, end,
+                                    delimiter, comments))
+                if len(pending) >= 2 * workers:
+                    merge(pending.popleft().result())
+            while pending:
+                merge(pending.popleft().result())
+    else:
+        for start, end in _blocks(path, block_size):
+            merge(_parse_block(path, start, end, delimiter, comments))
+    return CSRGraph.from_id_pairs(labels, sources, targets, dedupe,
+                                  drop_self_loops, index)
+
+
+def read_adjacency(path: str,
+                   block_size: int = BLOCK_SIZE,
+                   delimiter: Optional[str] = None,
+                   comments: str = "#",
+                   workers: int = 0) -> Dict[str, List[str]]:
+    """Reads an undirected edge file into the same Dict[str, List[str]]
+    adjacency list _build_graph builds, every label being one shared
+    string object."""
+    return read_graph(path, block_size, delimiter, comments,
+                      workers).to_adjacency()
+
+
+# TESTS, guarded so worker processes that import this module do not
+# start pools of their own
+if __name__ == "__main__":
+    from graph_algos.shortest_path import _build_graph
+
+    with tempfile.TemporaryDirectory() as TEST_DIRECTORY:
+        TEST_PATH: str = os.path.join(TEST_DIRECTORY, "edges.txt")
+        with open(TEST_PATH, "w") as TEST_HANDLE:
+            TEST_HANDLE.write("# comment\n\n")
+            TEST_HANDLE.write("".join(a + " " + b + "\r\n" for a, b in EDGES))
+        TEST_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES)
+        for TEST_BLOCK_SIZE in (1, 7, BLOCK_SIZE):
+            assert list(iter_edges(TEST_PATH, TEST_BLOCK_SIZE)) == EDGES
+            for TEST_WORKERS in (0, 2):
+                TEST_READ: CSRGraph = read_graph(TEST_PATH, TEST_BLOCK_SIZE,
+                                                 workers=TEST_WORKERS)
+                assert TEST_READ.labels == TEST_GRAPH.labels
+                assert TEST_READ.offsets == TEST_GRAPH.offsets
+                assert TEST_READ.neighbors == TEST_GRAPH.neighbors
+        assert read_adjacency(TEST_PATH) == _build_graph(EDGES)
+        assert _build_graph(iter_edges(TEST_PATH)) == _build_graph(EDGES)
+
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "edges.csv")
+        with open(TEST_PATH, "w") as TEST_HANDLE:
+            TEST_HANDLE.write("".join(a + "," + b + "\n" for a, b in EDGES))
+            TEST_HANDLE.write("w,x")
+        assert read_adjacency(TEST_PATH, 5, ",", workers=2) == _build_graph(
+            EDGES + [["w", "x"]])
+        assert read_graph(TEST_PATH, delimiter=",",
+                          dedupe=True).edge_count() == 2 * len(EDGES)
+
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "broken.txt")
+        for TEST_TEXT, TEST_DELIMITER in (("a b\nc\n", None),
+                                          ("a b c\nd e f\n", None),
+                                          ("a,b,c\n", ",")):
+            with open(TEST_PATH, "w") as TEST_HANDLE:
+                TEST_HANDLE.write(TEST_TEXT)
+            try:
+                read_graph(TEST_PATH, delimiter=TEST_DELIMITER)
+                assert False
+            except ValueError:
+                pass
+
+        # Weight columns are dropped, other third columns are not
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "weighted.txt")
+        with open(TEST_PATH, "w") as TEST_HANDLE:
+            TEST_HANDLE.write("w x 1\nx y 2.5\n")
+        assert list(iter_edges(TEST_PATH)) == [["w", "x"], ["x", "y"]]
+
+        # Delimited labels keep their inner spaces
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "spaces.csv")
+        with open(TEST_PATH, "w") as TEST_HANDLE:
+            TEST_HANDLE.write("new york, los angeles\nlos angeles,reno\n")
+        assert list(iter_edges(TEST_PATH, delimiter=",")) == [
+            ["new york", "los angeles"], ["los angeles", "reno"]
+        ]
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "empty.txt")
+        open(TEST_PATH, "w").close()
+        assert read_graph(TEST_PATH).node_count() == 0
@@ -0,0 +1,197 @@
+"""frontier_bfs.py"""
+from array import array
+from typing import TYPE_CHECKING, List, NamedTuple, Optional
+from graph_algos.csr_graph import CSRGraph
+
+# NumPy is imported on the first search, not with this module
+if TYPE_CHECKING:  # pragma: no cover
+    import numpy as np
+
+# Expanding a whole frontier per step instead of one node per pop
+"""
+top-down:   for every frontier node, gather its neighbor slice,
+            keep the unvisited neighbors, dedupe them into the next
+            frontier                      cost ~ edges of the frontier
+
+bottom-up:  for every unvisited node, gather its neighbor slice,
+            keep the nodes with a neighbor in the frontier
+                                          cost ~ edges of unvisited nodes
+
+Bottom-up wins once the frontier holds most of the remaining edges,
+top-down wins again when the frontier shrinks. The two thresholds
+apply one direction each, so a search does not flip back and forth
+on levels close to both:
+
+top-down ── frontier edges > unvisited edges / ALPHA ──► bottom-up
+top-down ◄──── frontier nodes < node count / BETA ────── bottom-up
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+    ["o", "n"],
+]
+
+# Switch to bottom-up once the frontier holds more than 1/ALPHA of the
+# unvisited edges, back to top-down once it holds less than 1/BETA of
+# the nodes
+ALPHA: int = 14
+BETA: int = 24
+
+
+class FrontierSearch(NamedTuple):
+    """Breadth first search result indexed by node id. levels holds
+    the edge count from the source or -1, parents the node the search
+    reached each node from, -1 for the source and unreached nodes as
+    in shortest_path._trace_parents, and reachable 1 for every node
+    reached."""
+    levels: "array[int]"
+    parents: "array[int]"
+    reachable: bytearray
+
+
+def frontier_breadth_first(graph: CSRGraph,
+                           source: str,
+                           direction_optimizing: bool = True
+                           ) -> FrontierSearch:
+    """Level-synchronous breadth first search over a CSR graph,
+    expanding the whole frontier with NumPy operations when NumPy is
+    installed and switching between top-down and bottom-up steps when
+    direction_optimizing is set. Falls back to a pure Python top-down
+    search otherwise."""
+    try:
+        import numpy  # noqa: F401
+    except ImportError:  # pragma: no cover
+        return _python_breadth_first(graph, graph.index[source])
+    return _numpy_breadth_first(graph, graph.index[source],
+                                direction_optimizing)
+
+
+def _python_breadth_first(graph: CSRGraph, source: int) -> FrontierSearch:
+    """Helper function running a top-down level-synchronous search."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    node_count: int = graph.node_count()
+    levels: "array[int]" = array("i", [-1]) * node_count
+    parents: "array[int]" = array("i", [-1]) * node_count
+    levels[source] = 0
+    frontier: List[int] = [source]
+    level: int = 0
+    while frontier:
+        level += 1
+        next_frontier: List[int] = list()
+        for current in frontier:
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if levels[neighbor] == -1:
+                    levels[neighbor] = level
+                    parents[neighbor] = current
+                    next_frontier.append(neighbor)
+        frontier = next_frontier
+    reachable: bytearray = bytearray(level != -1 for level in levels)
+    return FrontierSearch(levels, parents, reachable)
+
+
+def _gather(offsets: "np.ndarray", degrees: "np.ndarray",
+            nodes: "np.ndarray") -> "np.ndarray":
+    """Helper function returning the positions in the neighbor buffer
+    of every neighbor of nodes, slice after slice."""
+    import numpy as np
+    counts = degrees[nodes]
+    ends = np.cumsum(counts)
+    return np.repeat(offsets[nodes] - ends + counts, counts) + np.arange(
+        ends[-1] if len(ends) else 0)
+
+
+def _numpy_breadth_first(graph: CSRGraph,
+                         source: int,
+                         direction_optimizing: bool,
+                         directions: Optional[List[bool]] = None
+                         ) -> FrontierSearch:
+    """Helper function running the vectorized search, appending True
+    to directions for every bottom-up level and False for every
+    top-down one."""
+    import numpy as np
+    offsets = np.frombuffer(graph.offsets, dtype=np.int32).astype(np.int64)
+    neighbors = np.frombuffer(graph.neighbors, dtype=np.int32)
+    degrees = np.diff(offsets)
+    node_count: int = graph.node_count()
+    levels = np.full(node_count, -1, dtype=np.int32)
+    parents = np.full(node_count, -1, dtype=np.int32)
+    levels[source] = 0
+    frontier = np.array([source], dtype=np.int64)
+    unvisited_edges: int = len(neighbors) - int(degrees[source])
+    level: int = 0
+    bottom_up: bool = False
+    while len(frontier):
+        level += 1
+        if bottom_up:
+            bottom_up = len(frontier) * BETA >= node_count
+        elif direction_optimizing:
+            bottom_up = int(degrees[frontier].sum()) * ALPHA > unvisited_edges
+        if directions is not None:
+            directions.append(bottom_up)
+        if bottom_up:
+            # Every unvisited node looks for a neighbor in the frontier
+            in_frontier = np.zeros(node_count, dtype=bool)
+            in_frontier[frontier] = True
+            unvisited = np.flatnonzero(levels == -1)
+            positions = _gather(offsets, degrees, unvisited)
+            hits = np.flatnonzero(in_frontier[neighbors[positions]])
+            owners = np.repeat(unvisited, degrees[unvisited])[hits]
+            frontier, first = np.unique(owners, return_index=True)
+            parents[frontier] = neighbors[positions[hits[first]]]
+        else:
+            # Every frontier node pushes to its unvisited neighbors
+            positions = _gather(offsets, degrees, frontier)
+            reached = neighbors[positions]
+            fresh = np.flatnonzero(levels[reached] == -1)
+            owners = np.repeat(frontier, degrees[frontier])[fresh]
+            frontier, first = np.unique(reached[fresh], return_index=True)
+            parents[frontier] = owners[first]
+        levels[frontier] = level
+        unvisited_edges -= int(degrees[frontier].sum())
+    return FrontierSearch(array("i", levels.tobytes()),
+                          array("i", parents.tobytes()),
+                          bytearray((levels >= 0).astype(np.uint8).tobytes()))
+
+
+# TESTS, run with python -m graph_algos.frontier_bfs
+if __name__ == "__main__":
+    TEST_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES)
+    TEST_LEVELS: List[int] = [0, 1, 2, 2, 1, -1, -1]
+    for TEST_SEARCH in (_python_breadth_first(TEST_GRAPH, 0),
+                        frontier_breadth_first(TEST_GRAPH, "w", False),
+                        frontier_breadth_first(TEST_GRAPH, "w")):
+        assert list(TEST_SEARCH.levels) == TEST_LEVELS
+        assert list(TEST_SEARCH.reachable) == [1, 1, 1, 1, 1, 0, 0]
+        assert TEST_SEARCH.parents[0] == -1
+        assert TEST_SEARCH.parents[TEST_GRAPH.index["y"]] == (
+            TEST_GRAPH.index["x"])
+        assert TEST_SEARCH.parents[TEST_GRAPH.index["o"]] == -1
+
+    # Preferential attachment, a few hubs hold most of the edges: the
+    # search turns bottom-up once the hubs are reached and top-down
+    # again only for the few nodes left at the end
+    import random
+    TEST_RNG: random.Random = random.Random(0)
+    TEST_ENDPOINTS: List[int] = [0, 1]
+    TEST_EDGES: List[List[str]] = [["0", "1"]]
+    for TEST_NODE in range(2, 20000):
+        for TEST_TARGET in {TEST_RNG.choice(TEST_ENDPOINTS) for _ in "ab"}:
+            TEST_EDGES.append([str(TEST_NODE), str(TEST_TARGET)])
+            TEST_ENDPOINTS += [TEST_NODE, TEST_TARGET]
+    TEST_GRAPH = CSRGraph.from_edges(TEST_EDGES)
+    TEST_DIRECTIONS: List[bool] = list()
+    TEST_SEARCH = _numpy_breadth_first(TEST_GRAPH, TEST_GRAPH.index["19999"],
+                                       True, TEST_DIRECTIONS)
+    assert TEST_DIRECTIONS == [False] * 4 + [True] * 4 + [False]
+    assert TEST_SEARCH.levels == _python_breadth_first(
+        TEST_GRAPH, TEST_GRAPH.index["19999"]).levels
+    for TEST_ID, TEST_PARENT in enumerate(TEST_SEARCH.parents):
+        if TEST_PARENT != -1:
+            assert TEST_SEARCH.levels[TEST_PARENT] == (
+                TEST_SEARCH.levels[TEST_ID] - 1)
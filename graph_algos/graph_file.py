@@ -0,0 +1,263 @@
+"""graph_file.py"""
+import mmap
+import os
+import struct
+import sys
+import tempfile
+from array import array
+from typing import Dict, Iterator, List, Mapping, Sequence, overload
+from graph_algos.csr_graph import CSRGraph
+
+# Binary CSR file layout, little-endian, every section 8-byte aligned
+"""
+header          magic "GRAPHCSR", version, node count, edge count,
+                label bytes
+offsets         int32 x (nodes + 1)    neighbors of id i are
+neighbors       int32 x edges          neighbors[offsets[i]:offsets[i + 1]]
+label offsets   int64 x (nodes + 1)    label i is the UTF-8 bytes
+labels          UTF-8 bytes            labels[label_offsets[i]:...[i + 1]]
+label order     int32 x nodes          node ids sorted by label bytes,
+                                       for binary search lookups
+
+Loading maps the file and casts memoryviews over these sections, so
+nothing is parsed or copied and every process mapping the file
+shares the same pages.
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+]
+
+MAGIC: bytes = b"GRAPHCSR"
+VERSION: int = 1
+_HEADER: struct.Struct = struct.Struct("<8sIIQQQ")
+
+
+def _layout(nodes: int, edges: int, label_bytes: int) -> List[int]:
+    """Helper function returning the start of every section and the
+    file size."""
+    sizes: List[int] = [
+        _HEADER.size, 4 * (nodes + 1), 4 * edges, 8 * (nodes + 1),
+        label_bytes, 4 * nodes
+    ]
+    starts: List[int] = list()
+    position: int = 0
+    for size in sizes:
+        starts.append(position)
+        position += -(-size // 8) * 8
+    starts.append(position)
+    return starts[1:]
+
+
+def _little_endian(values: "array[int]") -> bytes:
+    """Helper function returning the bytes of an array in file byte
+    order."""
+    if sys.byteorder == "little":
+        return values.tobytes()
+    swapped: "array[int]" = array(values.typecode, values)
+    swapped.byteswap()
+    return swapped.tobytes()
+
+
+def write_graph(path: str, graph: CSRGraph) -> None:
+    """Writes a CSR graph to path in the binary layout above."""
+    encoded: List[bytes] = [label.encode() for label in graph.labels]
+    label_offsets: "array[int]" = array("q", [0])
+    for label in encoded:
+        label_offsets.append(label_offsets[-1] + len(label))
+    label_order: "array[int]" = array(
+        "i", sorted(range(len(encoded)), key=encoded.__getitem__))
+    nodes: int = graph.node_count()
+    edges: int = graph.edge_count()
+    starts: List[int] = _layout(nodes, edges, label_offsets[-1])
+    sections: List[bytes] = [
+        _little_endian(array("i", graph.offsets)),
+        _little_endian(array("i", graph.neighbors)),
+        _little_endian(label_offsets), b"".join(encoded),
+        _little_endian(label_order)
+    ]
+    with open(path, "wb") as handle:
+        handle.write(
+            _HEADER.pack(MAGIC, VERSION, 0, nodes, edges, label_offsets[-1]))
+        for start, section in zip(starts, sections):
+            handle.write(bytes(start - handle.tell()))
+            handle.write(section)
+        handle.write(bytes(starts[-1] - handle.tell()))
+
+
+def write_adjacency(path: str, graph: Dict[str, List[str]]) -> None:
+    """Writes a Dict[str, List[str]] adjacency list to path, keeping
+    its node and neighbor order."""
+    write_graph(path, CSRGraph.from_adjacency(graph))
+
+
+class LabelTable(Sequence[str]):
+    """Node labels read from the label section of a graph file, a
+    label is only decoded when it is looked up."""
+
+    __slots__ = ("_offsets", "_data")
+
+    def __init__(self, offsets: memoryview, data: memoryview) -> None:
+        self._offsets: memoryview = offsets
+        self._data: memoryview = data
+
+    @overload
+    def __getitem__(self, node_id: int) -> str:
+        ...
+
+    @overload
+    def __getitem__(self, node_id: slice) -> List[str]:
+        ...
+
+    def __getitem__(self, node_id: object) -> object:
+        if isinstance(node_id, slice):
+            return [self[i] for i in range(*node_id.indices(len(self)))]
+        assert isinstance(node_id, int)
+        if node_id < 0:
+            node_id += len(self)
+        if not 0 <= node_id < len(self):
+            raise IndexError("node id out of range")
+        return bytes(self._data[self._offsets[node_id]:self._offsets[
+            node_id + 1]]).decode()
+
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+
+
+class LabelIndex(Mapping[str, int]):
+    """Label to node id lookups by binary search over the label
+    order section of a graph file, so no dict is built on load."""
+
+    __slots__ = ("_offsets", "_data", "_order")
+
+    def __init__(self, offsets: memoryview, data: memoryview,
+                 order: memoryview) -> None:
+        self._offsets: memoryview = offsets
+        self._data: memoryview = data
+        self._order: memoryview = order
+
+    def __getitem__(self, label: str) -> int:
+        key: bytes = label.encode()
+        offsets: memoryview = self._offsets
+        data: memoryview = self._data
+        order: memoryview = self._order
+        low: int = 0
+        high: int = len(order)
+        while low < high:
+            middle: int = (low + high) // 2
+            node_id: int = order[middle]
+            if bytes(data[offsets[node_id]:offsets[node_id + 1]]) < key:
+                low = middle + 1
+            else:
+                high = middle
+        if low < len(order):
+            node_id = order[low]
+            if bytes(data[offsets[node_id]:offsets[node_id + 1]]) == key:
+                return node_id
+        raise KeyError(label)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(LabelTable(self._offsets, self._data))
+
+    def __len__(self) -> int:
+        return len(self._order)
+
+
+def _native(view: memoryview, start: int, length: int,
+            typecode: str) -> memoryview:
+    """Helper function returning a section of the file as bytes in
+    native byte order, big-endian machines pay for a swapped copy."""
+    section: memoryview = view[start:start + length]
+    if sys.byteorder == "little":
+        return section
+    swapped: "array[int]" = array(typecode, bytes(section))
+    swapped.byteswap()
+    return memoryview(swapped.tobytes())
+
+
+def load_graph(path: str) -> CSRGraph:
+    """Memory-maps a graph file written by write_graph and returns a
+    CSR graph whose buffers are memoryviews over the mapping, in
+    milliseconds whatever the file size. NumPy arrays over the same
+    pages come from numpy.frombuffer(graph.offsets, numpy.int32). The
+    mapping stays open as long as the graph is referenced."""
+    with open(path, "rb") as handle:
+        size: int = os.fstat(handle.fileno()).st_size
+        if size < _HEADER.size:
+            raise ValueError("{} is not a graph file".format(path))
+        mapped: mmap.mmap = mmap.mmap(handle.fileno(), 0,
+                                      access=mmap.ACCESS_READ)
+    view: memoryview = memoryview(mapped)
+    magic, version, _, nodes, edges, label_bytes = _HEADER.unpack_from(view)
+    if magic != MAGIC or version != VERSION:
+        raise ValueError("{} is not a version {} graph file".format(
+            path, VERSION))
+    starts: List[int] = _layout(nodes, edges, label_bytes)
+    if size != starts[-1]:
+        raise ValueError("{} is {} bytes, expected {}".format(
+            path, size, starts[-1]))
+    offsets: memoryview = _native(view, starts[0], 4 * (nodes + 1),
+                                  "i").cast("i")
+    neighbors: memoryview = _native(view, starts[1], 4 * edges,
+                                    "i").cast("i")
+    label_offsets: memoryview = _native(view, starts[2], 8 * (nodes + 1),
+                                        "q").cast("q")
+    data: memoryview = view[starts[3]:starts[3] + label_bytes]
+    order: memoryview = _native(view, starts[4], 4 * nodes, "i").cast("i")
+    return CSRGraph(LabelTable(label_offsets, data), offsets, neighbors,
+                    LabelIndex(label_offsets, data, order))
+
+
+def load_adjacency(path: str) -> Dict[str, List[str]]:
+    """Loads a graph file as a Dict[str, List[str]] adjacency list."""
+    return load_graph(path).to_adjacency()
+
+
+# TESTS, run with python -m graph_algos.graph_file
+if __name__ == "__main__":
+    from graph_algos.has_path import csr_breadth_first_has_path
+    from graph_algos.shortest_path import csr_breadth_first_shortest_path
+
+    TEST_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES + [["é", "日本"]])
+    with tempfile.TemporaryDirectory() as TEST_DIRECTORY:
+        TEST_PATH: str = os.path.join(TEST_DIRECTORY, "graph.csr")
+        write_graph(TEST_PATH, TEST_GRAPH)
+        assert os.path.getsize(TEST_PATH) % 8 == 0
+        TEST_LOADED: CSRGraph = load_graph(TEST_PATH)
+        assert list(TEST_LOADED.labels) == TEST_GRAPH.labels
+        assert TEST_LOADED.labels[-1] == "日本"
+        assert TEST_LOADED.labels[1:3] == ["x", "y"]
+        assert TEST_LOADED.offsets == TEST_GRAPH.offsets
+        assert TEST_LOADED.neighbors == TEST_GRAPH.neighbors
+        assert dict(TEST_LOADED.index) == TEST_GRAPH.index
+        assert "missing" not in TEST_LOADED.index
+        assert TEST_LOADED.to_adjacency() == TEST_GRAPH.to_adjacency()
+        assert csr_breadth_first_shortest_path(TEST_LOADED, "w", "y") == 2
+        assert not csr_breadth_first_has_path(TEST_LOADED, "w", "é")
+
+        # Adjacency lists round trip with their node and neighbor order
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "adjacency.csr")
+        write_adjacency(TEST_PATH, {"b": ["a"], "a": ["c", "b"], "c": []})
+        assert load_adjacency(TEST_PATH) == {
+            "b": ["a"],
+            "a": ["c", "b"],
+            "c": [],
+        }
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "empty.csr")
+        write_adjacency(TEST_PATH, dict())
+        assert load_graph(TEST_PATH).node_count() == 0
+
+        TEST_PATH = os.path.join(TEST_DIRECTORY, "text.csr")
+        with open(TEST_PATH, "wb") as TEST_HANDLE:
+            TEST_HANDLE.write(b"not a graph file, but long enough")
+        try:
+            load_graph(TEST_PATH)
+            assert False
+        except ValueError:
+            pass
+        del TEST_LOADED
@@ -0,0 +1,161 @@
+"""graph_index.py"""
+from array import array
+from typing import Iterable, List, Sequence
+from graph_algos.csr_graph import CSRGraph
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ w ├─────┤ x ├─────┤ y │
+│   │     │   │     │   │
+└─┬─┘     └───┘     └─┬─┘
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │       ┌───┐     ┌─┴─┐
+  │       │   │     │   │
+  └───────┤ v ├─────┤ z │
+          │   │     │   │
+          └───┘     └───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ o ├─────┤ n │
+│   │     │   │
+└───┘     └───┘
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+    ["o", "n"],
+]
+
+# Largest value a generation stamp can hold before the marks are reset
+_MAX_GENERATION: int = 2**32 - 1
+
+
+class GraphIndex:
+    """Builds an undirected graph once and answers repeated has-path
+    and shortest-path queries against it. Visited marks, distances
+    and the queue are allocated once and reused by every query, a
+    node counts as visited when its mark equals the generation of
+    the current query, so no per-query clearing is needed."""
+
+    def __init__(self, graph: CSRGraph) -> None:
+        node_count: int = graph.node_count()
+        self.graph: CSRGraph = graph
+        self._marks: "array[int]" = array("I", bytes(4 * node_count))
+        self._distances: "array[int]" = array("i", bytes(4 * node_count))
+        self._queue: "array[int]" = array("i", bytes(4 * node_count))
+        self._generation: int = 0
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence[str]]) -> "GraphIndex":
+        """Builds the index from an undirected edge list."""
+        return cls(CSRGraph.from_edges(edges))
+
+    def _next_generation(self) -> int:
+        """Starts a new query, resetting the marks only when the
+        generation stamp wraps around."""
+        if self._generation == _MAX_GENERATION:
+            self._marks = array("I", bytes(4 * self.graph.node_count()))
+            self._generation = 0
+        self._generation += 1
+        return self._generation
+
+    def _breadth_first_count(self, src: int, dst: int) -> int:
+        """Breadth first edge count over the reusable scratch arrays.
+        Returns shortest amount of edges between two node ids, or -1
+        if components are not connected."""
+        offsets = self.graph.offsets
+        neighbors = self.graph.neighbors
+        marks: "array[int]" = self._marks
+        distances: "array[int]" = self._distances
+        queue: "array[int]" = self._queue
+        generation: int = self._next_generation()
+        marks[src] = generation
+        distances[src] = 0
+        queue[0] = src
+        head: int = 0
+        tail: int = 1
+        while head < tail:
+            current: int = queue[head]
+            head += 1
+            if current == dst:
+                return distances[current]
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if marks[neighbor] == generation:
+                    continue
+                marks[neighbor] = generation
+                distances[neighbor] = distances[current] + 1
+                queue[tail] = neighbor
+                tail += 1
+        return -1
+
+    def distances_from(self, node_a: str) -> "array[int]":
+        """Returns the number of edges from node_a to every node id,
+        -1 for nodes in other components."""
+        offsets = self.graph.offsets
+        neighbors = self.graph.neighbors
+        distances: "array[int]" = array("i", [-1]) * self.graph.node_count()
+        queue: "array[int]" = self._queue
+        src: int = self.graph.index[node_a]
+        distances[src] = 0
+        queue[0] = src
+        head: int = 0
+        tail: int = 1
+        while head < tail:
+            current: int = queue[head]
+            head += 1
+            for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+                if distances[neighbor] == -1:
+                    distances[neighbor] = distances[current] + 1
+                    queue[tail] = neighbor
+                    tail += 1
+        return distances
+
+    def has_path(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_b is reachable from node_a."""
+        return self.shortest_path(node_a, node_b) != -1
+
+    def shortest_path(self, node_a: str, node_b: str) -> int:
+        """Returns the number of edges on the shortest path from
+        node_a to node_b, or -1 if components are not connected."""
+        if node_a == node_b:
+            return 0
+        index = self.graph.index
+        if node_a not in index or node_b not in index:
+            return -1
+        return self._breadth_first_count(index[node_a], index[node_b])
+
+
+# TESTS, run with python -m graph_algos.graph_index
+if __name__ == "__main__":
+    TEST_INDEX: GraphIndex = GraphIndex.from_edges(EDGES)
+    for _ in range(3):
+        assert TEST_INDEX.shortest_path("w", "z") == 2
+        assert TEST_INDEX.shortest_path("x", "v") == 2
+        assert TEST_INDEX.shortest_path("o", "n") == 1
+        assert TEST_INDEX.shortest_path("w", "n") == -1
+        assert TEST_INDEX.shortest_path("w", "missing") == -1
+        assert TEST_INDEX.has_path("y", "v")
+        assert TEST_INDEX.has_path("n", "z") is False
+
+    assert list(TEST_INDEX.distances_from("w")) == [0, 1, 2, 2, 1, -1, -1]
+    assert list(TEST_INDEX.distances_from("n")) == [-1, -1, -1, -1, -1, 1, 0]
+
+    TEST_INDEX._generation = _MAX_GENERATION
+    assert TEST_INDEX.shortest_path("w", "y") == 2
+    assert TEST_INDEX._generation == 1
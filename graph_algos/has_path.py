@@ -0,0 +1,245 @@
+"""has_path.py"""
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Dict, Optional, Set
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.traversal_stats import TraversalStats, finish_call
+
+# Our simple acyclic graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ f ├────►│ g ├────►│ h │
+│   │     │   │     │   │
+└─┬─┘     └───┘     └───┘
+  │         ▲
+  │         │
+  │     ┌───┘
+  │     │
+  ▼     │
+┌───┐   │ ┌───┐
+│   ├───┘ │   │
+│ i │     │ j │
+│   │◄────┤   │
+└─┬─┘     └───┘
+  │
+  │
+  │
+  │
+  ▼
+┌───┐
+│   │
+│ k │
+│   │
+└───┘
+"""
+GRAPH: Dict[str, List[str]] = {
+    "f": ["g", "i"],
+    "g": ["h"],
+    "h": [],
+    "i": ["g", "k"],
+    "j": ["i"],
+    "k": [],
+}
+
+
+# Depth first has-path
+def depth_first_has_path_recursive(graph: Dict[str, List[str]],
+                                   src: str,
+                                   dst: str,
+                                   all_paths: bool = False,
+                                   visited: Optional[Set[str]] = None,
+                                   stats: Optional[TraversalStats] = None
+                                   ) -> bool:
+    """Depth first has-path recursive algo with cyclical checks.
+    all_paths skips the checks and follows every path from src,
+    which can take exponential time on DAGs and never ends on
+    cycles."""
+    start: float = perf_counter()
+    found: bool = _depth_first_has_path(graph, src, dst, all_paths, visited,
+                                        stats)
+    finish_call(stats, "depth_first_has_path_recursive", start, start)
+    return found
+
+
+def _depth_first_has_path(graph: Dict[str, List[str]], src: str, dst: str,
+                          all_paths: bool, visited: Optional[Set[str]],
+                          stats: Optional[TraversalStats]) -> bool:
+    """Helper function recursing for depth_first_has_path_recursive,
+    so the call is finished once."""
+    if src == dst:
+        return True
+    if not all_paths:
+        if visited is None:
+            visited = set()
+        if src in visited:
+            if stats is not None:
+                stats.duplicate()
+            return False
+        visited.add(src)
+    if stats is not None:
+        stats.enter(len(graph[src]))
+    for neighbor in graph[src]:
+        if _depth_first_has_path(graph, neighbor, dst, all_paths, visited,
+                                 stats):
+            if stats is not None:
+                stats.leave()
+            return True
+    if stats is not None:
+        stats.leave()
+    return False
+
+
+def depth_first_has_path_iterative(
+        graph: Dict[str, List[str]],
+        src: str,
+        dst: str,
+        all_paths: bool = False,
+        stats: Optional[TraversalStats] = None) -> bool:
+    """Depth first has-path iterative algo with cyclical checks,
+    checks nodes in the same order as depth_first_has_path_recursive
+    without recursing."""
+    start: float = perf_counter()
+    found: bool = False
+    visited: Set[str] = set()
+    stack: Deque[str] = deque([src])
+    while stack:
+        current: str = stack.pop()
+        if current == dst:
+            found = True
+            break
+        if not all_paths:
+            if current in visited:
+                if stats is not None:
+                    stats.duplicate()
+                continue
+            visited.add(current)
+        if stats is not None:
+            stats.pop(len(stack) + 1, len(graph[current]))
+        stack.extend(reversed(graph[current]))
+    finish_call(stats, "depth_first_has_path_iterative", start, start)
+    return found
+
+
+# Breadth first has-path
+def breadth_first_has_path(graph: Dict[str, List[str]],
+                           src: str,
+                           dst: str,
+                           all_paths: bool = False,
+                           stats: Optional[TraversalStats] = None) -> bool:
+    """Breadth first has-path iterative algo with cyclical checks.
+    all_paths skips the checks and queues every path from src."""
+    start: float = perf_counter()
+    found: bool = False
+    visited: Set[str] = {src}
+    queue: Deque[str] = deque([src])
+    while queue:
+        current: str = queue.popleft()
+        if current == dst:
+            found = True
+            break
+        if stats is not None:
+            stats.pop(len(queue) + 1, len(graph[current]))
+        for neighbor in graph[current]:
+            if not all_paths:
+                if neighbor in visited:
+                    continue
+                visited.add(neighbor)
+            queue.append(neighbor)
+    finish_call(stats, "breadth_first_has_path", start, start)
+    return found
+
+
+# CSR graph variants, visited nodes are tracked in a bytearray by node id
+def csr_depth_first_has_path(graph: CSRGraph,
+                             src: str,
+                             dst: str,
+                             all_paths: bool = False) -> bool:
+    """Depth first has-path iterative algo with cyclical checks over
+    a CSR graph."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    target: int = graph.index[dst]
+    visited: bytearray = bytearray(graph.node_count())
+    stack: Deque[int] = deque([graph.index[src]])
+    while stack:
+        current: int = stack.pop()
+        if current == target:
+            return True
+        if not all_paths:
+            if visited[current]:
+                continue
+            visited[current] = 1
+        stack.extend(
+            reversed(neighbors[offsets[current]:offsets[current + 1]]))
+    return False
+
+
+def csr_breadth_first_has_path(graph: CSRGraph,
+                               src: str,
+                               dst: str,
+                               all_paths: bool = False) -> bool:
+    """Breadth first has-path iterative algo with cyclical checks
+    over a CSR graph."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    target: int = graph.index[dst]
+    visited: bytearray = bytearray(graph.node_count())
+    visited[graph.index[src]] = 1
+    queue: Deque[int] = deque([graph.index[src]])
+    while queue:
+        current: int = queue.popleft()
+        if current == target:
+            return True
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if not all_paths:
+                if visited[neighbor]:
+                    continue
+                visited[neighbor] = 1
+            queue.append(neighbor)
+    return False
+
+
+# TESTS, run with python -m graph_algos.has_path
+if __name__ == "__main__":
+    assert depth_first_has_path_recursive(GRAPH, "f", "k")
+    assert depth_first_has_path_recursive(GRAPH, "j", "f") is False
+
+    assert depth_first_has_path_iterative(GRAPH, "f", "k")
+    assert depth_first_has_path_iterative(GRAPH, "j", "f") is False
+
+    assert breadth_first_has_path(GRAPH, "f", "k")
+    assert breadth_first_has_path(GRAPH, "j", "f") is False
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_adjacency(GRAPH)
+    assert csr_depth_first_has_path(CSR_GRAPH, "f", "k")
+    assert csr_depth_first_has_path(CSR_GRAPH, "j", "f") is False
+
+    assert csr_breadth_first_has_path(CSR_GRAPH, "f", "k")
+    assert csr_breadth_first_has_path(CSR_GRAPH, "j", "f") is False
+
+    for TEST_ALL_PATHS in (False, True):
+        assert depth_first_has_path_recursive(GRAPH, "f", "k", TEST_ALL_PATHS)
+        assert depth_first_has_path_iterative(GRAPH, "j", "h", TEST_ALL_PATHS)
+        assert breadth_first_has_path(GRAPH, "f", "h", TEST_ALL_PATHS)
+        assert csr_depth_first_has_path(CSR_GRAPH, "j", "f",
+                                        TEST_ALL_PATHS) is False
+        assert csr_breadth_first_has_path(CSR_GRAPH, "i", "f",
+                                          TEST_ALL_PATHS) is False
+
+    # 40 layers of 2 nodes, every node linked to both nodes of the next
+    # layer, has 2**40 paths from the top and a cycle back to it
+    LAYERED_GRAPH: Dict[str, List[str]] = {
+        "{}{}".format(side, layer):
+        ["a{}".format(layer + 1), "b{}".format(layer + 1)]
+        for layer in range(40) for side in "ab"
+    }
+    LAYERED_GRAPH["a40"] = ["a0"]
+    LAYERED_GRAPH["b40"] = ["a0"]
+    LAYERED_GRAPH["c"] = list()
+    assert depth_first_has_path_recursive(LAYERED_GRAPH, "a0", "c") is False
+    assert depth_first_has_path_iterative(LAYERED_GRAPH, "a0", "c") is False
+    assert breadth_first_has_path(LAYERED_GRAPH, "a0", "c") is False
+    CSR_LAYERED_GRAPH: CSRGraph = CSRGraph.from_adjacency(LAYERED_GRAPH)
+    assert csr_depth_first_has_path(CSR_LAYERED_GRAPH, "a0", "c") is False
+    assert csr_breadth_first_has_path(CSR_LAYERED_GRAPH, "a0", "c") is False
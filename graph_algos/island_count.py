@@ -0,0 +1,117 @@
+"""island_count.py"""
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Optional, Set, Tuple
+from graph_algos.traversal_stats import TraversalStats, finish_call
+
+# How to navigate grid
+"""
+           (r-1,c)
+              ^
+              |
+(r,c-1) <-- (r,c) --> (r,c+1)
+              |
+              v
+           (r+1,c)
+"""
+
+# Our graph grid structure
+GRID: List[List[str]] = [
+    ["W", "L", "W", "W", "W"],
+    ["W", "L", "W", "W", "W"],
+    ["W", "W", "W", "L", "W"],
+    ["W", "W", "L", "L", "W"],
+    ["L", "W", "W", "L", "L"],
+    ["L", "L", "W", "W", "W"],
+]
+
+
+def _explore(grid: List[List[str]],
+             row: int,
+             column: int,
+             visited: Set[Tuple[int, int]],
+             stats: Optional[TraversalStats] = None) -> bool:
+    """Depth first has-path recursive algo with cyclical checks.
+    Explores adjacent nodes that are marked as "L" and are not
+    yet visited."""
+    row_in_bounds: bool = 0 <= row < len(grid)
+    column_in_bounds: bool = 0 <= column < len(grid[0])
+    if not row_in_bounds or not column_in_bounds:
+        return False
+    position: Tuple[int, int] = (row, column)
+    if position in visited:
+        if stats is not None:
+            stats.duplicate()
+        return False
+    visited.add(position)
+    if grid[row][column] == "W":
+        return False
+    if stats is not None:
+        stats.enter(4)
+    _explore(grid, row - 1, column, visited, stats)
+    _explore(grid, row + 1, column, visited, stats)
+    _explore(grid, row, column - 1, visited, stats)
+    _explore(grid, row, column + 1, visited, stats)
+    if stats is not None:
+        stats.leave()
+    return True
+
+
+def _explore_iterative(grid: List[List[str]],
+                       row: int,
+                       column: int,
+                       visited: Set[Tuple[int, int]],
+                       stats: Optional[TraversalStats] = None) -> bool:
+    """Depth first has-path iterative algo with cyclical checks.
+    Explores adjacent nodes that are marked as "L" and are not
+    yet visited, in the same order as _explore without recursing."""
+    rows: int = len(grid)
+    columns: int = len(grid[0])
+    found: bool = False
+    stack: Deque[Tuple[int, int]] = deque([(row, column)])
+    while stack:
+        position: Tuple[int, int] = stack.pop()
+        row, column = position
+        if not 0 <= row < rows or not 0 <= column < columns:
+            continue
+        if position in visited:
+            if stats is not None:
+                stats.duplicate()
+            continue
+        visited.add(position)
+        if grid[row][column] == "W":
+            continue
+        if stats is not None:
+            stats.pop(len(stack) + 1, 4)
+        found = True
+        stack.append((row, column + 1))
+        stack.append((row, column - 1))
+        stack.append((row + 1, column))
+        stack.append((row - 1, column))
+    return found
+
+
+def island_count(grid: List[List[str]],
+                 stats: Optional[TraversalStats] = None) -> int:
+    """Takes in a 2D grid array, iterates over the grid, traverses
+    the internal components marked with "L" depth-first and returns
+    the number of connected components within the 2D array."""
+    start: float = perf_counter()
+    count: int = 0
+    visited: Set[Tuple[int, int]] = set()
+    for _r, row in enumerate(grid):
+        for _c in range(len(row)):
+            if _explore_iterative(grid, _r, _c, visited, stats):
+                count += 1
+    finish_call(stats, "island_count", start, start)
+    return count
+
+
+# TESTS, run with python -m graph_algos.island_count
+if __name__ == "__main__":
+    assert _explore(GRID, 0, 1, set())
+    assert _explore(GRID, 0, 0, set()) is False
+    assert _explore_iterative(GRID, 0, 1, set())
+    assert _explore_iterative(GRID, 0, 0, set()) is False
+    assert island_count(GRID) == 3
+    assert island_count([["L"] * 100 for _ in range(100)]) == 1
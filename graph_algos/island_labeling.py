@@ -0,0 +1,166 @@
+"""island_labeling.py"""
+from array import array
+from typing import Any, List, NamedTuple, Union
+
+# How to navigate a flat grid, a cell at (r,c) is stored at r*columns+c
+"""
+               (i-columns)
+                    ^
+                    |
+(i-1, if c>0) <--  (i)  --> (i+1, if c<columns-1)
+                    |
+                    v
+               (i+columns)
+"""
+
+# Our graph grid structure
+GRID: List[List[str]] = [
+    ["W", "L", "W", "W", "W"],
+    ["W", "L", "W", "W", "W"],
+    ["W", "W", "W", "L", "W"],
+    ["W", "W", "L", "L", "W"],
+    ["L", "W", "W", "L", "L"],
+    ["L", "L", "W", "W", "W"],
+]
+
+# Maps every byte value to 1 for land and 0 for water
+_LAND_TABLE: bytes = bytes([0] + [1] * 255)
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+
+class LandGrid:
+    """Grid stored as one byte per cell in a flat row-major buffer,
+    any nonzero cell is land."""
+
+    __slots__ = ("rows", "columns", "cells")
+
+    def __init__(self, rows: int, columns: int, cells: Buffer) -> None:
+        if len(cells) != rows * columns:
+            raise ValueError("Buffer of {} cells does not match a {}x{} "
+                             "grid".format(len(cells), rows, columns))
+        self.rows: int = rows
+        self.columns: int = columns
+        self.cells: Buffer = cells
+
+    @classmethod
+    def from_list(cls, grid: List[List[str]], land: str = "L") -> "LandGrid":
+        """Converts the List[List[str]] "W"/"L" grid format."""
+        columns: int = len(grid[0]) if grid else 0
+        cells: bytearray = bytearray()
+        for row in grid:
+            if len(row) != columns:
+                raise ValueError("Row length {} does not match grid width "
+                                 "{}".format(len(row), columns))
+            cells.extend(1 if cell == land else 0 for cell in row)
+        return cls(len(grid), columns, cells)
+
+    @classmethod
+    def from_array(cls, grid: Any) -> "LandGrid":
+        """Wraps a 2D uint8 or bool NumPy array, or anything else
+        exposing a 2D buffer of single byte cells, without copying
+        it when it is C-contiguous."""
+        view: memoryview = memoryview(grid)
+        if view.ndim != 2 or view.itemsize != 1:
+            raise ValueError("Expected a 2D buffer of single byte cells")
+        rows, columns = view.shape  # type: ignore[misc]
+        if not view.c_contiguous:
+            view = memoryview(view.tobytes())
+        return cls(rows, columns, view.cast("B"))
+
+
+class IslandSummary(NamedTuple):
+    """Island count, every island size in discovery order and the
+    smallest and largest sizes, 0 when there are no islands."""
+    islands: int
+    sizes: List[int]
+    minimum: int
+    maximum: int
+
+
+def island_sizes(grid: LandGrid) -> List[int]:
+    """Takes in a LandGrid, labels the connected land cells
+    depth-first over a flat bitmap of unvisited land and returns
+    the size of every island, ordered by their first cell."""
+    land: bytearray = bytearray(grid.cells).translate(_LAND_TABLE)
+    return _label_land(land, grid.columns, array("i"), array("i"))
+
+
+def _label_land(land: bytearray, columns: int, top: "array[int]",
+                bottom: "array[int]") -> List[int]:
+    """Helper function flood filling a flat bitmap of unvisited land,
+    clearing it in place, and returning the island sizes. When top
+    and bottom are not empty, the island label of every land cell in
+    the first and last row is recorded in them."""
+    last_column: int = columns - 1
+    total: int = len(land)
+    top_stop: int = columns if top else 0
+    bottom_start: int = total - columns if bottom else total
+    sizes: List[int] = list()
+    stack: List[int] = list()
+    # Unvisited land cells are 1, cleared as soon as they are pushed
+    start: int = land.find(1)
+    while start != -1:
+        label: int = len(sizes)
+        land[start] = 0
+        stack.append(start)
+        size: int = 0
+        while stack:
+            current: int = stack.pop()
+            size += 1
+            if current < top_stop or current >= bottom_start:
+                if current < top_stop:
+                    top[current] = label
+                if current >= bottom_start:
+                    bottom[current - bottom_start] = label
+            if current >= columns and land[current - columns]:
+                land[current - columns] = 0
+                stack.append(current - columns)
+            if current + columns < total and land[current + columns]:
+                land[current + columns] = 0
+                stack.append(current + columns)
+            column: int = current % columns
+            if column and land[current - 1]:
+                land[current - 1] = 0
+                stack.append(current - 1)
+            if column != last_column and land[current + 1]:
+                land[current + 1] = 0
+                stack.append(current + 1)
+        sizes.append(size)
+        start = land.find(1, start + 1)
+    return sizes
+
+
+def island_summary(grid: LandGrid) -> IslandSummary:
+    """Takes in a LandGrid and returns the island count, the size of
+    every island and the smallest and largest island size."""
+    sizes: List[int] = island_sizes(grid)
+    if not sizes:
+        return IslandSummary(0, sizes, 0, 0)
+    return IslandSummary(len(sizes), sizes, min(sizes), max(sizes))
+
+
+# TESTS, run with python -m graph_algos.island_labeling
+if __name__ == "__main__":
+    TEST_GRID: LandGrid = LandGrid.from_list(GRID)
+    assert island_sizes(TEST_GRID) == [2, 5, 3]
+    assert island_summary(TEST_GRID) == IslandSummary(3, [2, 5, 3], 2, 5)
+    assert island_summary(LandGrid.from_list([["W", "W"]])).islands == 0
+    assert island_summary(LandGrid(2, 2, bytes([1, 0, 0, 1]))).islands == 2
+    assert island_sizes(LandGrid.from_list([["L"] * 300] * 300)) == [90000]
+    try:
+        LandGrid.from_list([["L", "W"], ["L"]])
+        assert False
+    except ValueError:
+        pass
+    try:
+        import numpy as np
+    except ImportError:  # pragma: no cover
+        np = None  # type: ignore[assignment]
+    if np is not None:
+        TEST_ARRAY = np.array(GRID) == "L"
+        assert island_summary(LandGrid.from_array(TEST_ARRAY)).sizes == [
+            2, 5, 3
+        ]
+        assert island_summary(LandGrid.from_array(
+            TEST_ARRAY.astype(np.uint8).T)).sizes == [3, 2, 5]
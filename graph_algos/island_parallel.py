@@ -0,0 +1,132 @@
+"""island_parallel.py"""
+import os
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from multiprocessing.shared_memory import SharedMemory
+from typing import List, Optional, Tuple, cast
+from graph_algos.island_labeling import (GRID, IslandSummary, LandGrid,
+                                         _LAND_TABLE, _label_land)
+from graph_algos.union_find import find_root
+
+# Splitting the grid into horizontal tiles
+"""
+        ┌───────────────────┐
+tile 0  │ . A A . . . B B . │  each tile is labeled on its own
+        │ . . A . . . . B . │
+        ├───────────────────┤  fragments touching across a border
+tile 1  │ . . C . . . . D . │  are merged with union-find:
+        │ . . C C C . . . . │  A + C, B + D
+        ├───────────────────┤
+tile 2  │ E . . . F . . . . │  C + F, E stays on its own
+        └───────────────────┘
+"""
+
+# Island sizes, then the label of every cell in the first and last row
+# of a tile, -1 for water
+Tile = Tuple[List[int], "array[int]", "array[int]"]
+
+
+def _label_tile(name: str, columns: int, start: int, stop: int) -> Tile:
+    """Worker function labeling the rows [start, stop) of the grid
+    held in the shared memory block called name."""
+    shared: SharedMemory = SharedMemory(name=name)
+    try:
+        buffer: memoryview = cast(memoryview, shared.buf)
+        land: bytearray = bytearray(
+            buffer[start * columns:stop * columns]).translate(_LAND_TABLE)
+        del buffer
+    finally:
+        shared.close()
+    top: "array[int]" = array("i", [-1]) * columns
+    bottom: "array[int]" = array("i", [-1]) * columns
+    sizes: List[int] = _label_land(land, columns, top, bottom)
+    return sizes, top, bottom
+
+
+def _merge_tiles(tiles: List[Tile]) -> IslandSummary:
+    """Helper function merging the island fragments of consecutive
+    tiles that touch across their shared border."""
+    parents: List[int] = list()
+    sizes: List[int] = list()
+    previous_bottom: "array[int]" = array("i")
+    previous_offset: int = 0
+    for tile_sizes, top, bottom in tiles:
+        offset: int = len(sizes)
+        parents.extend(range(offset, offset + len(tile_sizes)))
+        sizes.extend(tile_sizes)
+        for above, below in zip(previous_bottom, top):
+            if above < 0 or below < 0:
+                continue
+            root_a: int = find_root(parents, previous_offset + above)
+            root_b: int = find_root(parents, offset + below)
+            if root_a == root_b:
+                continue
+            # The earlier fragment stays the root, so islands keep the
+            # order of their first cell
+            if root_b < root_a:
+                root_a, root_b = root_b, root_a
+            parents[root_b] = root_a
+            sizes[root_a] += sizes[root_b]
+        previous_bottom = bottom
+        previous_offset = offset
+
+    island_sizes: List[int] = [
+        sizes[fragment] for fragment in range(len(parents))
+        if find_root(parents, fragment) == fragment
+    ]
+    if not island_sizes:
+        return IslandSummary(0, island_sizes, 0, 0)
+    return IslandSummary(len(island_sizes), island_sizes, min(island_sizes),
+                         max(island_sizes))
+
+
+def parallel_island_summary(grid: LandGrid,
+                            workers: Optional[int] = None,
+                            tiles: Optional[int] = None) -> IslandSummary:
+    """Takes in a LandGrid, copies it into shared memory once, labels
+    horizontal tiles of it in a process pool and merges the island
+    fragments across tile borders. Returns the same summary as
+    island_labeling.island_summary."""
+    rows: int = grid.rows
+    columns: int = grid.columns
+    if rows * columns == 0:
+        return IslandSummary(0, list(), 0, 0)
+    workers = workers or os.cpu_count() or 1
+    tiles = max(1, min(tiles or workers, rows))
+    starts: List[int] = [rows * tile // tiles for tile in range(tiles)]
+    stops: List[int] = starts[1:] + [rows]
+
+    shared: SharedMemory = SharedMemory(create=True, size=rows * columns)
+    try:
+        cast(memoryview, shared.buf)[:rows * columns] = grid.cells
+        with ProcessPoolExecutor(workers) as executor:
+            results: List[Tile] = list(
+                executor.map(_label_tile, repeat(shared.name),
+                             repeat(columns), starts, stops))
+    finally:
+        shared.close()
+        shared.unlink()
+    return _merge_tiles(results)
+
+
+# TESTS, guarded so worker processes that import this module do not
+# start pools of their own
+if __name__ == "__main__":
+    from graph_algos.island_count import island_count
+    from graph_algos.island_labeling import island_summary
+    from graph_algos.minimum_island import minimum_island_count
+
+    TEST_GRID: LandGrid = LandGrid.from_list(GRID)
+    for TEST_TILES in range(1, 7):
+        TEST_SUMMARY: IslandSummary = parallel_island_summary(
+            TEST_GRID, 2, TEST_TILES)
+        assert TEST_SUMMARY == island_summary(TEST_GRID)
+        assert TEST_SUMMARY.islands == island_count(GRID)
+        assert TEST_SUMMARY.minimum == minimum_island_count(GRID)
+
+    TEST_SNAKE: List[List[str]] = [["L"] * 9, ["W"] * 8 + ["L"], ["L"] * 9,
+                                   ["L"] + ["W"] * 8, ["L"] * 9]
+    assert parallel_island_summary(LandGrid.from_list(TEST_SNAKE), 2,
+                                   5).sizes == [29]
+    assert parallel_island_summary(LandGrid(0, 0, b"")).islands == 0
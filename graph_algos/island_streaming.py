@@ -0,0 +1,133 @@
+"""island_streaming.py"""
+import mmap
+import os
+import re
+import tempfile
+from collections import Counter
+from typing import Dict, Iterable, List, NamedTuple, Pattern, Tuple
+from graph_algos.island_labeling import (GRID, LandGrid, _LAND_TABLE,
+                                         island_sizes)
+from graph_algos.union_find import find_root
+
+# Labeling one row at a time against the row above it
+"""
+previous row:  . A A . . B . C C C        A, B, C are open islands
+current row:   . . x x x x . . . x        runs of land in this row
+
+run [2, 6) overlaps A and B, so A and B merge into one island
+run [9, 10) overlaps C, so C stays open
+an open island no run overlaps is finished and goes to the histogram
+"""
+
+# Runs of land, any nonzero byte is land
+_LAND_RUN: Pattern[bytes] = re.compile(rb"[^\x00]+")
+
+Run = Tuple[int, int, int]
+
+
+class IslandHistogram(NamedTuple):
+    """Island count and a mapping of island size to the number of
+    islands of that size."""
+    islands: int
+    sizes: Dict[int, int]
+
+
+def write_grid(path: str, grid: LandGrid) -> None:
+    """Writes a LandGrid to path as a raw file of rows x columns
+    bytes, 1 for land and 0 for water."""
+    with open(path, "wb") as handle:
+        handle.write(bytes(grid.cells).translate(_LAND_TABLE))
+
+
+def streaming_island_histogram(rows: Iterable[bytes]) -> IslandHistogram:
+    """Takes in the rows of a grid one at a time, labels the runs of
+    land in each row against the open islands of the row above with
+    union-find and returns the island size histogram. Only two rows
+    of labels are held at once, so memory is bounded by the number
+    of columns plus the number of distinct island sizes."""
+    histogram: "Counter[int]" = Counter()
+    previous_runs: List[Run] = list()
+    previous_sizes: List[int] = list()
+    for row in rows:
+        runs: List[Tuple[int, int]] = [
+            match.span() for match in _LAND_RUN.finditer(row)
+        ]
+        # Labels 0..P-1 are the open islands, P.. the runs of this row
+        open_count: int = len(previous_sizes)
+        parents: List[int] = list(range(open_count + len(runs)))
+        sizes: List[int] = previous_sizes + [end - start
+                                             for start, end in runs]
+
+        # Merge every run with the open islands it touches from above
+        above: int = 0
+        last: int = len(previous_runs)
+        for run, (start, end) in enumerate(runs):
+            while above < last and previous_runs[above][1] <= start:
+                above += 1
+            scan: int = above
+            while scan < last and previous_runs[scan][0] < end:
+                root_a: int = find_root(parents, open_count + run)
+                root_b: int = find_root(parents, previous_runs[scan][2])
+                if root_a != root_b:
+                    if sizes[root_a] < sizes[root_b]:
+                        root_a, root_b = root_b, root_a
+                    parents[root_b] = root_a
+                    sizes[root_a] += sizes[root_b]
+                scan += 1
+
+        # Islands no run reached are finished, the rest are renumbered
+        roots: Dict[int, int] = dict()
+        current_runs: List[Run] = list()
+        for run, (start, end) in enumerate(runs):
+            root: int = find_root(parents, open_count + run)
+            if root not in roots:
+                roots[root] = len(roots)
+            current_runs.append((start, end, roots[root]))
+        for label in range(open_count):
+            if find_root(parents, label) not in roots:
+                histogram[sizes[label]] += 1
+        previous_runs = current_runs
+        previous_sizes = [sizes[root] for root in roots]
+
+    for size in previous_sizes:
+        histogram[size] += 1
+    return IslandHistogram(sum(histogram.values()), dict(histogram))
+
+
+def island_histogram_mmap(path: str, rows: int,
+                          columns: int) -> IslandHistogram:
+    """Memory-maps a raw grid file of rows x columns bytes, nonzero
+    bytes being land, and streams it row by row through
+    streaming_island_histogram."""
+    if os.path.getsize(path) != rows * columns:
+        raise ValueError("File of {} bytes does not match a {}x{} grid".format(
+            os.path.getsize(path), rows, columns))
+    if rows * columns == 0:
+        return IslandHistogram(0, dict())
+    with open(path, "rb") as handle:
+        with mmap.mmap(handle.fileno(), 0,
+                       access=mmap.ACCESS_READ) as mapped:
+            return streaming_island_histogram(
+                mapped[row * columns:(row + 1) * columns]
+                for row in range(rows))
+
+
+# TESTS, run with python -m graph_algos.island_streaming
+if __name__ == "__main__":
+    TEST_GRID: LandGrid = LandGrid.from_list(GRID)
+    assert streaming_island_histogram(
+        bytes(TEST_GRID.cells[row * 5:(row + 1) * 5])
+        for row in range(6)) == IslandHistogram(3, {2: 1, 5: 1, 3: 1})
+
+    # A U shape only joins up on its last row, a comb joins on its first
+    assert streaming_island_histogram(
+        [b"\x01\x00\x01", b"\x01\x00\x01", b"\x01\x01\x01"]).sizes == {7: 1}
+    assert streaming_island_histogram(
+        [b"\x01\x01\x01\x01\x01", b"\x01\x00\x01\x00\x01"]).sizes == {8: 1}
+    assert streaming_island_histogram([]) == IslandHistogram(0, {})
+
+    with tempfile.TemporaryDirectory() as TEST_DIRECTORY:
+        TEST_PATH: str = os.path.join(TEST_DIRECTORY, "grid.bin")
+        write_grid(TEST_PATH, TEST_GRID)
+        assert island_histogram_mmap(TEST_PATH, 6, 5).sizes == Counter(
+            island_sizes(TEST_GRID))
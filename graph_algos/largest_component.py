@@ -0,0 +1,235 @@
+"""largest_component.py"""
+from collections import deque
+from time import perf_counter
+from typing import Deque, List, Dict, Optional, Set
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.traversal_stats import TraversalStats, finish_call
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ 1 ├─────┤ 0 ├─────┤ 5 │
+│   │     │   │     │   │
+└───┘     └─┬─┘     └─┬─┘
+            │         │
+            │         │
+            │         │
+            │         │
+            │         │
+          ┌─┴─┐       │
+          │   │       │
+          │ 8 ├───────┘
+          │   │
+          └───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ 2 ├─────┤ 3 │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  │         │
+  │       ┌─┴─┐
+  │       │   │
+  └───────┤ 4 │
+          │   │
+          └───┘
+"""
+
+GRAPH: Dict[str, List[str]] = {
+    "0": ["8", "1", "5"],
+    "1": ["0"],
+    "5": ["0", "8"],
+    "8": ["0", "5"],
+    "2": ["3", "4"],
+    "3": ["2", "4"],
+    "4": ["3", "2"],
+}
+
+
+# Depth first node count
+def depth_first_count_recursive(graph: Dict[str, List[str]],
+                                src: str,
+                                visited: Set[str],
+                                stats: Optional[TraversalStats] = None) -> int:
+    """Depth first node count recursive algo with cyclical checks."""
+    size: int = 1
+    if src in visited:
+        if stats is not None:
+            stats.duplicate()
+        return 0
+    visited.add(src)
+    if stats is not None:
+        stats.enter(len(graph[src]))
+    for neighbor in graph[src]:
+        size += depth_first_count_recursive(graph, neighbor, visited, stats)
+    if stats is not None:
+        stats.leave()
+    return size
+
+
+def depth_first_count_iterative(graph: Dict[str, List[str]],
+                                src: str,
+                                visited: Set[str],
+                                stats: Optional[TraversalStats] = None) -> int:
+    """Depth first node count iterative algo with cyclical checks,
+    visits nodes in the same order as depth_first_count_recursive
+    without recursing."""
+    size: int = 0
+    stack: Deque[str] = deque([src])
+    while stack:
+        current: str = stack.pop()
+        if current in visited:
+            if stats is not None:
+                stats.duplicate()
+            continue
+        visited.add(current)
+        if stats is not None:
+            stats.pop(len(stack) + 1, len(graph[current]))
+        stack.extend(reversed(graph[current]))
+        size += 1
+    return size
+
+
+# Breadth first node count
+def breadth_first_count(graph: Dict[str, List[str]],
+                        src: str,
+                        visited: Set[str],
+                        stats: Optional[TraversalStats] = None) -> int:
+    """Breadth first node count iterative algo with cyclical checks."""
+    queue: Deque[str] = deque([src])
+    size: int = 0
+    while queue:
+        current: str = queue.popleft()
+        if current in visited:
+            if stats is not None:
+                stats.duplicate()
+            continue
+        visited.add(current)
+        if stats is not None:
+            stats.pop(len(queue) + 1, len(graph[current]))
+        for neighbor in graph[current]:
+            queue.append(neighbor)
+        size += 1
+    return size
+
+
+# Largest components node count algos
+def depth_first_largest_component(
+        graph: Dict[str, List[str]],
+        stats: Optional[TraversalStats] = None) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    depth-first and returns the number of nodes in the
+    largest connected component."""
+    start: float = perf_counter()
+    largest: int = 0
+    visited: Set[str] = set()
+    size: int
+    for node in graph:
+        size = depth_first_count_iterative(graph, node, visited, stats)
+        if size > largest:
+            largest = size
+    finish_call(stats, "depth_first_largest_component", start, start)
+    return largest
+
+
+def breadth_first_largest_component(
+        graph: Dict[str, List[str]],
+        stats: Optional[TraversalStats] = None) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    breadth-first and returns the number of nodes in the
+    largest connected component."""
+    start: float = perf_counter()
+    largest: int = 0
+    visited: Set[str] = set()
+    size: int
+    for node in graph:
+        size = breadth_first_count(graph, node, visited, stats)
+        if size > largest:
+            largest = size
+    finish_call(stats, "breadth_first_largest_component", start, start)
+    return largest
+
+
+# CSR graph variants
+def csr_depth_first_largest_component(graph: CSRGraph) -> int:
+    """Takes in a CSR graph, traverses the graph depth-first
+    and returns the number of nodes in the largest connected
+    component."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    largest: int = 0
+    visited: bytearray = bytearray(graph.node_count())
+    stack: Deque[int] = deque()
+    size: int
+    for node in range(graph.node_count()):
+        if visited[node]:
+            continue
+        size = 0
+        stack.append(node)
+        while stack:
+            current: int = stack.pop()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            size += 1
+            stack.extend(
+                reversed(neighbors[offsets[current]:offsets[current + 1]]))
+        if size > largest:
+            largest = size
+    return largest
+
+
+def csr_breadth_first_largest_component(graph: CSRGraph) -> int:
+    """Takes in a CSR graph, traverses the graph breadth-first
+    and returns the number of nodes in the largest connected
+    component."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    largest: int = 0
+    visited: bytearray = bytearray(graph.node_count())
+    queue: Deque[int] = deque()
+    size: int
+    for node in range(graph.node_count()):
+        if visited[node]:
+            continue
+        size = 0
+        queue.append(node)
+        while queue:
+            current: int = queue.popleft()
+            if visited[current]:
+                continue
+            visited[current] = 1
+            size += 1
+            queue.extend(neighbors[offsets[current]:offsets[current + 1]])
+        if size > largest:
+            largest = size
+    return largest
+
+
+# TESTS, run with python -m graph_algos.largest_component
+if __name__ == "__main__":
+    assert depth_first_count_recursive(GRAPH, "0", set()) == 4
+    assert depth_first_count_iterative(GRAPH, "0", set()) == 4
+    assert depth_first_largest_component(GRAPH) == 4
+    assert breadth_first_largest_component(GRAPH) == 4
+
+    CHAIN_GRAPH: Dict[str, List[str]] = {
+        str(i): [str(i - 1), str(i + 1)]
+        for i in range(1, 5000)
+    }
+    CHAIN_GRAPH["0"] = ["1"]
+    CHAIN_GRAPH["5000"] = ["4999"]
+    assert depth_first_largest_component(CHAIN_GRAPH) == 5001
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_adjacency(GRAPH)
+    assert csr_depth_first_largest_component(CSR_GRAPH) == 4
+    assert csr_breadth_first_largest_component(CSR_GRAPH) == 4
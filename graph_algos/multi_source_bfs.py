@@ -0,0 +1,130 @@
+"""multi_source_bfs.py"""
+from typing import Dict, List, Mapping, Optional, Sequence
+from graph_algos.csr_graph import CSRGraph
+
+# Our simple undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ w ├─────┤ x ├─────┤ y │
+│   │     │   │     │   │
+└─┬─┘     └───┘     └─┬─┘
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │       ┌───┐     ┌─┴─┐
+  │       │   │     │   │
+  └───────┤ v ├─────┤ z │
+          │   │     │   │
+          └───┘     └───┘
+"""
+
+# Searching from many sources at once, bit i belongs to source i
+"""
+level 0:  w=0b01  x=0b10
+level 1:  x|=0b01 (from w)  v=0b01 (from w)  w|=0b10 (from x)  y=0b10
+level 2:  z=0b11 (from v and y)  ...
+
+A node is only expanded for the bits that reached it for the first
+time, so one sweep answers every source in the batch.
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+]
+
+
+def _sweep(graph: CSRGraph, sources: Sequence[int], columns: Dict[int, int],
+           distances: List[List[int]]) -> None:
+    """Helper function running one level-synchronous breadth first
+    search for a batch of sources, carrying a bitset of sources per
+    node. Fills in the distances rows of the batch for every target
+    node, columns mapping target node ids to their column."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    seen: List[int] = [0] * graph.node_count()
+    frontier: Dict[int, int] = dict()
+    for bit, source in enumerate(sources):
+        seen[source] |= 1 << bit
+        frontier[source] = frontier.get(source, 0) | 1 << bit
+    remaining: int = len(sources) * len(columns)
+    level: int = 0
+    while frontier:
+        for node, bits in frontier.items():
+            if node not in columns:
+                continue
+            column: int = columns[node]
+            while bits:
+                lowest: int = bits & -bits
+                distances[lowest.bit_length() - 1][column] = level
+                bits ^= lowest
+                remaining -= 1
+        if not remaining:
+            return
+        level += 1
+        next_frontier: Dict[int, int] = dict()
+        for node, bits in frontier.items():
+            for neighbor in neighbors[offsets[node]:offsets[node + 1]]:
+                new_bits: int = bits & ~seen[neighbor]
+                if new_bits:
+                    seen[neighbor] |= new_bits
+                    next_frontier[neighbor] = next_frontier.get(
+                        neighbor, 0) | new_bits
+        frontier = next_frontier
+
+
+def multi_source_distances(graph: CSRGraph,
+                           sources: Sequence[str],
+                           targets: Optional[Sequence[str]] = None,
+                           batch_size: int = 256) -> List[List[int]]:
+    """Takes in a CSR graph, a list of source nodes and optionally a
+    list of target nodes, every node in id order by default. Runs
+    one multi-source breadth first sweep per batch of sources and
+    returns a matrix of edge counts, distances[i][j] being the
+    shortest amount of edges from sources[i] to targets[j], or -1 if
+    they are not connected."""
+    index: Mapping[str, int] = graph.index
+    target_ids: List[int] = ([index[target] for target in targets]
+                             if targets is not None else list(
+                                 range(graph.node_count())))
+    columns: Dict[int, int] = dict()
+    for column, target in enumerate(target_ids):
+        columns.setdefault(target, column)
+    distances: List[List[int]] = [[-1] * len(target_ids) for _ in sources]
+    for start in range(0, len(sources), batch_size):
+        batch: List[int] = [
+            index[source] for source in sources[start:start + batch_size]
+        ]
+        _sweep(graph, batch, columns, distances[start:start + batch_size])
+
+    # Repeated targets share a column during the sweep
+    for column, target in enumerate(target_ids):
+        if columns[target] != column:
+            for row in distances:
+                row[column] = row[columns[target]]
+    return distances
+
+
+# TESTS, run with python -m graph_algos.multi_source_bfs
+if __name__ == "__main__":
+    TEST_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES + [["a", "b"]])
+    assert multi_source_distances(TEST_GRAPH, ["w", "x"], ["z", "v", "y"]) == [
+        [2, 1, 2],
+        [2, 2, 1],
+    ]
+    assert multi_source_distances(TEST_GRAPH, ["w"]) == [
+        [0, 1, 2, 2, 1, -1, -1]
+    ]
+    assert multi_source_distances(TEST_GRAPH, ["w", "a", "w"], ["b", "z", "b"],
+                                  batch_size=2) == [
+                                      [-1, 2, -1],
+                                      [1, -1, 1],
+                                      [-1, 2, -1],
+                                  ]
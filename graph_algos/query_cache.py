@@ -0,0 +1,223 @@
+"""query_cache.py"""
+import hashlib
+from array import array
+from collections import OrderedDict
+from typing import Iterable, List, NamedTuple, Sequence, Tuple
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.graph_index import GraphIndex
+
+# Answering a query, cheapest first
+"""
+shortest_path(a, b)
+    │
+    ├─ (a, b) or (b, a) in the query LRU          -> stored distance
+    ├─ a or b has a cached distance map           -> distances[other]
+    ├─ a has been asked about hot_threshold times -> one breadth first
+    │                                                sweep from a, kept
+    │                                                in the source LRU
+    └─ otherwise                                  -> GraphIndex query
+
+Every entry is keyed on the fingerprint of the graph it was computed
+on, and update() drops them all when the graph changes.
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+    ["o", "n"],
+]
+
+QueryKey = Tuple[str, str, str]
+
+
+class CacheStats(NamedTuple):
+    """Queries answered from the cache, queries that needed a search,
+    entries evicted to stay within the size bounds and cache clears
+    caused by graph changes."""
+    hits: int
+    misses: int
+    evictions: int
+    invalidations: int
+
+
+def graph_fingerprint(graph: CSRGraph) -> str:
+    """Returns a digest of the labels and adjacency of a graph, equal
+    for graphs with the same nodes and neighbor lists in the same
+    order."""
+    digest = hashlib.blake2b(digest_size=16)
+    for label in graph.labels:
+        digest.update(label.encode())
+        digest.update(b"\0")
+    digest.update(bytes(graph.offsets))
+    digest.update(bytes(graph.neighbors))
+    return digest.hexdigest()
+
+
+class QueryCache:
+    """Caches the answers to shortest-path and has-path queries over
+    one undirected graph, with LRU eviction. Sources asked about
+    hot_threshold times get their whole breadth first distance map
+    cached, so later queries from or to them are plain lookups.
+    Answers match shortest_path.breadth_first_shortest_path and
+    undirected_path.undirected_path_breadth_first, unknown nodes
+    being unreachable."""
+
+    def __init__(self,
+                 graph: CSRGraph,
+                 max_entries: int = 4096,
+                 max_sources: int = 16,
+                 hot_threshold: int = 2) -> None:
+        self.max_entries: int = max_entries
+        self.max_sources: int = max_sources
+        self.hot_threshold: int = hot_threshold
+        self._index: GraphIndex = GraphIndex(graph)
+        self.fingerprint: str = graph_fingerprint(graph)
+        self._entries: "OrderedDict[QueryKey, int]" = OrderedDict()
+        self._sources: "OrderedDict[Tuple[str, str], array[int]]" = (
+            OrderedDict())
+        self._heat: "OrderedDict[Tuple[str, str], int]" = OrderedDict()
+        self._hits: int = 0
+        self._misses: int = 0
+        self._evictions: int = 0
+        self._invalidations: int = 0
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence[str]],
+                   **options: int) -> "QueryCache":
+        """Builds the cache from an undirected edge list."""
+        return cls(CSRGraph.from_edges(edges), **options)
+
+    @property
+    def graph(self) -> CSRGraph:
+        """The graph queries are answered on."""
+        return self._index.graph
+
+    def update(self, graph: CSRGraph) -> bool:
+        """Answers later queries on graph, dropping every cached entry
+        if its fingerprint differs from the current graph. Returns
+        True if the cache was invalidated."""
+        fingerprint: str = graph_fingerprint(graph)
+        if fingerprint == self.fingerprint:
+            return False
+        self._index = GraphIndex(graph)
+        self.fingerprint = fingerprint
+        self.clear()
+        self._invalidations += 1
+        return True
+
+    def clear(self) -> None:
+        """Drops every cached entry, keeping the counters."""
+        self._entries.clear()
+        self._sources.clear()
+        self._heat.clear()
+
+    def stats(self) -> CacheStats:
+        """Returns the hit, miss, eviction and invalidation counts."""
+        return CacheStats(self._hits, self._misses, self._evictions,
+                          self._invalidations)
+
+    def distances_from(self, node: str) -> "array[int]":
+        """Returns the edge count from node to every node id, -1 for
+        other components, from the source LRU when it is cached."""
+        key: Tuple[str, str] = (self.fingerprint, node)
+        distances = self._sources.get(key)
+        if distances is not None:
+            self._sources.move_to_end(key)
+            return distances
+        distances = self._index.distances_from(node)
+        self._sources[key] = distances
+        if len(self._sources) > self.max_sources:
+            self._sources.popitem(last=False)
+            self._evictions += 1
+        return distances
+
+    def _is_hot(self, node: str) -> bool:
+        """Helper function counting a query from node, returns True
+        once node has been asked about hot_threshold times."""
+        key: Tuple[str, str] = (self.fingerprint, node)
+        heat: int = self._heat.pop(key, 0) + 1
+        self._heat[key] = heat
+        if len(self._heat) > self.max_entries:
+            self._heat.popitem(last=False)
+        return heat >= self.hot_threshold
+
+    def shortest_path(self, node_a: str, node_b: str) -> int:
+        """Returns the number of edges on the shortest path from
+        node_a to node_b, or -1 if they are not connected."""
+        if node_a == node_b:
+            return 0
+        index = self.graph.index
+        if node_a not in index or node_b not in index:
+            return -1
+        # The graph is undirected, both query orders share an entry
+        key: QueryKey = (self.fingerprint, min(node_a, node_b),
+                         max(node_a, node_b))
+        distance = self._entries.get(key)
+        if distance is not None:
+            self._entries.move_to_end(key)
+            self._hits += 1
+            return distance
+        for source, target in ((node_a, node_b), (node_b, node_a)):
+            distances = self._sources.get((self.fingerprint, source))
+            if distances is not None:
+                self._sources.move_to_end((self.fingerprint, source))
+                self._hits += 1
+                return distances[index[target]]
+
+        self._misses += 1
+        if self._is_hot(node_a):
+            distance = self.distances_from(node_a)[index[node_b]]
+        else:
+            distance = self._index.shortest_path(node_a, node_b)
+        self._entries[key] = distance
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+        return distance
+
+    def has_path(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_b is reachable from node_a."""
+        return self.shortest_path(node_a, node_b) != -1
+
+
+# TESTS, run with python -m graph_algos.query_cache
+if __name__ == "__main__":
+    from graph_algos.shortest_path import breadth_first_shortest_path
+    from graph_algos.undirected_path import undirected_path_breadth_first
+
+    TEST_CACHE: QueryCache = QueryCache.from_edges(
+        EDGES, max_entries=4, max_sources=3)
+    TEST_NODES: List[str] = ["w", "x", "y", "z", "v", "o", "n"]
+    for _ in range(2):
+        for TEST_A in TEST_NODES:
+            for TEST_B in TEST_NODES:
+                assert TEST_CACHE.shortest_path(
+                    TEST_A, TEST_B) == breadth_first_shortest_path(
+                        EDGES, TEST_A, TEST_B)
+                assert TEST_CACHE.has_path(
+                    TEST_A, TEST_B) == undirected_path_breadth_first(
+                        EDGES, TEST_A, TEST_B)
+    assert TEST_CACHE.shortest_path("w", "missing") == -1
+    assert len(TEST_CACHE._entries) == 4
+    assert len(TEST_CACHE._sources) == 3
+    assert TEST_CACHE.stats().evictions > 0
+
+    # Repeats are hits, the second query from a source caches its map
+    TEST_CACHE = QueryCache.from_edges(EDGES)
+    assert TEST_CACHE.shortest_path("w", "y") == 2
+    assert TEST_CACHE.shortest_path("y", "w") == 2
+    assert TEST_CACHE.stats() == CacheStats(1, 1, 0, 0)
+    assert TEST_CACHE.shortest_path("w", "z") == 2
+    assert list(TEST_CACHE._sources) == [(TEST_CACHE.fingerprint, "w")]
+    assert TEST_CACHE.shortest_path("v", "w") == 1
+    assert TEST_CACHE.stats() == CacheStats(2, 2, 0, 0)
+
+    # Rebuilding the same graph keeps the entries, a change drops them
+    assert not TEST_CACHE.update(CSRGraph.from_edges(EDGES))
+    assert TEST_CACHE.update(CSRGraph.from_edges(EDGES + [["n", "w"]]))
+    assert TEST_CACHE.shortest_path("o", "y") == 4
+    assert TEST_CACHE.stats() == CacheStats(2, 3, 0, 1)
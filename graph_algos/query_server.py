@@ -0,0 +1,510 @@
+"""query_server.py"""
+import asyncio
+import json
+import multiprocessing
+import os
+import tempfile
+import threading
+from array import array
+from concurrent.futures import (Executor, ProcessPoolExecutor,
+                                ThreadPoolExecutor)
+from functools import partial
+from typing import Any, Callable, Dict, List, NamedTuple, Optional, Set
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.graph_file import load_graph, write_graph
+from graph_algos.graph_index import GraphIndex
+from graph_algos.largest_component import csr_breadth_first_largest_component
+
+# Answering concurrent queries on the event loop
+"""
+client ─┐  {"id": 1, "op": "shortest_path", "a": "w", "b": "z"}\\n
+client ─┼─► handle ─► max_pending slots ─► batch per source ─► executor
+client ─┘     ▲        (reading stops          │                 │
+              │         while all are taken)   │  one traversal  │
+              │                                ▼  from the source│
+              └──── {"id": 1, "result": 2}\\n ◄─ distances ◄──────┘
+
+A query arriving while no traversal is running is answered on its
+own, the traversal stopping at its target. Under load a query starts
+a traversal to every node from its source, or from its target when
+the lone query is from there since the graph is undirected, and
+queries from or to that node arriving while it runs wait for its
+distances instead of starting another one. Traversals run in a
+thread, or in worker processes mapping a graph file, so the event
+loop keeps accepting and answering queries.
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+    ["o", "n"],
+]
+
+# The graph index of a worker process, see QueryServer.from_graph_file
+_WORKER_INDEX: Optional[GraphIndex] = None
+
+
+def _load_worker(path: str) -> None:
+    """Process pool initializer mapping the graph file once per
+    worker, every worker sharing the same pages."""
+    global _WORKER_INDEX
+    _WORKER_INDEX = GraphIndex(load_graph(path))
+
+
+def _worker_distances(source: str) -> "array[int]":
+    """Worker function running GraphIndex.distances_from."""
+    assert _WORKER_INDEX is not None
+    return _WORKER_INDEX.distances_from(source)
+
+
+def _worker_shortest_path(node_a: str, node_b: str) -> int:
+    """Worker function running GraphIndex.shortest_path."""
+    assert _WORKER_INDEX is not None
+    return _WORKER_INDEX.shortest_path(node_a, node_b)
+
+
+def _worker_largest_component() -> int:
+    """Worker function running csr_breadth_first_largest_component."""
+    assert _WORKER_INDEX is not None
+    return csr_breadth_first_largest_component(_WORKER_INDEX.graph)
+
+
+class ServerStats(NamedTuple):
+    """Path queries answered and the traversals run for them, the
+    difference being queries that joined a running traversal."""
+    queries: int
+    traversals: int
+
+
+class QueryServer:
+    """Holds a built undirected graph and answers shortest-path,
+    has-path and largest-component queries from coroutines, or from
+    clients over a stream with handle and serve_unix. Answers match
+    shortest_path.breadth_first_shortest_path,
+    undirected_path.undirected_path_breadth_first and
+    largest_component.depth_first_largest_component, unknown nodes
+    being unreachable. At most max_pending queries are in flight,
+    later ones wait for a slot. Traversals run in a single thread by
+    default, pure Python traversals not running in parallel under the
+    GIL anyway, use from_graph_file for worker processes, which send
+    back one int per lone query and one distance per node per shared
+    traversal. Every thread of an executor passed in traverses with
+    its own GraphIndex scratch arrays."""
+
+    def __init__(self,
+                 graph: CSRGraph,
+                 max_pending: int = 1024,
+                 executor: Optional[Executor] = None) -> None:
+        self.graph: CSRGraph = graph
+        self.max_pending: int = max_pending
+        self._local: threading.local = threading.local()
+        self._executor: Executor = (executor if executor is not None else
+                                    ThreadPoolExecutor(1))
+        self._distances: Callable[[str], "array[int]"] = (
+            self._thread_distances)
+        self._point: Callable[[str, str], int] = self._thread_shortest_path
+        self._largest: Callable[[], int] = partial(
+            csr_breadth_first_largest_component, graph)
+        self._largest_future: "Optional[asyncio.Future[int]]" = None
+        self._batches: "Dict[str, asyncio.Future[array[int]]]" = dict()
+        # Source of the lone query running, if any
+        self._lone: Optional[str] = None
+        # Created on first use so it belongs to the running loop
+        self._slots: Optional[asyncio.Semaphore] = None
+        self._queries: int = 0
+        self._traversals: int = 0
+
+    @classmethod
+    def from_edges(cls, edges: List[List[str]],
+                   max_pending: int = 1024) -> "QueryServer":
+        """Builds the server from an undirected edge list."""
+        return cls(CSRGraph.from_edges(edges), max_pending)
+
+    @classmethod
+    def from_graph_file(cls,
+                        path: str,
+                        max_pending: int = 1024,
+                        processes: int = 0) -> "QueryServer":
+        """Maps a graph file written by graph_file.write_graph. With
+        processes set, traversals run in that many worker processes,
+        each mapping the same file. Workers are spawned rather than
+        forked, so they do not inherit client sockets and keep them
+        open after the server closes them."""
+        if processes < 1:
+            return cls(load_graph(path), max_pending)
+        server: QueryServer = cls(
+            load_graph(path), max_pending,
+            ProcessPoolExecutor(processes,
+                                multiprocessing.get_context("spawn"),
+                                initializer=_load_worker,
+                                initargs=(path, )))
+        server._distances = _worker_distances
+        server._point = _worker_shortest_path
+        server._largest = _worker_largest_component
+        return server
+
+    def _thread_index(self) -> GraphIndex:
+        """Returns the GraphIndex of the calling thread, built on its
+        first traversal."""
+        index: Optional[GraphIndex] = getattr(self._local, "index", None)
+        if index is None:
+            index = self._local.index = GraphIndex(self.graph)
+        return index
+
+    def _thread_distances(self, source: str) -> "array[int]":
+        """Runs GraphIndex.distances_from in the calling thread."""
+        return self._thread_index().distances_from(source)
+
+    def _thread_shortest_path(self, node_a: str, node_b: str) -> int:
+        """Runs GraphIndex.shortest_path in the calling thread."""
+        return self._thread_index().shortest_path(node_a, node_b)
+
+    def _semaphore(self) -> asyncio.Semaphore:
+        """Returns the max_pending slots, created on first use."""
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_pending)
+        return self._slots
+
+    def stats(self) -> ServerStats:
+        """Returns the query and traversal counts."""
+        return ServerStats(self._queries, self._traversals)
+
+    def close(self) -> None:
+        """Shuts the executor down."""
+        self._executor.shutdown()
+
+    def _finish_batch(self, source: str,
+                      batch: "asyncio.Future[array[int]]") -> None:
+        """Stops queries from joining a finished traversal."""
+        if self._batches.get(source) is batch:
+            del self._batches[source]
+
+    def _finish_lone(self, point: "asyncio.Future[int]") -> None:
+        """Forgets a finished lone query."""
+        self._lone = None
+
+    def _forget_largest(self, largest: "asyncio.Future[int]") -> None:
+        """Forgets a failed largest-component traversal, so the next
+        query runs it again instead of getting the same error."""
+        if self._largest_future is largest and (largest.cancelled() or
+                                                largest.exception()):
+            self._largest_future = None
+
+    def _start_batch(self, source: str) -> "asyncio.Future[array[int]]":
+        """Starts a traversal to every node from source for queries
+        to join."""
+        batch: "asyncio.Future[array[int]]" = (
+            asyncio.get_running_loop().run_in_executor(
+                self._executor, self._distances, source))
+        self._batches[source] = batch
+        batch.add_done_callback(partial(self._finish_batch, source))
+        self._traversals += 1
+        return batch
+
+    async def _shortest_path(self, node_a: str, node_b: str) -> int:
+        """Answers a shortest-path query, joining a running traversal
+        from either node when there is one. Otherwise an idle server
+        searches from node_a until node_b is reached, a busy one
+        starts a traversal for later queries to join."""
+        if node_a == node_b:
+            return 0
+        index = self.graph.index
+        if node_a not in index or node_b not in index:
+            return -1
+        self._queries += 1
+        target: str = node_b
+        batch = self._batches.get(node_a)
+        if batch is None and node_b in self._batches:
+            target = node_a
+            batch = self._batches[node_b]
+        if batch is None and node_b == self._lone:
+            target = node_a
+            batch = self._start_batch(node_b)
+        elif batch is None and (self._lone is not None or self._batches):
+            batch = self._start_batch(node_a)
+        if batch is None:
+            point: "asyncio.Future[int]" = (
+                asyncio.get_running_loop().run_in_executor(
+                    self._executor, self._point, node_a, node_b))
+            self._lone = node_a
+            point.add_done_callback(self._finish_lone)
+            self._traversals += 1
+            return await asyncio.shield(point)
+        # Shielded, a cancelled query must not cancel its batch
+        distances: "array[int]" = await asyncio.shield(batch)
+        return distances[index[target]]
+
+    async def _largest_component(self) -> int:
+        """Answers a largest-component query, computed once unless
+        it fails."""
+        if self._largest_future is None:
+            self._largest_future = asyncio.get_running_loop().run_in_executor(
+                self._executor, self._largest)
+            self._largest_future.add_done_callback(self._forget_largest)
+        return await asyncio.shield(self._largest_future)
+
+    async def shortest_path(self, node_a: str, node_b: str) -> int:
+        """Returns the number of edges on the shortest path from
+        node_a to node_b, or -1 if they are not connected."""
+        async with self._semaphore():
+            return await self._shortest_path(node_a, node_b)
+
+    async def has_path(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_b is reachable from node_a."""
+        return await self.shortest_path(node_a, node_b) != -1
+
+    async def largest_component(self) -> int:
+        """Returns the number of nodes in the largest component."""
+        async with self._semaphore():
+            return await self._largest_component()
+
+    async def _answer(self, request: Any) -> Any:
+        """Answers one decoded request, see handle, raising ValueError
+        when it is malformed."""
+        if not isinstance(request, dict):
+            raise ValueError("request is not a JSON object")
+        operation: Any = request.get("op")
+        if operation == "largest_component":
+            return await self._largest_component()
+        if operation not in ("shortest_path", "has_path"):
+            raise ValueError("unknown op {!r}".format(operation))
+        node_a: Any = request.get("a")
+        node_b: Any = request.get("b")
+        if not isinstance(node_a, str) or not isinstance(node_b, str):
+            raise ValueError("{} needs string nodes a and b".format(operation))
+        distance: int = await self._shortest_path(node_a, node_b)
+        return distance if operation == "shortest_path" else distance != -1
+
+    async def _respond(self, line: bytes, writer: asyncio.StreamWriter,
+                       slots: asyncio.Semaphore) -> None:
+        """Answers one request line, always releasing its slot. Every
+        line gets a reply, an error one if answering it failed in any
+        way, as its client would otherwise wait forever."""
+        request_id: Any = None
+        response: Dict[str, Any]
+        try:
+            request: Any = json.loads(line)
+            if isinstance(request, dict):
+                request_id = request.get("id")
+            response = {
+                "id": request_id,
+                "result": await self._answer(request)
+            }
+        except Exception as error:
+            response = {"id": request_id, "error": str(error)}
+        finally:
+            slots.release()
+        writer.write(json.dumps(response).encode() + b"\n")
+        await writer.drain()
+
+    async def handle(self, reader: asyncio.StreamReader,
+                     writer: asyncio.StreamWriter) -> None:
+        """Serves one client sending one JSON request per line,
+        {"id": ..., "op": "shortest_path" | "has_path" |
+        "largest_component", "a": ..., "b": ...}, and answering each
+        with {"id": ..., "result": ...} or {"id": ..., "error": ...}
+        as soon as it is ready, so answers can come back out of
+        order. No more lines are read while every slot is taken, so
+        a client sending too fast is slowed down by the socket."""
+        slots: asyncio.Semaphore = self._semaphore()
+        pending: Set["asyncio.Future[None]"] = set()
+        try:
+            while True:
+                line: bytes = await reader.readline()
+                if not line:
+                    break
+                await slots.acquire()
+                task: "asyncio.Future[None]" = asyncio.ensure_future(
+                    self._respond(line, writer, slots))
+                pending.add(task)
+                task.add_done_callback(pending.discard)
+            if pending:
+                await asyncio.gather(*pending)
+        finally:
+            writer.close()
+
+    async def serve_unix(self, path: str) -> asyncio.AbstractServer:
+        """Starts serving clients on a Unix socket at path."""
+        return await asyncio.start_unix_server(self.handle, path)
+
+
+class QueryClient:
+    """Client for a QueryServer stream, any number of queries can be
+    awaited at once over one connection."""
+
+    def __init__(self, reader: asyncio.StreamReader,
+                 writer: asyncio.StreamWriter) -> None:
+        self._reader: asyncio.StreamReader = reader
+        self._writer: asyncio.StreamWriter = writer
+        self._waiting: "Dict[int, asyncio.Future[Any]]" = dict()
+        self._next_id: int = 0
+        self._receiver: "asyncio.Future[None]" = asyncio.ensure_future(
+            self._receive())
+
+    @classmethod
+    async def open_unix(cls, path: str) -> "QueryClient":
+        """Connects to a server on a Unix socket at path."""
+        reader, writer = await asyncio.open_unix_connection(path)
+        return cls(reader, writer)
+
+    async def _receive(self) -> None:
+        """Hands every answer to the query waiting for it."""
+        while True:
+            line: bytes = await self._reader.readline()
+            if not line:
+                break
+            response: Dict[str, Any] = json.loads(line)
+            # Replies to lines the server could not read carry no id
+            response_id: Any = response.get("id")
+            if response_id not in self._waiting:
+                continue
+            waiting: "asyncio.Future[Any]" = self._waiting.pop(response_id)
+            if "error" in response:
+                waiting.set_exception(ValueError(response["error"]))
+            else:
+                waiting.set_result(response["result"])
+        for pending in self._waiting.values():
+            pending.set_exception(ConnectionError("server went away"))
+        self._waiting.clear()
+
+    async def query(self, operation: str, node_a: str = "",
+                    node_b: str = "") -> Any:
+        """Sends one query and returns its result."""
+        self._next_id += 1
+        waiting: "asyncio.Future[Any]" = (
+            asyncio.get_running_loop().create_future())
+        self._waiting[self._next_id] = waiting
+        self._writer.write(
+            json.dumps({
+                "id": self._next_id,
+                "op": operation,
+                "a": node_a,
+                "b": node_b
+            }).encode() + b"\n")
+        await self._writer.drain()
+        return await waiting
+
+    async def close(self) -> None:
+        """Closes the connection once the server has answered every
+        query sent and closed its end."""
+        self._writer.write_eof()
+        await self._receiver
+        self._writer.close()
+
+
+# TESTS, run with python -m graph_algos.query_server
+if __name__ == "__main__":
+    from graph_algos.largest_component import depth_first_largest_component
+    from graph_algos.shortest_path import _build_graph
+    from graph_algos.shortest_path import breadth_first_shortest_path
+    from graph_algos.undirected_path import undirected_path_breadth_first
+
+    TEST_NODES: List[str] = ["w", "x", "y", "z", "v", "o", "n"]
+
+    async def check_in_process() -> None:
+        """Coroutine queries, batching and backpressure."""
+        server: QueryServer = QueryServer.from_edges(EDGES, max_pending=2)
+        results: List[Any] = await asyncio.gather(
+            *(server.shortest_path(a, b)
+              for a in TEST_NODES for b in TEST_NODES))
+        assert results == [
+            breadth_first_shortest_path(EDGES, a, b) for a in TEST_NODES
+            for b in TEST_NODES
+        ]
+        assert await server.has_path("w", "y")
+        assert not await server.has_path("w", "o")
+        assert await server.shortest_path("w", "missing") == -1
+        assert await server.largest_component(
+        ) == depth_first_largest_component(_build_graph(EDGES))
+
+        # A lone query stops at its target, queries arriving while it
+        # runs start traversals that later ones from or to their
+        # source share
+        server = QueryServer.from_edges(EDGES)
+        assert await server.shortest_path("w", "x") == 1
+        assert server.stats() == ServerStats(1, 1) and server._lone is None
+        server = QueryServer.from_edges(EDGES)
+        assert list(await asyncio.gather(server.shortest_path("w", "z"),
+                                         server.shortest_path("w", "y"),
+                                         server.shortest_path("x", "w"),
+                                         server.has_path("n", "o"))) == [
+                                             2, 2, 1, True
+                                         ]
+        assert server.stats() == ServerStats(4, 3)
+        assert server._lone is None and not server._batches
+
+        # A failed largest-component traversal is run again
+        def fail() -> int:
+            raise MemoryError
+
+        server._largest = fail
+        try:
+            await server.largest_component()
+            assert False
+        except MemoryError:
+            pass
+        server._largest = partial(csr_breadth_first_largest_component,
+                                  server.graph)
+        assert await server.largest_component() == 5
+        server.close()
+
+        # Every thread of a larger executor has its own scratch arrays
+        server = QueryServer(CSRGraph.from_edges(EDGES),
+                             executor=ThreadPoolExecutor(4))
+        for _ in range(20):
+            assert await asyncio.gather(
+                *(server.shortest_path(a, b)
+                  for a in TEST_NODES for b in TEST_NODES)) == results
+        server.close()
+
+    async def check_unix_socket(directory: str) -> None:
+        """Queries over a Unix socket, with a process pool."""
+        graph_path: str = os.path.join(directory, "graph.csr")
+        write_graph(graph_path, CSRGraph.from_edges(EDGES))
+        server: QueryServer = QueryServer.from_graph_file(graph_path,
+                                                          max_pending=1,
+                                                          processes=1)
+        socket_path: str = os.path.join(directory, "server.sock")
+        listener: asyncio.AbstractServer = await server.serve_unix(
+            socket_path)
+        client: QueryClient = await QueryClient.open_unix(socket_path)
+        results: List[Any] = await asyncio.gather(
+            *(client.query("has_path", a, b) for a in TEST_NODES
+              for b in TEST_NODES))
+        assert results == [
+            undirected_path_breadth_first(EDGES, a, b) for a in TEST_NODES
+            for b in TEST_NODES
+        ]
+        assert await client.query("shortest_path", "x", "v") == 2
+        assert await client.query("largest_component") == 5
+        try:
+            await client.query("diameter")
+            assert False
+        except ValueError:
+            pass
+
+        # Malformed lines are answered with errors, the client skips
+        # replies without an id
+        reader, writer = await asyncio.open_unix_connection(socket_path)
+        for line in (b"[1, 2]", b"not json",
+                     b'{"id": 1, "op": "shortest_path", "a": 1, "b": "w"}',
+                     b'{"id": 2, "op": "has_path", "a": "w"}'):
+            writer.write(line + b"\n")
+            reply: Dict[str, Any] = json.loads(await reader.readline())
+            assert "error" in reply and "result" not in reply
+        writer.close()
+        client._writer.write(b"not json\n")
+        assert await client.query("shortest_path", "w", "y") == 2
+
+        await client.close()
+        listener.close()
+        await listener.wait_closed()
+        server.close()
+
+    asyncio.run(check_in_process())
+    with tempfile.TemporaryDirectory() as TEST_DIRECTORY:
+        asyncio.run(check_unix_socket(TEST_DIRECTORY))
@@ -0,0 +1,507 @@
+"""shortest_path.py"""
+from array import array
+from collections import deque
+from typing import (Deque, Iterable, Iterator, List, Dict, Optional,
+                    Sequence, Set, Tuple, Union)
+from time import perf_counter
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.traversal_stats import TraversalStats, finish_call
+
+# Our simple undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ w ├─────┤ x ├─────┤ y │
+│   │     │   │     │   │
+└─┬─┘     └───┘     └─┬─┘
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │                   │
+  │       ┌───┐     ┌─┴─┐
+  │       │   │     │   │
+  └───────┤ v ├─────┤ z │
+          │   │     │   │
+          └───┘     └───┘
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["w", "x"],
+    ["x", "y"],
+    ["z", "y"],
+    ["z", "v"],
+    ["w", "v"],
+]
+
+# Convert to adjacency list, used to test against
+GRAPH: Dict[str, List[str]] = {
+    "w": ["x", "v"],
+    "x": ["w", "y"],
+    "y": ["x", "z"],
+    "z": ["y", "v"],
+    "v": ["z", "w"],
+}
+
+
+# Helper function
+def _build_graph(edges: Iterable[Sequence[str]]) -> Dict[str, List[str]]:
+    """Helper function to build undirected graph from edges, which
+    can be a generator like edge_reader.iter_edges. A weight column,
+    see weighted_path, is ignored."""
+    graph: Dict[str, List[str]] = dict()
+    _a: str
+    _b: str
+    for edge in edges:
+        _a, _b = edge[0], edge[1]
+        if _a not in graph:
+            graph[_a] = list()
+        if _b not in graph:
+            graph[_b] = list()
+        graph[_a].append(_b)
+        graph[_b].append(_a)
+    return graph
+
+
+# Breadth first edge count
+def breadth_first_count(graph: Dict[str, List[str]],
+                        src: str,
+                        dst: str,
+                        visited: Set[str],
+                        stats: Optional[TraversalStats] = None) -> int:
+    """Breadth first edge count iterative algo with cyclical checks.
+    Returns shortest amount of edgest between two nodes, or -1 if
+    components are not connected."""
+    queue: Deque[List[Union[str, int]]] = deque([[src, 0]])
+    while queue:
+        current, distance = queue.popleft()
+        if current == dst:
+            return int(distance)
+        if stats is not None:
+            stats.pop(len(queue) + 1, len(graph[str(current)]))
+        for neighbor in graph[str(current)]:
+            if neighbor in visited:
+                continue
+            visited.add(neighbor)
+            queue.append([neighbor, int(distance) + 1])
+    return -1
+
+
+# Depth first edge count
+def depth_first_count_iterative(graph: Dict[str, List[str]],
+                                src: str,
+                                dst: str,
+                                visited: Set[str],
+                                stats: Optional[TraversalStats] = None) -> int:
+    """Depth first edge count. Returns shortest amount of edgest
+    between two nodes, or -1 if components are not connected. A depth
+    first search reaches nodes along whatever path it takes first, not
+    the shortest one, and correcting its depths afterwards revisits
+    nodes over and over on graphs with many cycles, so the count is
+    left to breadth_first_count, one pass over the component. Use
+    iterative_deepening_path for a search keeping only the current
+    path in memory."""
+    visited.add(src)
+    return breadth_first_count(graph, src, dst, visited, stats)
+
+
+# Iterative deepening path search
+def iterative_deepening_path(graph: Dict[str, List[str]], src: str, dst: str,
+                             max_depth: int) -> List[str]:
+    """Depth first searches limited to 0, 1, 2 ... max_depth edges,
+    keeping only the current path in memory, so the first path found
+    is a shortest one. Returns its nodes, or an empty list if dst is
+    not within max_depth edges of src. Every search walks every
+    simple path up to its limit, which is fast for nearby nodes but
+    grows exponentially with the depth on graphs with many cycles."""
+    for limit in range(max_depth + 1):
+        path: List[str] = [src]
+        on_path: Set[str] = {src}
+        branches: List[Iterator[str]] = [iter(graph[src])]
+        cut_off: bool = False
+        while path:
+            if path[-1] == dst:
+                return path
+            if len(path) > limit:
+                # Nodes left unexplored below the limit, search deeper
+                cut_off = cut_off or any(neighbor not in on_path
+                                         for neighbor in graph[path[-1]])
+                on_path.discard(path.pop())
+                branches.pop()
+                continue
+            neighbor: Optional[str] = next(branches[-1], None)
+            if neighbor is None:
+                on_path.discard(path.pop())
+                branches.pop()
+            elif neighbor not in on_path:
+                path.append(neighbor)
+                on_path.add(neighbor)
+                branches.append(iter(graph[neighbor]))
+        if not cut_off:
+            break
+    return list()
+
+
+# Bidirectional breadth first edge count
+def _expand_level(
+        graph: Dict[str, List[str]], frontier: List[str],
+        depths: Dict[str, int], parents: Dict[str, str],
+        other_depths: Dict[str, int]) -> Tuple[List[str], Optional[str]]:
+    """Helper function expanding one full level of a search frontier.
+    Returns the next frontier and the node where this search met the
+    other one on the shortest combined path, or None."""
+    next_frontier: List[str] = list()
+    meet: Optional[str] = None
+    meet_length: int = -1
+    for current in frontier:
+        depth: int = depths[current] + 1
+        for neighbor in graph[current]:
+            if neighbor in depths:
+                continue
+            depths[neighbor] = depth
+            parents[neighbor] = current
+            next_frontier.append(neighbor)
+            if neighbor in other_depths:
+                length: int = depth + other_depths[neighbor]
+                if meet_length == -1 or length < meet_length:
+                    meet, meet_length = neighbor, length
+    return next_frontier, meet
+
+
+def bidirectional_breadth_first_path(graph: Dict[str, List[str]], src: str,
+                                     dst: str) -> List[str]:
+    """Bidirectional breadth first search over an undirected graph,
+    always expanding the smaller of the two frontiers by one level.
+    Returns the nodes on a shortest path from src to dst, or an empty
+    list if components are not connected or either node is not in
+    the graph."""
+    if src not in graph or dst not in graph:
+        return list()
+    if src == dst:
+        return [src]
+    forward_depths: Dict[str, int] = {src: 0}
+    backward_depths: Dict[str, int] = {dst: 0}
+    forward_parents: Dict[str, str] = dict()
+    backward_parents: Dict[str, str] = dict()
+    forward: List[str] = [src]
+    backward: List[str] = [dst]
+    meet: Optional[str] = None
+    while forward and backward and meet is None:
+        if len(forward) <= len(backward):
+            forward, meet = _expand_level(graph, forward, forward_depths,
+                                          forward_parents, backward_depths)
+        else:
+            backward, meet = _expand_level(graph, backward, backward_depths,
+                                           backward_parents, forward_depths)
+    if meet is None:
+        return list()
+    path: List[str] = [meet]
+    while path[-1] != src:
+        path.append(forward_parents[path[-1]])
+    path.reverse()
+    while path[-1] != dst:
+        path.append(backward_parents[path[-1]])
+    return path
+
+
+def bidirectional_breadth_first_count(graph: Dict[str, List[str]], src: str,
+                                      dst: str) -> int:
+    """Bidirectional breadth first edge count. Returns shortest amount
+    of edges between two nodes, or -1 if components are not
+    connected."""
+    return len(bidirectional_breadth_first_path(graph, src, dst)) - 1
+
+
+def breadth_first_shortest_path(edges: List[List[str]],
+                                node_a: str,
+                                node_b: str,
+                                stats: Optional[TraversalStats] = None) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    breadth-first and returns the number of edges from the
+    source node to the destination node, or -1 if components
+    are not connected."""
+    start: float = perf_counter()
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    built: float = perf_counter()
+    visited: Set[str] = {node_a}
+    shortest_path: int = breadth_first_count(graph, node_a, node_b, visited,
+                                             stats)
+    finish_call(stats, "breadth_first_shortest_path", start, built)
+    return shortest_path
+
+
+def depth_first_shortest_path(edges: List[List[str]],
+                              node_a: str,
+                              node_b: str,
+                              stats: Optional[TraversalStats] = None) -> int:
+    """Takes in a graph adjacency list, traverses the graph
+    depth-first and returns the number of edges from the
+    source node to the destination node, or -1 if components
+    are not connected."""
+    start: float = perf_counter()
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    built: float = perf_counter()
+    visited: Set[str] = {node_a}
+    shortest_path: int = depth_first_count_iterative(graph, node_a, node_b,
+                                                     visited, stats)
+    finish_call(stats, "depth_first_shortest_path", start, built)
+    return shortest_path
+
+
+def bidirectional_shortest_path(edges: List[List[str]], node_a: str,
+                                node_b: str) -> int:
+    """Takes in an edge list, searches the graph breadth-first from
+    both ends at once and returns the number of edges from the
+    source node to the destination node, or -1 if components are
+    not connected."""
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    return bidirectional_breadth_first_count(graph, node_a, node_b)
+
+
+def bidirectional_shortest_node_path(edges: List[List[str]], node_a: str,
+                                     node_b: str) -> List[str]:
+    """Takes in an edge list, searches the graph breadth-first from
+    both ends at once and returns the nodes on a shortest path from
+    the source node to the destination node, or an empty list if
+    components are not connected."""
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    return bidirectional_breadth_first_path(graph, node_a, node_b)
+
+
+def breadth_first_shortest_node_path(edges: List[List[str]], node_a: str,
+                                     node_b: str) -> List[str]:
+    """Takes in an edge list, builds it as a CSR graph, traverses it
+    breadth-first recording every node's parent in an int array and
+    returns the nodes on a shortest path from the source node to the
+    destination node, or an empty list if components are not
+    connected or either node is not in the graph."""
+    graph: CSRGraph = CSRGraph.from_edges(edges)
+    if node_a not in graph.index or node_b not in graph.index:
+        return list()
+    return csr_breadth_first_node_path(graph, node_a, node_b)
+
+
+def iterative_deepening_shortest_node_path(edges: List[List[str]],
+                                           node_a: str, node_b: str,
+                                           max_depth: int) -> List[str]:
+    """Takes in an edge list, searches the graph depth-first with
+    increasing depth limits and returns the nodes on a shortest path
+    from the source node to the destination node, or an empty list
+    if it is more than max_depth edges away."""
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    return iterative_deepening_path(graph, node_a, node_b, max_depth)
+
+
+# CSR graph variants, the graph is built once with CSRGraph.from_edges
+def csr_breadth_first_shortest_path(graph: CSRGraph, node_a: str,
+                                    node_b: str) -> int:
+    """Breadth first edge count iterative algo over a CSR graph.
+    Returns shortest amount of edges between two nodes, or -1 if
+    components are not connected."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    src: int = graph.index[node_a]
+    dst: int = graph.index[node_b]
+    visited: bytearray = bytearray(graph.node_count())
+    visited[src] = 1
+    queue: Deque[Tuple[int, int]] = deque([(src, 0)])
+    while queue:
+        current, distance = queue.popleft()
+        if current == dst:
+            return distance
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if visited[neighbor]:
+                continue
+            visited[neighbor] = 1
+            queue.append((neighbor, distance + 1))
+    return -1
+
+
+def csr_depth_first_shortest_path(graph: CSRGraph, node_a: str,
+                                  node_b: str) -> int:
+    """Depth first edge count over a CSR graph, left to
+    csr_breadth_first_shortest_path like depth_first_count_iterative.
+    Returns shortest amount of edges between two nodes, or -1 if
+    components are not connected."""
+    return csr_breadth_first_shortest_path(graph, node_a, node_b)
+
+
+# Shortest paths as node lists over a CSR graph
+"""
+parents: int32 per node id, -1 until the node is reached
+
+    w ── x ── y          id:      w  x  y  z  v
+    │         │          parent: -1  0  1  4  0
+    v ─────── z
+                         z -> parents[3] = v -> parents[4] = w
+"""
+
+
+def _trace_parents(parents: "array[int]", dst: int) -> List[int]:
+    """Helper function following parent ids from dst back to the
+    source, whose parent is -1. Returns the ids source first."""
+    path: List[int] = [dst]
+    while parents[path[-1]] != -1:
+        path.append(parents[path[-1]])
+    path.reverse()
+    return path
+
+
+def csr_breadth_first_node_path(graph: CSRGraph, node_a: str,
+                                node_b: str) -> List[str]:
+    """Breadth first search over a CSR graph, the parent array doubles
+    as the visited marks. Returns the nodes on a shortest path between
+    two nodes, or an empty list if components are not connected."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    src: int = graph.index[node_a]
+    dst: int = graph.index[node_b]
+    parents: "array[int]" = array("i", [-1]) * graph.node_count()
+    parents[src] = src
+    queue: Deque[int] = deque([src])
+    while queue:
+        current: int = queue.popleft()
+        if current == dst:
+            parents[src] = -1
+            return [graph.labels[i] for i in _trace_parents(parents, dst)]
+        for neighbor in neighbors[offsets[current]:offsets[current + 1]]:
+            if parents[neighbor] != -1:
+                continue
+            parents[neighbor] = current
+            queue.append(neighbor)
+    return list()
+
+
+def csr_iterative_deepening_node_path(graph: CSRGraph, node_a: str,
+                                      node_b: str,
+                                      max_depth: int) -> List[str]:
+    """Depth first searches over a CSR graph limited to 0, 1, 2 ...
+    max_depth edges. Only the current path and the next neighbor
+    position of each node on it are kept, two int arrays of at most
+    max_depth + 1 entries, so memory does not grow with the graph.
+    Returns the nodes on a shortest path, or an empty list if node_b
+    is not within max_depth edges of node_a."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    src: int = graph.index[node_a]
+    dst: int = graph.index[node_b]
+    for limit in range(max_depth + 1):
+        path: "array[int]" = array("i", [src])
+        positions: "array[int]" = array("i", [offsets[src]])
+        on_path: Set[int] = {src}
+        cut_off: bool = False
+        while path:
+            current: int = path[-1]
+            if current == dst:
+                return [graph.labels[i] for i in path]
+            end: int = offsets[current + 1]
+            if len(path) > limit:
+                # Nodes left unexplored below the limit, search deeper
+                cut_off = cut_off or any(
+                    neighbor not in on_path
+                    for neighbor in neighbors[offsets[current]:end])
+                on_path.discard(path.pop())
+                positions.pop()
+            elif positions[-1] == end:
+                on_path.discard(path.pop())
+                positions.pop()
+            else:
+                neighbor: int = neighbors[positions[-1]]
+                positions[-1] += 1
+                if neighbor not in on_path:
+                    path.append(neighbor)
+                    positions.append(offsets[neighbor])
+                    on_path.add(neighbor)
+        if not cut_off:
+            break
+    return list()
+
+
+# TESTS, run with python -m graph_algos.shortest_path
+if __name__ == "__main__":
+    import random
+
+    assert _build_graph(EDGES) == GRAPH
+    assert breadth_first_shortest_path(EDGES, "w", "z") == 2
+    assert depth_first_shortest_path(EDGES, "w", "z") == 2
+
+    assert bidirectional_shortest_path(EDGES, "w", "z") == 2
+    assert bidirectional_shortest_path(EDGES, "w", "w") == 0
+    assert bidirectional_shortest_path(EDGES + [["a", "b"]], "w", "a") == -1
+    assert bidirectional_shortest_node_path(EDGES, "w", "z") == ["w", "v", "z"]
+    assert bidirectional_shortest_node_path(EDGES, "x", "z") == ["x", "y", "z"]
+    assert bidirectional_shortest_node_path(EDGES, "w", "x") == ["w", "x"]
+    assert bidirectional_shortest_path(EDGES, "w", "q") == -1
+    assert bidirectional_shortest_path(EDGES, "q", "w") == -1
+    assert bidirectional_shortest_node_path(EDGES, "q", "q") == []
+    assert bidirectional_shortest_path([["", "a"]], "a", "") == 1
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES)
+    assert csr_breadth_first_shortest_path(CSR_GRAPH, "w", "z") == 2
+    assert csr_depth_first_shortest_path(CSR_GRAPH, "w", "z") == 2
+
+    # Depth first counts are minimal even when the first path found is
+    # not, w is reached through the long way round before through a
+    TEST_EDGES: List[List[str]] = [["s", "a"], ["s", "b"], ["b", "c"],
+                                   ["c", "w"], ["a", "w"], ["w", "t"]]
+    assert depth_first_shortest_path(TEST_EDGES, "s", "t") == 3
+    assert csr_depth_first_shortest_path(CSRGraph.from_edges(TEST_EDGES),
+                                         "s", "t") == 3
+    TEST_RNG: random.Random = random.Random(0)
+    for _ in range(400):
+        TEST_RANDOM: CSRGraph = CSRGraph.from_edges(
+            [[str(TEST_RNG.randrange(30)),
+              str(TEST_RNG.randrange(30))] for _ in range(40)])
+        TEST_A, TEST_B = TEST_RNG.sample(TEST_RANDOM.labels, 2)
+        assert csr_depth_first_shortest_path(
+            TEST_RANDOM, TEST_A,
+            TEST_B) == csr_breadth_first_shortest_path(
+                TEST_RANDOM, TEST_A, TEST_B)
+    # One pass over the component, a grid has many paths of every length
+    TEST_GRID: List[List[str]] = list()
+    for TEST_ROW in range(200):
+        for TEST_COLUMN in range(200):
+            TEST_NODE: str = str(TEST_ROW * 200 + TEST_COLUMN)
+            if TEST_COLUMN < 199:
+                TEST_GRID.append([TEST_NODE, str(TEST_ROW * 200 + TEST_COLUMN
+                                                 + 1)])
+            if TEST_ROW < 199:
+                TEST_GRID.append([TEST_NODE, str(TEST_ROW * 200 + TEST_COLUMN
+                                                 + 200)])
+    TEST_START: float = perf_counter()
+    assert depth_first_shortest_path(TEST_GRID, "0", "39999") == 398
+    assert csr_depth_first_shortest_path(CSRGraph.from_edges(TEST_GRID), "0",
+                                         "39999") == 398
+    assert perf_counter() - TEST_START < 5
+    # Multi-character labels are not split into their characters
+    assert breadth_first_shortest_path([["ab", "b"], ["b", "c"]], "ab",
+                                       "c") == 2
+    assert depth_first_shortest_path([["ab", "b"], ["b", "c"]], "ab",
+                                     "c") == 2
+
+    # Node paths from the parent array and from iterative deepening
+    assert breadth_first_shortest_node_path(EDGES, "w", "z") == [
+        "w", "v", "z"
+    ]
+    assert breadth_first_shortest_node_path(EDGES, "w", "w") == ["w"]
+    assert breadth_first_shortest_node_path(EDGES, "w", "q") == []
+    assert breadth_first_shortest_node_path(EDGES, "q", "w") == []
+    assert csr_breadth_first_node_path(CSR_GRAPH, "x", "z") == ["x", "y", "z"]
+    for TEST_MAX_DEPTH in (2, 10):
+        assert iterative_deepening_shortest_node_path(
+            EDGES, "w", "z", TEST_MAX_DEPTH) == ["w", "v", "z"]
+        assert csr_iterative_deepening_node_path(
+            CSR_GRAPH, "w", "z", TEST_MAX_DEPTH) == ["w", "v", "z"]
+    assert iterative_deepening_shortest_node_path(EDGES, "w", "z", 1) == []
+    assert csr_iterative_deepening_node_path(CSR_GRAPH, "w", "z", 1) == []
+    assert iterative_deepening_shortest_node_path(TEST_EDGES, "s", "t",
+                                                  10) == ["s", "a", "w", "t"]
+    TEST_CSR: CSRGraph = CSRGraph.from_edges(TEST_EDGES + [["x", "y"]])
+    assert csr_breadth_first_node_path(TEST_CSR, "s", "t") == [
+        "s", "a", "w", "t"
+    ]
+    assert csr_breadth_first_node_path(TEST_CSR, "s", "y") == []
+    assert csr_iterative_deepening_node_path(TEST_CSR, "s", "t",
+                                             10) == ["s", "a", "w", "t"]
+    assert csr_iterative_deepening_node_path(TEST_CSR, "s", "y", 10) == []
@@ -0,0 +1,202 @@
+"""traversal_stats.py"""
+from time import perf_counter
+from typing import Callable, Dict, Iterable, List, Optional
+
+# Instrumenting a traversal
+"""
+stats = TraversalStats(hooks=[forward_to_metrics])
+undirected_path_breadth_first(edges, "i", "m", stats)
+    │
+    ├─ build      _build_graph(edges)         build_seconds
+    ├─ traverse   every node taken off the    nodes_popped
+    │             queue, stack or call stack  edges_scanned
+    │                                         duplicate_enqueues
+    │                                         max_frontier
+    │                                         traverse_seconds
+    └─ finish     forward_to_metrics("undirected_path_breadth_first", stats)
+
+Traversals take stats as an optional last argument and count behind
+"if stats is not None" checks, which are all they cost left as None.
+Every entry point, taking a whole edge list, graph or grid, finishes
+its call once: calls goes up and the hooks run. Those given a graph
+or grid already built leave build_seconds at 0. Helpers taking a
+visited set only count, their caller finishes.
+"""
+
+# Called with the function name and its stats when a call finishes
+Hook = Callable[[str, "TraversalStats"], None]
+
+
+class TraversalStats:
+    """Work counters for one or more traversal calls. nodes_popped
+    counts nodes taken off a queue or stack, or recursive calls,
+    edges_scanned the neighbors looked at from them, and
+    duplicate_enqueues the nodes taken off a second time, which the
+    searches marking nodes visited as they are pushed never have.
+    max_frontier is the largest queue, stack or recursion depth seen.
+    Entry points add one to calls and run every hook as they finish,
+    timing the build of a graph from an edge list and the traversal
+    separately."""
+
+    __slots__ = ("nodes_popped", "edges_scanned", "duplicate_enqueues",
+                 "max_frontier", "build_seconds", "traverse_seconds",
+                 "calls", "hooks", "_depth")
+
+    def __init__(self, hooks: Iterable[Hook] = ()) -> None:
+        self.hooks: List[Hook] = list(hooks)
+        self.reset()
+
+    def reset(self) -> None:
+        """Zeroes every counter, keeping the hooks."""
+        self.nodes_popped: int = 0
+        self.edges_scanned: int = 0
+        self.duplicate_enqueues: int = 0
+        self.max_frontier: int = 0
+        self.build_seconds: float = 0.0
+        self.traverse_seconds: float = 0.0
+        self.calls: int = 0
+        self._depth: int = 0
+
+    def pop(self, frontier: int, edges: int) -> None:
+        """Counts a node taken off a frontier of frontier nodes,
+        itself included, and the edges about to be scanned from it."""
+        self.nodes_popped += 1
+        self.edges_scanned += edges
+        if frontier > self.max_frontier:
+            self.max_frontier = frontier
+
+    def duplicate(self) -> None:
+        """Counts a node taken off the frontier after being visited."""
+        self.duplicate_enqueues += 1
+
+    def enter(self, edges: int) -> None:
+        """Counts a recursive call and the edges it scans, the
+        recursion depth being its frontier."""
+        self._depth += 1
+        self.pop(self._depth, edges)
+
+    def leave(self) -> None:
+        """Ends a recursive call counted by enter."""
+        self._depth -= 1
+
+    def finish(self, function: str, start: float, built: float) -> None:
+        """Records a call that built its graph between start and built
+        and traversed it until now, in perf_counter seconds, then runs
+        every hook."""
+        self.build_seconds += built - start
+        self.traverse_seconds += perf_counter() - built
+        self.calls += 1
+        for hook in self.hooks:
+            hook(function, self)
+
+    def as_dict(self) -> Dict[str, float]:
+        """Returns the counters by name, ready for a metrics client."""
+        return {
+            "nodes_popped": self.nodes_popped,
+            "edges_scanned": self.edges_scanned,
+            "duplicate_enqueues": self.duplicate_enqueues,
+            "max_frontier": self.max_frontier,
+            "build_seconds": self.build_seconds,
+            "traverse_seconds": self.traverse_seconds,
+            "calls": self.calls,
+        }
+
+
+def finish_call(stats: Optional[TraversalStats], function: str,
+                start: float, built: float) -> None:
+    """Finishes a call of function, see TraversalStats.finish, when
+    stats were asked for. Used by every entry point, with built equal
+    to start when there is no graph to build."""
+    if stats is not None:
+        stats.finish(function, start, built)
+
+
+# TESTS, run with python -m graph_algos.traversal_stats
+if __name__ == "__main__":
+    from graph_algos import (has_path, island_count, largest_component,
+                             minimum_island, shortest_path, undirected_path)
+
+    TEST_CALLS: List[str] = list()
+    TEST_STATS: TraversalStats = TraversalStats(
+        [lambda function, stats: TEST_CALLS.append(function)])
+    assert shortest_path.breadth_first_shortest_path(
+        shortest_path.EDGES, "w", "z", TEST_STATS) == 2
+    assert TEST_CALLS == ["breadth_first_shortest_path"]
+    assert TEST_STATS.calls == 1
+    assert TEST_STATS.nodes_popped == 4
+    assert TEST_STATS.edges_scanned == 8
+    assert TEST_STATS.duplicate_enqueues == 0
+    assert TEST_STATS.max_frontier == 2
+    assert TEST_STATS.build_seconds > 0 and TEST_STATS.traverse_seconds > 0
+
+    # Searches marking nodes visited when popped enqueue some twice
+    TEST_STATS = TraversalStats()
+    assert not undirected_path.undirected_path_breadth_first(
+        undirected_path.EDGES, "i", "o", TEST_STATS)
+    assert TEST_STATS.nodes_popped == 5
+    assert TEST_STATS.edges_scanned == 8
+    assert TEST_STATS.duplicate_enqueues == 4
+    assert TEST_STATS.as_dict()["calls"] == 1
+
+    # Recursion depth is the frontier of the recursive searches
+    TEST_STATS = TraversalStats()
+    assert largest_component.depth_first_count_recursive(
+        largest_component.GRAPH, "0", set(), TEST_STATS) == 4
+    assert TEST_STATS.max_frontier == 3
+    assert TEST_STATS._depth == 0
+    TEST_STATS.reset()
+    assert has_path.breadth_first_has_path(has_path.GRAPH,
+                                           "f",
+                                           "k",
+                                           stats=TEST_STATS)
+    assert TEST_STATS.nodes_popped == 4 and TEST_STATS.calls == 1
+    TEST_STATS.reset()
+    assert island_count.island_count(island_count.GRID, TEST_STATS) == 3
+    assert TEST_STATS.nodes_popped == sum(
+        row.count("L") for row in island_count.GRID)
+    TEST_STATS.reset()
+    assert island_count._explore(island_count.GRID, 0, 1, set(), TEST_STATS)
+    assert TEST_STATS.max_frontier == 2 and TEST_STATS._depth == 0
+    TEST_STATS.reset()
+    assert minimum_island._explore(minimum_island.GRID, 3, 3, set(),
+                                   TEST_STATS) == 5
+    assert TEST_STATS.nodes_popped == 5 and TEST_STATS._depth == 0
+    TEST_STATS.reset()
+    assert minimum_island.minimum_island_count(minimum_island.GRID,
+                                               TEST_STATS) == 2
+    assert TEST_STATS.nodes_popped == sum(
+        row.count("L") for row in minimum_island.GRID)
+
+    # Every entry point finishes once, recursive ones included
+    TEST_CALLS.clear()
+    TEST_STATS = TraversalStats(
+        [lambda function, stats: TEST_CALLS.append(function)])
+    assert has_path.depth_first_has_path_recursive(has_path.GRAPH,
+                                                   "f",
+                                                   "k",
+                                                   stats=TEST_STATS)
+    assert has_path.depth_first_has_path_iterative(has_path.GRAPH,
+                                                   "j",
+                                                   "f",
+                                                   stats=TEST_STATS) is False
+    assert has_path.breadth_first_has_path(has_path.GRAPH,
+                                           "f",
+                                           "k",
+                                           stats=TEST_STATS)
+    assert island_count.island_count(island_count.GRID, TEST_STATS) == 3
+    assert minimum_island.minimum_island_count(minimum_island.GRID,
+                                               TEST_STATS) == 2
+    assert largest_component.breadth_first_largest_component(
+        largest_component.GRAPH, TEST_STATS) == 4
+    assert TEST_CALLS == [
+        "depth_first_has_path_recursive", "depth_first_has_path_iterative",
+        "breadth_first_has_path", "island_count", "minimum_island_count",
+        "breadth_first_largest_component"
+    ]
+    assert TEST_STATS.calls == 6 and TEST_STATS.build_seconds == 0
+    assert TEST_STATS._depth == 0
+
+    # Without stats the uninstrumented loops run and give the same
+    assert shortest_path.depth_first_shortest_path(shortest_path.EDGES, "w",
+                                                   "z") == 2
+    finish_call(None, "unused", 0.0, 0.0)
@@ -0,0 +1,263 @@
+"""undirected_path.py"""
+from collections import deque
+from time import perf_counter
+from typing import Deque, Iterable, List, Dict, Optional, Sequence, Set
+from graph_algos.csr_graph import CSRGraph
+from graph_algos.traversal_stats import TraversalStats, finish_call
+
+# Our simple undirected graph structure to play with
+"""
+┌───┐     ┌───┐
+│   │     │   │
+│ i ├─────┤ j │
+│   │     │   │
+└─┬─┘     └───┘
+  │
+  │
+  │
+  │
+  │
+┌─┴─┐     ┌───┐
+│   │     │   │
+│ k ├─────┤ l │
+│   │     │   │
+└─┬─┘     └───┘
+  │
+  │
+  │
+  │
+  │
+┌─┴─┐
+│   │
+│ m │
+│   │
+└───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ o ├─────┤ n │
+│   │     │   │
+└───┘     └───┘
+"""
+
+# Edge list
+EDGES: List[List[str]] = [
+    ["i", "j"],
+    ["k", "i"],
+    ["m", "k"],
+    ["k", "l"],
+    ["o", "n"],
+]
+
+# Convert to adjacency list, used to test against
+GRAPH: Dict[str, List[str]] = {
+    "i": ["j", "k"],
+    "j": ["i"],
+    "k": ["i", "m", "l"],
+    "m": ["k"],
+    "l": ["k"],
+    "o": ["n"],
+    "n": ["o"],
+}
+
+
+# Helper function
+def _build_graph(edges: Iterable[Sequence[str]]) -> Dict[str, List[str]]:
+    """Helper function to build undirected graph from edges, which
+    can be a generator like edge_reader.iter_edges. A weight column,
+    see weighted_path, is ignored."""
+    graph: Dict[str, List[str]] = dict()
+    _a: str
+    _b: str
+    for edge in edges:
+        _a, _b = edge[0], edge[1]
+        if _a not in graph:
+            graph[_a] = list()
+        if _b not in graph:
+            graph[_b] = list()
+        graph[_a].append(_b)
+        graph[_b].append(_a)
+    return graph
+
+
+# Depth first has-path
+def depth_first_has_path_recursive(
+        graph: Dict[str, List[str]],
+        src: str,
+        dst: str,
+        visited: Set[str],
+        stats: Optional[TraversalStats] = None) -> bool:
+    """Depth first has-path recursive algo with cyclical checks."""
+    if src == dst:
+        return True
+    if src in visited:
+        if stats is not None:
+            stats.duplicate()
+        return False
+    visited.add(src)
+    if stats is not None:
+        stats.enter(len(graph[src]))
+    for neighbor in graph[src]:
+        if depth_first_has_path_recursive(graph, neighbor, dst, visited,
+                                          stats):
+            if stats is not None:
+                stats.leave()
+            return True
+    if stats is not None:
+        stats.leave()
+    return False
+
+
+def depth_first_has_path_iterative(
+        graph: Dict[str, List[str]],
+        src: str,
+        dst: str,
+        visited: Set[str],
+        stats: Optional[TraversalStats] = None) -> bool:
+    """Depth first has-path iterative algo with cyclical checks,
+    visits nodes in the same order as depth_first_has_path_recursive
+    without recursing."""
+    stack: Deque[str] = deque([src])
+    while stack:
+        current: str = stack.pop()
+        if current == dst:
+            return True
+        if current in visited:
+            if stats is not None:
+                stats.duplicate()
+            continue
+        visited.add(current)
+        if stats is not None:
+            stats.pop(len(stack) + 1, len(graph[current]))
+        stack.extend(reversed(graph[current]))
+    return False
+
+
+# Breadth first has-path
+def breadth_first_has_path(graph: Dict[str, List[str]],
+                           src: str,
+                           dst: str,
+                           visited: Set[str],
+                           stats: Optional[TraversalStats] = None) -> bool:
+    """Breadth first has-path iterative algo with cyclical checks."""
+    queue: Deque[str] = deque([src])
+    while queue:
+        current: str = queue.popleft()
+        if current == dst:
+            return True
+        if current in visited:
+            if stats is not None:
+                stats.duplicate()
+            continue
+        visited.add(current)
+        if stats is not None:
+            stats.pop(len(queue) + 1, len(graph[current]))
+        for neighbor in graph[current]:
+            queue.append(neighbor)
+    return False
+
+
+# Undirected graph traversal algos
+def undirected_path_depth_first(
+        edges: List[List[str]],
+        node_a: str,
+        node_b: str,
+        stats: Optional[TraversalStats] = None) -> bool:
+    """Undirected depth first has-path iterative algo
+    with cyclical checks from edge list input."""
+    start: float = perf_counter()
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    built: float = perf_counter()
+    found: bool = depth_first_has_path_iterative(graph, node_a, node_b,
+                                                 set(), stats)
+    finish_call(stats, "undirected_path_depth_first", start, built)
+    return found
+
+
+def undirected_path_breadth_first(
+        edges: List[List[str]],
+        node_a: str,
+        node_b: str,
+        stats: Optional[TraversalStats] = None) -> bool:
+    """Undirected breadth first has-path iterative algo
+    with cyclical checks from edge list input."""
+    start: float = perf_counter()
+    graph: Dict[str, List[str]] = _build_graph(edges)
+    built: float = perf_counter()
+    found: bool = breadth_first_has_path(graph, node_a, node_b, set(), stats)
+    finish_call(stats, "undirected_path_breadth_first", start, built)
+    return found
+
+
+# CSR graph variants, the graph is built once with CSRGraph.from_edges
+def csr_undirected_path_depth_first(graph: CSRGraph, node_a: str,
+                                    node_b: str) -> bool:
+    """Undirected depth first has-path iterative algo
+    with cyclical checks over a CSR graph."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    target: int = graph.index[node_b]
+    visited: bytearray = bytearray(graph.node_count())
+    stack: Deque[int] = deque([graph.index[node_a]])
+    while stack:
+        current: int = stack.pop()
+        if current == target:
+            return True
+        if visited[current]:
+            continue
+        visited[current] = 1
+        stack.extend(
+            reversed(neighbors[offsets[current]:offsets[current + 1]]))
+    return False
+
+
+def csr_undirected_path_breadth_first(graph: CSRGraph, node_a: str,
+                                      node_b: str) -> bool:
+    """Undirected breadth first has-path iterative algo
+    with cyclical checks over a CSR graph."""
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    target: int = graph.index[node_b]
+    visited: bytearray = bytearray(graph.node_count())
+    queue: Deque[int] = deque([graph.index[node_a]])
+    while queue:
+        current: int = queue.popleft()
+        if current == target:
+            return True
+        if visited[current]:
+            continue
+        visited[current] = 1
+        queue.extend(neighbors[offsets[current]:offsets[current + 1]])
+    return False
+
+
+# TESTS, run with python -m graph_algos.undirected_path
+if __name__ == "__main__":
+    TEST_GRAPH: Dict[str, List[str]] = _build_graph(EDGES)
+    assert TEST_GRAPH == GRAPH
+    assert _build_graph([edge + ["1.5"] for edge in EDGES]) == GRAPH
+
+    assert depth_first_has_path_recursive(GRAPH, "j", "m", set())
+    assert depth_first_has_path_recursive(GRAPH, "j", "n", set()) is False
+    assert depth_first_has_path_iterative(GRAPH, "j", "m", set())
+    assert depth_first_has_path_iterative(GRAPH, "j", "n", set()) is False
+
+    assert undirected_path_depth_first(EDGES, "j", "m")
+    assert undirected_path_depth_first(EDGES, "j", "n") is False
+
+    assert undirected_path_breadth_first(EDGES, "j", "m")
+    assert undirected_path_breadth_first(EDGES, "j", "n") is False
+
+    CHAIN_EDGES: List[List[str]] = [[str(i), str(i + 1)] for i in range(5000)]
+    assert undirected_path_depth_first(CHAIN_EDGES, "0", "5000")
+
+    CSR_GRAPH: CSRGraph = CSRGraph.from_edges(EDGES)
+    assert csr_undirected_path_depth_first(CSR_GRAPH, "j", "m")
+    assert csr_undirected_path_depth_first(CSR_GRAPH, "j", "n") is False
+
+    assert csr_undirected_path_breadth_first(CSR_GRAPH, "j", "m")
+    assert csr_undirected_path_breadth_first(CSR_GRAPH, "j", "n") is False
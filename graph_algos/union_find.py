@@ -0,0 +1,173 @@
+"""union_find.py"""
+from array import array
+from typing import Dict, List, MutableSequence
+
+# Our 2 component undirected graph structure to play with
+"""
+┌───┐     ┌───┐     ┌───┐
+│   │     │   │     │   │
+│ 1 ├─────┤ 0 ├─────┤ 5 │
+│   │     │   │     │   │
+└───┘     └─┬─┘     └─┬─┘
+            │         │
+            │         │
+            │         │
+            │         │
+            │         │
+          ┌─┴─┐       │
+          │   │       │
+          │ 8 ├───────┘
+          │   │
+          └───┘
+
+
+
+
+
+┌───┐     ┌───┐
+│   │     │   │
+│ 2 ├─────┤ 3 │
+│   │     │   │
+└─┬─┘     └─┬─┘
+  │         │
+  │         │
+  │         │
+  │         │
+  │         │
+  │       ┌─┴─┐
+  │       │   │
+  └───────┤ 4 │
+          │   │
+          └───┘
+"""
+
+GRAPH: Dict[str, List[str]] = {
+    "0": ["8", "1", "5"],
+    "1": ["0"],
+    "5": ["0", "8"],
+    "8": ["0", "5"],
+    "2": ["3", "4"],
+    "3": ["2", "4"],
+    "4": ["3", "2"],
+}
+
+
+def find_root(parents: MutableSequence[int], node_id: int) -> int:
+    """Returns the root of a node id in a parent array, roots being
+    their own parent, halving the path on the way up. Shared by every
+    array-based union-find in the package."""
+    while parents[node_id] != node_id:
+        parents[node_id] = parents[parents[node_id]]
+        node_id = parents[node_id]
+    return node_id
+
+
+class UnionFind:
+    """Incremental connectivity over a stream of undirected edges,
+    using union by rank and path halving. Every operation runs
+    in near-constant amortized time."""
+
+    def __init__(self) -> None:
+        self.index: Dict[str, int] = dict()
+        self._parents: "array[int]" = array("i")
+        self._ranks: bytearray = bytearray()
+        self._sizes: "array[int]" = array("i")
+        self._count: int = 0
+        self._largest: int = 0
+
+    @classmethod
+    def from_adjacency(cls, graph: Dict[str, List[str]]) -> "UnionFind":
+        """Builds the structure from a Dict[str, List[str]] adjacency
+        list, nodes without edges count as their own component."""
+        union_find: UnionFind = cls()
+        for node, neighbors in graph.items():
+            union_find.add_node(node)
+            for neighbor in neighbors:
+                union_find.add_edge(node, neighbor)
+        return union_find
+
+    def add_node(self, node: str) -> int:
+        """Adds a node as its own component if it is not known yet
+        and returns its id."""
+        node_id: int = self.index.get(node, -1)
+        if node_id == -1:
+            node_id = len(self._parents)
+            self.index[node] = node_id
+            self._parents.append(node_id)
+            self._ranks.append(0)
+            self._sizes.append(1)
+            self._count += 1
+            if self._largest == 0:
+                self._largest = 1
+        return node_id
+
+    def add_edge(self, node_a: str, node_b: str) -> None:
+        """Adds an undirected edge, merging the components of both
+        nodes."""
+        root_a: int = self._find(self.add_node(node_a))
+        root_b: int = self._find(self.add_node(node_b))
+        if root_a == root_b:
+            return
+        ranks: bytearray = self._ranks
+        if ranks[root_a] < ranks[root_b]:
+            root_a, root_b = root_b, root_a
+        self._parents[root_b] = root_a
+        if ranks[root_a] == ranks[root_b]:
+            ranks[root_a] += 1
+        self._sizes[root_a] += self._sizes[root_b]
+        self._count -= 1
+        if self._sizes[root_a] > self._largest:
+            self._largest = self._sizes[root_a]
+
+    def _find(self, node_id: int) -> int:
+        """Returns the root of a node id, halving the path on the way
+        up."""
+        return find_root(self._parents, node_id)
+
+    def same_component(self, node_a: str, node_b: str) -> bool:
+        """Returns True if node_a and node_b are connected."""
+        if node_a == node_b:
+            return True
+        index: Dict[str, int] = self.index
+        if node_a not in index or node_b not in index:
+            return False
+        return self._find(index[node_a]) == self._find(index[node_b])
+
+    def component_size(self, node: str) -> int:
+        """Returns the number of nodes in the component of a node."""
+        return self._sizes[self._find(self.index[node])]
+
+    def component_count(self) -> int:
+        """Returns the number of connected components."""
+        return self._count
+
+    def largest_component_size(self) -> int:
+        """Returns the number of nodes in the largest component."""
+        return self._largest
+
+
+# TESTS, run with python -m graph_algos.union_find
+if __name__ == "__main__":
+    TEST_UNION_FIND: UnionFind = UnionFind.from_adjacency(GRAPH)
+    assert TEST_UNION_FIND.component_count() == 2
+    assert TEST_UNION_FIND.largest_component_size() == 4
+    assert TEST_UNION_FIND.same_component("1", "8")
+    assert TEST_UNION_FIND.same_component("1", "4") is False
+    assert TEST_UNION_FIND.component_size("3") == 3
+
+    TEST_UNION_FIND.add_edge("5", "3")
+    assert TEST_UNION_FIND.component_count() == 1
+    assert TEST_UNION_FIND.largest_component_size() == 7
+    assert TEST_UNION_FIND.same_component("1", "4")
+
+    TEST_UNION_FIND.add_node("9")
+    assert TEST_UNION_FIND.component_count() == 2
+    assert TEST_UNION_FIND.component_size("9") == 1
+
+    TEST_STREAM: UnionFind = UnionFind()
+    assert TEST_STREAM.component_count() == 0
+    assert TEST_STREAM.largest_component_size() == 0
+    TEST_PARENTS: List[int] = [0, 0, 1, 2, 4]
+    assert find_root(TEST_PARENTS, 3) == 0
+    assert TEST_PARENTS == [0, 0, 1, 1, 4]
+    assert find_root(TEST_PARENTS, 4) == 4
@@ -0,0 +1,295 @@
+"""weighted_path.py"""
+import heapq
+import math
+from array import array
+from typing import (Callable, Dict, Iterable, List, NamedTuple, Optional,
+                    Sequence, Tuple)
+from graph_algos.csr_graph import CSRGraph
+
+# Our weighted undirected graph structure to play with
+"""
+┌───┐  1  ┌───┐  1  ┌───┐
+│   │     │   │     │   │
+│ w ├─────┤ x ├─────┤ y │
+│   │     │   │     │   │
+└─┬─┘     └───┘     └─┬─┘
+  │                   │
+  │ 4                 │ 1
+  │                   │
+  │       ┌───┐  2  ┌─┴─┐
+  │       │   │     │   │
+  └───────┤ v ├─────┤ z │
+          │   │     │   │
+          └───┘     └───┘
+
+Fewest edges from w to z: w v z, cost 6
+Cheapest path from w to z: w x y z, cost 3
+"""
+
+# Edge list, the optional third column is the edge weight
+EDGES: List[List[str]] = [
+    ["w", "x", "1"],
+    ["x", "y", "1"],
+    ["z", "y", "1"],
+    ["z", "v", "2"],
+    ["w", "v", "4"],
+]
+
+# Convert to weighted adjacency list, used to test against
+GRAPH: Dict[str, List[Tuple[str, float]]] = {
+    "w": [("x", 1.0), ("v", 4.0)],
+    "x": [("w", 1.0), ("y", 1.0)],
+    "y": [("x", 1.0), ("z", 1.0)],
+    "z": [("y", 1.0), ("v", 2.0)],
+    "v": [("z", 2.0), ("w", 4.0)],
+}
+
+# Lower bound on the cost from a node id to the target id
+Heuristic = Callable[[int, int], float]
+
+
+class WeightedPath(NamedTuple):
+    """Cost of a cheapest path and its nodes, -1.0 and an empty list
+    if components are not connected."""
+    cost: float
+    nodes: List[str]
+
+
+def _weight(edge: Sequence[str]) -> float:
+    """Helper function reading the weight column of an edge, edges
+    without one weigh 1."""
+    weight: float = float(edge[2]) if len(edge) > 2 else 1.0
+    if weight < 0 or math.isnan(weight):
+        raise ValueError("Edge {} weight is not a non-negative number".format(
+            list(edge)))
+    return weight
+
+
+# Helper function
+def _build_weighted_graph(
+        edges: Iterable[Sequence[str]]) -> Dict[str, List[Tuple[str, float]]]:
+    """Helper function to build weighted undirected graph from edges."""
+    graph: Dict[str, List[Tuple[str, float]]] = dict()
+    for edge in edges:
+        _a, _b = edge[0], edge[1]
+        weight: float = _weight(edge)
+        if _a not in graph:
+            graph[_a] = list()
+        if _b not in graph:
+            graph[_b] = list()
+        graph[_a].append((_b, weight))
+        graph[_b].append((_a, weight))
+    return graph
+
+
+class WeightedGraph:
+    """CSR graph with a float64 weight per stored edge, the weight of
+    neighbors[i] being weights[i], so the heap searches below read
+    flat arrays instead of per-node lists of tuples."""
+
+    __slots__ = ("graph", "weights")
+
+    def __init__(self, graph: CSRGraph, weights: "array[float]") -> None:
+        self.graph: CSRGraph = graph
+        self.weights: "array[float]" = weights
+
+    @classmethod
+    def from_edges(cls, edges: Iterable[Sequence[str]]) -> "WeightedGraph":
+        """Builds a weighted undirected graph from an edge list of
+        [a, b] or [a, b, weight] rows. Node ids and neighbor order
+        match CSRGraph.from_edges on the same edges."""
+        labels: List[str] = list()
+        index: Dict[str, int] = dict()
+        sources: "array[int]" = array("i")
+        targets: "array[int]" = array("i")
+        edge_weights: "array[float]" = array("d")
+        for edge in edges:
+            for label in (edge[0], edge[1]):
+                if label not in index:
+                    index[label] = len(labels)
+                    labels.append(label)
+            sources.append(index[edge[0]])
+            targets.append(index[edge[1]])
+            edge_weights.append(_weight(edge))
+        graph: CSRGraph = CSRGraph.from_id_pairs(labels, sources, targets,
+                                                 index=index)
+
+        # Scatter the weights with the same cursors from_id_pairs uses
+        weights: "array[float]" = array("d", bytes(8 * len(graph.neighbors)))
+        cursor: "array[int]" = array("i", graph.offsets[:-1])
+        for _a_id, _b_id, weight in zip(sources, targets, edge_weights):
+            weights[cursor[_a_id]] = weight
+            cursor[_a_id] += 1
+            weights[cursor[_b_id]] = weight
+            cursor[_b_id] += 1
+        return cls(graph, weights)
+
+    def to_adjacency(self) -> Dict[str, List[Tuple[str, float]]]:
+        """Converts back to a weighted adjacency list."""
+        labels: Sequence[str] = self.graph.labels
+        offsets = self.graph.offsets
+        neighbors = self.graph.neighbors
+        return {
+            labels[node_id]: [(labels[neighbors[i]], self.weights[i])
+                              for i in range(offsets[node_id],
+                                             offsets[node_id + 1])]
+            for node_id in range(len(labels))
+        }
+
+
+# Dijkstra cost over the adjacency list
+def dijkstra_cost(graph: Dict[str, List[Tuple[str, float]]], src: str,
+                  dst: str) -> float:
+    """Dijkstra's algo with a binary heap. Stale heap entries are
+    skipped when popped instead of being removed. Returns the cost
+    of the cheapest path between two nodes, or -1.0 if components
+    are not connected."""
+    costs: Dict[str, float] = {src: 0.0}
+    heap: List[Tuple[float, str]] = [(0.0, src)]
+    while heap:
+        cost, current = heapq.heappop(heap)
+        if current == dst:
+            return cost
+        if cost > costs[current]:
+            continue
+        for neighbor, weight in graph[current]:
+            if neighbor not in costs or cost + weight < costs[neighbor]:
+                costs[neighbor] = cost + weight
+                heapq.heappush(heap, (cost + weight, neighbor))
+    return -1.0
+
+
+# Dijkstra and A* over the weighted CSR graph
+def _heap_search(weighted: WeightedGraph, src: int, dst: int,
+                 heuristic: Optional[Heuristic]) -> WeightedPath:
+    """Helper function running Dijkstra's algo, or A* when given a
+    heuristic, from src until dst is popped off the heap. Costs and
+    parents are kept in flat arrays indexed by node id and stale heap
+    entries are skipped when popped."""
+    graph: CSRGraph = weighted.graph
+    offsets = graph.offsets
+    neighbors = graph.neighbors
+    weights: "array[float]" = weighted.weights
+    costs: "array[float]" = array("d", [math.inf]) * graph.node_count()
+    parents: "array[int]" = array("i", [-1]) * graph.node_count()
+    costs[src] = 0.0
+    # Entries are (priority, cost when pushed, node id), the priority
+    # being the cost plus the heuristic for A*
+    heap: List[Tuple[float, float, int]] = [(0.0, 0.0, src)]
+    while heap:
+        _, cost, current = heapq.heappop(heap)
+        if cost > costs[current]:
+            continue
+        if current == dst:
+            path: List[int] = [dst]
+            while path[-1] != src:
+                path.append(parents[path[-1]])
+            path.reverse()
+            return WeightedPath(cost, [graph.labels[i] for i in path])
+        for i in range(offsets[current], offsets[current + 1]):
+            neighbor: int = neighbors[i]
+            next_cost: float = cost + weights[i]
+            if next_cost < costs[neighbor]:
+                costs[neighbor] = next_cost
+                parents[neighbor] = current
+                priority: float = next_cost
+                if heuristic is not None:
+                    priority += heuristic(neighbor, dst)
+                heapq.heappush(heap, (priority, next_cost, neighbor))
+    return WeightedPath(-1.0, list())
+
+
+def dijkstra_path(weighted: WeightedGraph, node_a: str,
+                  node_b: str) -> WeightedPath:
+    """Returns the cost and nodes of a cheapest path between two
+    nodes, stopping as soon as node_b is settled."""
+    index = weighted.graph.index
+    return _heap_search(weighted, index[node_a], index[node_b], None)
+
+
+def a_star_path(weighted: WeightedGraph, node_a: str, node_b: str,
+                heuristic: Heuristic) -> WeightedPath:
+    """Returns the cost and nodes of a cheapest path between two
+    nodes, the heap ordered by cost so far plus heuristic(node id,
+    target id). The path is a cheapest one as long as the heuristic
+    never overestimates the remaining cost, and fewer nodes are
+    settled than by dijkstra_path the closer it gets to it."""
+    index = weighted.graph.index
+    return _heap_search(weighted, index[node_a], index[node_b], heuristic)
+
+
+def euclidean_heuristic(
+        coordinates: Sequence[Tuple[float, float]]) -> Heuristic:
+    """Returns a heuristic giving the straight line distance between
+    the (x, y) coordinates of two node ids, a lower bound whenever no
+    edge weighs less than the distance between its ends."""
+
+    def heuristic(node_id: int, target_id: int) -> float:
+        """Straight line distance from node_id to target_id."""
+        x_a, y_a = coordinates[node_id]
+        x_b, y_b = coordinates[target_id]
+        return math.hypot(x_a - x_b, y_a - y_b)
+
+    return heuristic
+
+
+def weighted_shortest_path(edges: List[List[str]], node_a: str,
+                           node_b: str) -> float:
+    """Takes in a weighted edge list, runs Dijkstra's algo over it
+    and returns the cost of the cheapest path from the source node to
+    the destination node, or -1.0 if components are not connected."""
+    graph: Dict[str, List[Tuple[str, float]]] = _build_weighted_graph(edges)
+    return dijkstra_cost(graph, node_a, node_b)
+
+
+def weighted_shortest_node_path(edges: List[List[str]], node_a: str,
+                                node_b: str) -> List[str]:
+    """Takes in a weighted edge list and returns the nodes on the
+    cheapest path from the source node to the destination node, or
+    an empty list if components are not connected."""
+    weighted: WeightedGraph = WeightedGraph.from_edges(edges)
+    return dijkstra_path(weighted, node_a, node_b).nodes
+
+
+# TESTS, run with python -m graph_algos.weighted_path
+if __name__ == "__main__":
+    from graph_algos.shortest_path import breadth_first_shortest_path
+
+    assert _build_weighted_graph(EDGES) == GRAPH
+    assert WeightedGraph.from_edges(EDGES).to_adjacency() == GRAPH
+    assert WeightedGraph.from_edges(
+        EDGES).graph.neighbors == CSRGraph.from_edges(
+            [edge[:2] for edge in EDGES]).neighbors
+    assert breadth_first_shortest_path(EDGES, "w", "z") == 2
+    assert weighted_shortest_path(EDGES, "w", "z") == 3.0
+    assert weighted_shortest_path(EDGES, "w", "w") == 0.0
+    assert weighted_shortest_path(EDGES + [["a", "b"]], "w", "a") == -1.0
+    assert weighted_shortest_node_path(EDGES, "w", "z") == [
+        "w", "x", "y", "z"
+    ]
+    assert weighted_shortest_node_path(EDGES, "v", "x") == ["v", "z", "y", "x"]
+
+    TEST_WEIGHTED: WeightedGraph = WeightedGraph.from_edges(
+        EDGES + [["a", "b", "0.5"]])
+    assert dijkstra_path(TEST_WEIGHTED, "w", "v") == WeightedPath(
+        4.0, ["w", "v"])
+    assert dijkstra_path(TEST_WEIGHTED, "w", "a") == WeightedPath(-1.0, [])
+
+    # w x y z v a b laid out so every edge is at least as long as
+    # the straight line between its ends
+    TEST_COORDINATES: List[Tuple[float, float]] = [(0, 0), (1, 0), (2, 0),
+                                                   (2, 1), (0, 1), (5, 5),
+                                                   (5, 5.5)]
+    TEST_HEURISTIC: Heuristic = euclidean_heuristic(TEST_COORDINATES)
+    for TEST_A in "wxyzv":
+        for TEST_B in "wxyzv":
+            assert a_star_path(TEST_WEIGHTED, TEST_A, TEST_B,
+                               TEST_HEURISTIC) == dijkstra_path(
+                                   TEST_WEIGHTED, TEST_A, TEST_B)
+    assert a_star_path(TEST_WEIGHTED, "a", "b",
+                       lambda a, b: 0.0) == WeightedPath(0.5, ["a", "b"])
+    try:
+        WeightedGraph.from_edges([["a", "b", "-1"]])
+        assert False
+    except ValueError:
+        pass